@@ -0,0 +1,209 @@
+"""
+크롤링 작업 수락 제어 (Admission Control)
+동시에 실행되는 크롤링 개수를 제한하고, 대기열을 클라이언트별로 공정하게 처리합니다.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Dict
+
+
+class OverloadedError(Exception):
+    """대기열이 가득 찼거나 대기 시간이 초과되었을 때 발생하는 예외"""
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class _Waiter:
+    """대기열에서 순서를 기다리는 요청 하나"""
+
+    __slots__ = ("client_id", "granted")
+
+    def __init__(self, client_id: str):
+        self.client_id = client_id
+        self.granted = False
+
+
+class AdmissionController:
+    """
+    동시 크롤링 개수를 제한하는 대기열 클래스
+
+    실행 슬롯이 모두 사용 중이면 요청은 클라이언트별 대기열에 들어가고,
+    슬롯이 비면 클라이언트를 돌아가며(round-robin) 한 건씩 실행합니다.
+    한 클라이언트가 요청을 몰아 보내도 다른 클라이언트가 굶지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_concurrent: int = 4,
+        max_queue: int = 32,
+        max_queue_per_client: int = 8,
+        queue_timeout: float = 30,
+    ):
+        """
+        Args:
+            max_concurrent: 동시에 실행할 최대 크롤링 개수
+            max_queue: 전체 대기열 최대 길이
+            max_queue_per_client: 클라이언트 하나당 대기열 최대 길이
+            queue_timeout: 대기열에서 기다릴 최대 시간 (초)
+        """
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.max_queue_per_client = max_queue_per_client
+        self.queue_timeout = queue_timeout
+
+        self._cond = threading.Condition()
+        self._queues = OrderedDict()  # client_id -> deque[_Waiter]
+        self._active = 0
+        self._queued = 0
+
+        # 용량 산정을 위한 누적 통계
+        self._avg_service = 1.0
+        self._stats = {
+            "admitted": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "queue_wait_total": 0.0,
+            "service_time_total": 0.0,
+        }
+
+    def acquire(self, client_id: str) -> float:
+        """
+        실행 슬롯을 얻을 때까지 대기합니다.
+
+        Args:
+            client_id: 공정한 스케줄링에 사용할 클라이언트 식별자
+
+        Returns:
+            대기열에서 기다린 시간 (초)
+
+        Raises:
+            OverloadedError: 대기열이 가득 찼거나 대기 시간이 초과된 경우
+        """
+        start = time.monotonic()
+
+        with self._cond:
+            # 빈 슬롯이 있고 기다리는 요청이 없으면 바로 실행
+            if self._active < self.max_concurrent and self._queued == 0:
+                self._active += 1
+                self._stats["admitted"] += 1
+                return 0.0
+
+            queue = self._queues.get(client_id)
+            if self._queued >= self.max_queue or (
+                queue is not None and len(queue) >= self.max_queue_per_client
+            ):
+                self._stats["rejected"] += 1
+                raise OverloadedError(
+                    "요청이 많아 잠시 후 다시 시도해주세요.", self._retry_after()
+                )
+
+            waiter = _Waiter(client_id)
+            if queue is None:
+                queue = self._queues[client_id] = deque()
+            queue.append(waiter)
+            self._queued += 1
+
+            deadline = start + self.queue_timeout
+            while not waiter.granted:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._remove_waiter(waiter)
+                    self._stats["timed_out"] += 1
+                    raise OverloadedError(
+                        "대기 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.",
+                        self._retry_after(),
+                    )
+                self._cond.wait(remaining)
+
+            queue_wait = time.monotonic() - start
+            self._stats["admitted"] += 1
+            self._stats["queue_wait_total"] += queue_wait
+            return queue_wait
+
+    def release(self, service_time: float = None):
+        """
+        실행 슬롯을 반납하고 다음 대기 요청을 실행합니다.
+
+        Args:
+            service_time: 방금 끝난 작업의 실행 시간 (초)
+        """
+        with self._cond:
+            self._active -= 1
+            if service_time is not None:
+                self._stats["service_time_total"] += service_time
+                # 지수 이동 평균으로 Retry-After 추정에 사용
+                self._avg_service = 0.8 * self._avg_service + 0.2 * service_time
+            self._dispatch()
+
+    @contextmanager
+    def admit(self, client_id: str):
+        """
+        슬롯을 얻고 작업이 끝나면 반납하는 컨텍스트 매니저
+
+        Yields:
+            대기 시간(queue_wait)과 실행 시간(service_time)이 기록되는 딕셔너리
+        """
+        timing = {"queue_wait": self.acquire(client_id), "service_time": 0.0}
+        start = time.monotonic()
+        try:
+            yield timing
+        finally:
+            timing["service_time"] = time.monotonic() - start
+            self.release(timing["service_time"])
+
+    def snapshot(self) -> Dict:
+        """현재 대기열 상태와 누적 통계를 반환합니다."""
+        with self._cond:
+            admitted = self._stats["admitted"]
+            return {
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "active": self._active,
+                "queued": self._queued,
+                "waiting_clients": len(self._queues),
+                "admitted": admitted,
+                "rejected": self._stats["rejected"],
+                "timed_out": self._stats["timed_out"],
+                "avg_queue_wait": self._stats["queue_wait_total"] / admitted
+                if admitted
+                else 0.0,
+                "avg_service_time": self._stats["service_time_total"] / admitted
+                if admitted
+                else 0.0,
+            }
+
+    def _dispatch(self):
+        """빈 슬롯만큼 클라이언트를 돌아가며 대기 요청을 깨웁니다. (잠금 상태에서 호출)"""
+        woke = False
+        while self._active < self.max_concurrent and self._queued:
+            client_id, queue = self._queues.popitem(last=False)
+            waiter = queue.popleft()
+            if queue:
+                # 남은 요청이 있으면 순서의 맨 뒤로 보냄
+                self._queues[client_id] = queue
+            waiter.granted = True
+            self._active += 1
+            self._queued -= 1
+            woke = True
+        if woke:
+            self._cond.notify_all()
+
+    def _remove_waiter(self, waiter: _Waiter):
+        """시간 초과된 요청을 대기열에서 제거합니다. (잠금 상태에서 호출)"""
+        queue = self._queues.get(waiter.client_id)
+        if queue is not None and waiter in queue:
+            queue.remove(waiter)
+            self._queued -= 1
+            if not queue:
+                del self._queues[waiter.client_id]
+
+    def _retry_after(self) -> int:
+        """대기열이 비워질 때까지의 예상 시간 (초)"""
+        backlog = (self._queued + self._active) / max(self.max_concurrent, 1)
+        return max(1, math.ceil(self._avg_service * backlog))
@@ -0,0 +1,135 @@
+"""
+API 응답 직렬화 및 압축
+- JSON: orjson이 설치되어 있으면 사용하고 NumPy 배열을 리스트 변환 없이 바로 직렬화합니다
+  (없으면 표준 json 모듈로 대체).
+- 압축: Accept-Encoding에 따라 brotli(설치된 경우) 또는 gzip으로 응답 본문을 압축합니다.
+"""
+
+import gzip
+import json
+from typing import Optional
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+# 이보다 작은 본문은 압축 이득보다 CPU 비용이 커서 압축하지 않음
+MIN_COMPRESS_SIZE = 1024
+GZIP_LEVEL = 5
+BROTLI_QUALITY = 4
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/",
+    "application/javascript",
+)
+
+if orjson is not None:
+    _ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(value):
+    """표준 json 모듈용 NumPy 변환 함수"""
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f"JSON으로 변환할 수 없는 값: {type(value).__name__}")
+
+
+def dumps(data) -> bytes:
+    """
+    데이터를 UTF-8 JSON 바이트로 직렬화합니다 (공백 없음, 한글 그대로).
+
+    Args:
+        data: dict/list 등 (NumPy 배열과 스칼라 포함 가능)
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=_ORJSON_OPTIONS)
+        except TypeError:
+            # orjson이 직접 지원하지 않는 배열 (예: 비연속 메모리, 바이트 순서가 다른 dtype)
+            pass
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_default).encode(
+        "utf-8"
+    )
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Accept-Encoding 헤더에서 사용할 압축 방식을 고릅니다 (q 값이 0인 방식은 제외).
+
+    Returns:
+        "br", "gzip" 또는 None (압축하지 않음)
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+
+    wildcard = accepted.get("*", 0.0)
+    candidates = []
+    if brotli is not None:
+        candidates.append("br")
+    candidates.append("gzip")
+
+    best, best_q = None, 0.0
+    for name in candidates:
+        q = accepted.get(name, wildcard)
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문을 지정한 방식으로 압축합니다."""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def compress_response(response, accept_encoding: Optional[str]):
+    """
+    Flask 응답을 협상된 방식으로 압축합니다 (after_request 훅에서 호출).
+    스트리밍 응답, 이미 인코딩된 응답, 작은 응답, 압축 대상이 아닌 형식은 그대로 둡니다.
+    """
+    if response.direct_passthrough or response.is_streamed:
+        return response
+    if response.status_code < 200 or response.status_code in (204, 304):
+        return response
+    if "Content-Encoding" in response.headers:
+        return response
+    if not (response.mimetype or "").startswith(COMPRESSIBLE_TYPES):
+        return response
+
+    response.vary.add("Accept-Encoding")
+    encoding = choose_encoding(accept_encoding)
+    if encoding is None:
+        return response
+
+    body = response.get_data()
+    if len(body) < MIN_COMPRESS_SIZE:
+        return response
+
+    response.set_data(compress(body, encoding))
+    response.headers["Content-Encoding"] = encoding
+    return response
@@ -3,14 +3,37 @@ Flask 웹 대시보드 - 상품 가격 분석 시스템
 브라우저에서 실행되는 웹 인터페이스
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import (
+    Flask,
+    render_template,
+    request,
+    jsonify,
+    Response,
+    stream_with_context,
+    g,
+    send_file,
+)
 from flask_cors import CORS
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import sys
 import os
+import time
+from urllib.parse import quote
 
 # 프로젝트 모듈 import
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-from price_analyzer_cli import PriceScraper, DataAnalyzer, Visualizer
+from price_engine import PriceScraper, DataAnalyzer, Visualizer, PricePipeline, build_sources
+from result_cache import ResultCache
+from shared_cache import SharedCache
+from admission import AdmissionController, OverloadedError
+import metrics
+from metrics import stage_timer
+from profiling import RequestProfiler
+from snapshot_store import SnapshotStore
+from result_files import ResultFileIndex
+from warmup import Warmup
+import api_encoding
+import history_export
 
 app = Flask(__name__)
 CORS(app)  # CORS 설정
@@ -20,6 +43,305 @@ scraper = PriceScraper()
 analyzer = DataAnalyzer()
 visualizer = Visualizer()
 
+# 검색 결과 스냅샷 저장소 (히스토리/추세 조회용)
+store = SnapshotStore(os.environ.get("SNAPSHOT_DB", "snapshots.db"))
+# 자동 저장된 결과 파일 요약 (최근 결과 목록용, 바뀐 파일만 다시 읽음)
+result_files = ResultFileIndex(analyzer.load_results)
+
+# 일괄 검색 설정
+BATCH_MAX_KEYWORDS = 50
+# /api/load 가격 목록 페이지 크기
+LOAD_PAGE_DEFAULT = 200
+LOAD_PAGE_MAX = 5000
+# /api/compare 한 번에 비교할 최대 키워드 수
+COMPARE_MAX_KEYWORDS = 8
+# /api/history 최근 결과 개수
+HISTORY_RECENT_LIMIT = 10
+# 시작 시 예열할 인기 키워드 수 (스냅샷이 많은 순)
+WARMUP_TOP_KEYWORDS = int(os.environ.get("WARMUP_TOP_KEYWORDS", "50"))
+BATCH_MAX_WORKERS = int(os.environ.get("BATCH_MAX_WORKERS", "4"))
+CACHE_TTL_SECONDS = int(os.environ.get("CACHE_TTL_SECONDS", "300"))
+
+# 모든 일괄 검색 요청이 공유하는 작업 풀 (동시 크롤링 개수 제한)
+batch_executor = ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS)
+# 검색 결과 캐시: SHARED_CACHE_DB가 설정되어 있으면(serve.py 작업 프로세스) 모든 프로세스가 파일 하나로 공유
+SHARED_CACHE_DB = os.environ.get("SHARED_CACHE_DB")
+if SHARED_CACHE_DB:
+    result_cache = SharedCache(SHARED_CACHE_DB, ttl=CACHE_TTL_SECONDS)
+    # 조건부 요청용 응답 검증값도 공유하여 한 프로세스가 받은 ETag를 다른 프로세스도 사용
+    scraper.response_cache = SharedCache(SHARED_CACHE_DB, ttl=None, name="validators")
+else:
+    result_cache = ResultCache(ttl=CACHE_TTL_SECONDS)
+
+# 크롤링 수락 제어 (동시 크롤링 개수 및 대기열 길이 제한)
+admission = AdmissionController(
+    max_concurrent=int(os.environ.get("SCRAPE_MAX_CONCURRENT", "4")),
+    max_queue=int(os.environ.get("SCRAPE_MAX_QUEUE", "32")),
+    max_queue_per_client=int(os.environ.get("SCRAPE_MAX_QUEUE_PER_CLIENT", "8")),
+    queue_timeout=float(os.environ.get("SCRAPE_QUEUE_TIMEOUT", "30")),
+)
+# 요청 단위 프로파일링 (X-Profile 헤더, ?profile=1 또는 샘플링 비율로 활성화)
+profiler = RequestProfiler(
+    directory=os.environ.get("PROFILE_DIR", "profiles"),
+    sample_rate=float(os.environ.get("PROFILE_SAMPLE_RATE", "0")),
+    max_files=int(os.environ.get("PROFILE_MAX_FILES", "50")),
+    token=os.environ.get("PROFILE_TOKEN") or None,
+)
+
+# HTTP 요청 지표
+HTTP_LATENCY = metrics.Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by endpoint.",
+    ["endpoint", "method"],
+)
+HTTP_REQUESTS = metrics.Counter(
+    "http_requests_total",
+    "HTTP requests by endpoint and status code.",
+    ["endpoint", "method", "status"],
+)
+HTTP_IN_FLIGHT = metrics.Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being handled.",
+)
+SCRAPE_ACTIVE = metrics.Gauge(
+    "scrape_admission_active",
+    "Scrapes currently holding an admission slot.",
+)
+SCRAPE_QUEUED = metrics.Gauge(
+    "scrape_admission_queued",
+    "Scrapes waiting in the admission queue.",
+)
+SCRAPE_QUEUE_WAIT = metrics.Histogram(
+    "scrape_admission_queue_wait_seconds",
+    "Time scrapes spent waiting in the admission queue.",
+)
+SCRAPE_SERVICE_TIME = metrics.Histogram(
+    "scrape_admission_service_seconds",
+    "Time scrapes spent running after admission.",
+)
+WARMUP_READY = metrics.Gauge(
+    "warmup_ready",
+    "Whether the startup warm-up has finished (1) or is still running (0).",
+)
+SCRAPE_ACTIVE.set_function(lambda: admission.snapshot()["active"])
+SCRAPE_QUEUED.set_function(lambda: admission.snapshot()["queued"])
+
+
+@app.after_request
+def _compress_response(response):
+    # 가장 먼저 등록하여 다른 after_request 훅이 끝난 뒤 마지막으로 실행
+    return api_encoding.compress_response(response, request.headers.get("Accept-Encoding"))
+
+
+@app.before_request
+def _start_request_timer():
+    g.request_start = time.perf_counter()
+    HTTP_IN_FLIGHT.labels().inc()
+
+
+@app.before_request
+def _start_profiling():
+    if request.path.startswith("/admin/"):
+        return
+    if profiler.should_profile(request.headers, request.args, request.remote_addr):
+        # 플래그로 요청한 경우에만 메모리 측정 허용 (샘플링된 요청은 cProfile만)
+        requested = request.headers.get("X-Profile") or request.args.get("profile")
+        g.profile_session = profiler.start(
+            memory=bool(requested) and profiler.wants_memory(request.headers, request.args)
+        )
+
+
+@app.after_request
+def _stop_profiling(response):
+    session = g.pop("profile_session", None)
+    if session is not None:
+        name = profiler.stop(session, f"{request.method} {request.path}")
+        response.headers["X-Profile-Id"] = name
+    return response
+
+
+@app.teardown_request
+def _discard_profiling(error=None):
+    # 처리되지 않은 예외로 after_request가 실행되지 않은 경우에도 프로파일러를 정리
+    session = g.pop("profile_session", None)
+    if session is not None:
+        profiler.stop(session, f"{request.method} {request.path} error")
+
+
+@app.after_request
+def _record_response_status(response):
+    g.response_status = response.status_code
+    return response
+
+
+@app.teardown_request
+def _record_request_metrics(error=None):
+    # after_request와 달리 처리되지 않은 예외가 나도 실행되므로 처리 중 요청 수가 어긋나지 않으며,
+    # 모든 after_request 훅(응답 압축 포함) 뒤에 실행되므로 압축 시간도 응답 시간에 포함됨
+    # (stream_with_context 스트리밍 응답은 본문을 다 보낸 뒤 실행)
+    start = g.pop("request_start", None)
+    if start is None:
+        return
+    HTTP_IN_FLIGHT.labels().dec()
+    # 파일명 등 변수 대신 라우트 규칙을 레이블로 사용 (레이블 개수 제한)
+    endpoint = request.url_rule.rule if request.url_rule else "unmatched"
+    HTTP_LATENCY.labels(endpoint, request.method).observe(time.perf_counter() - start)
+    # 응답을 만들지 못하고 예외로 끝난 요청은 500으로 집계
+    status = g.pop("response_status", None) if error is None else 500
+    HTTP_REQUESTS.labels(endpoint, request.method, status or 500).inc()
+
+
+def json_response(payload, status=200):
+    """빠른 JSON 직렬화(NumPy 배열 포함)로 응답을 만듭니다."""
+    return Response(api_encoding.dumps(payload), status=status, mimetype="application/json")
+
+
+def get_client_id():
+    """공정한 스케줄링에 사용할 클라이언트 식별자를 반환합니다."""
+    return request.headers.get("X-Client-Id") or request.remote_addr or "unknown"
+
+
+def format_timing(timing):
+    """대기 시간과 실행 시간을 밀리초 단위로 변환합니다."""
+    return {
+        "queue_wait_ms": round(timing["queue_wait"] * 1000, 1),
+        "service_ms": round(timing["service_time"] * 1000, 1),
+    }
+
+
+def overloaded_response(error):
+    """과부하 시 429 응답과 Retry-After 헤더를 반환합니다."""
+    response = jsonify(
+        {"success": False, "error": str(error), "retry_after": error.retry_after}
+    )
+    response.status_code = 429
+    response.headers["Retry-After"] = str(error.retry_after)
+    return response
+
+
+def format_stats(stats):
+    """calculate_statistics() 결과를 API 응답용 통계(평균 반올림, 가격 범위 포함)로 만듭니다."""
+    return {
+        "count": stats["count"],
+        "average": round(stats["average"], 0),
+        "max": stats["max"],
+        "min": stats["min"],
+        "range": stats["max"] - stats["min"],
+    }
+
+
+def build_histogram(prices):
+    """
+    가격 리스트로 히스토그램 데이터(20개 구간)를 생성합니다.
+
+    Returns:
+        {"edges": 구간 경계 21개, "values": 구간별 개수 20개} (NumPy 배열, 표시 형식은 브라우저에서 처리)
+    """
+    import numpy as np
+
+    with stage_timer("histogram"):
+        hist, bin_edges = np.histogram(prices, bins=20)
+    return {"edges": bin_edges, "values": hist}
+
+
+def analyze_keyword(keyword, client_id="local"):
+    """
+    키워드 하나를 수집, 분석, 자동 저장하고 API 응답용 결과를 만듭니다.
+    크롤링은 수락 제어 대기열을 거쳐 실행됩니다.
+
+    Returns:
+        (결과 딕셔너리 또는 None, 대기/실행 시간 딕셔너리)
+
+    Raises:
+        OverloadedError: 대기열이 가득 찬 경우
+    """
+    with admission.admit(client_id) as timing:
+        result = _analyze_keyword(keyword)
+    SCRAPE_QUEUE_WAIT.observe(timing["queue_wait"])
+    SCRAPE_SERVICE_TIME.observe(timing["service_time"])
+    return result, timing
+
+
+def _render_histogram(context):
+    """파이프라인 render 단계: 차트용 히스토그램 데이터를 만듭니다."""
+    context["chart"] = build_histogram(context["prices"])
+
+
+# 수집 → 분석 → 자동 저장(pickle + 스냅샷 저장소) → 히스토그램
+# PRICE_SOURCES가 설정되어 있으면 여러 소스에 동시에 검색하여 합침 (예: "danawa,shop=http://...")
+pipeline = PricePipeline(
+    scraper=scraper,
+    analyzer=analyzer,
+    store=store,
+    save_pickle=True,
+    render=_render_histogram,
+    sources=build_sources(danawa_scraper=scraper),
+)
+
+
+def _analyze_keyword(keyword):
+    """수집, 분석, 자동 저장을 수행합니다 (수락 제어 슬롯 안에서 호출)."""
+    context = pipeline.run(keyword)
+    prices = context["prices"]
+
+    if not prices:
+        return None
+
+    print(f"검색 결과 자동 저장: {context['saved_filename']}")
+
+    result = {
+        "keyword": keyword,
+        "stats": format_stats(context["statistics"]),
+        "prices": prices[:50],  # 상위 50개
+        "histogram": context["chart"],
+        "saved_filename": context["saved_filename"],  # 저장된 파일명 추가
+        "snapshot_id": context.get("snapshot_id"),
+    }
+    if "sources" in context:
+        result["sources"] = context["sources"]
+    return result
+
+
+def batch_search_one(keyword, client_id):
+    """
+    일괄 검색의 키워드 하나를 처리합니다.
+    신선한 캐시가 있거나 다른 요청(공유 캐시면 다른 작업 프로세스 포함)이 같은 키워드를 수집 중이면 그 결과를 재사용합니다.
+    """
+    timing = {"queue_wait": 0.0, "service_time": 0.0}
+
+    def compute():
+        result, measured = analyze_keyword(keyword, client_id)
+        timing.update(measured)
+        return result
+
+    try:
+        result, cached = result_cache.get_or_compute(keyword, compute)
+    except OverloadedError as e:
+        return {
+            "success": False,
+            "keyword": keyword,
+            "error": str(e),
+            "retry_after": e.retry_after,
+        }
+    except Exception as e:
+        return {"success": False, "keyword": keyword, "error": f"오류 발생: {str(e)}"}
+
+    if cached:
+        return {"success": True, "cached": True, **result}
+    if result is None:
+        return {
+            "success": False,
+            "keyword": keyword,
+            "error": "수집된 가격 데이터가 없습니다.",
+            "timing": format_timing(timing),
+        }
+    return {
+        "success": True,
+        "cached": False,
+        **result,
+        "timing": format_timing(timing),
+    }
+
 
 @app.route("/")
 def index():
@@ -29,7 +351,11 @@ def index():
 
 @app.route("/api/search", methods=["POST"])
 def search():
-    """가격 검색 API"""
+    """
+    가격 검색 API
+    CACHE_TTL_SECONDS 이내에 수집한 결과(시작 시 예열한 인기 키워드 포함)가 있으면 다시 수집하지 않고 반환합니다.
+    요청에 "refresh": true를 넣으면 캐시를 건너뛰고 새로 수집합니다.
+    """
     try:
         data = request.get_json()
         keyword = data.get("keyword", "").strip()
@@ -40,10 +366,14 @@ def search():
                 400,
             )
 
-        # 가격 수집
-        prices = scraper.scrape_prices(keyword)
+        if not data.get("refresh"):
+            cached = result_cache.get(keyword)
+            if cached is not None:
+                return json_response({"success": True, "cached": True, **cached})
+
+        result, timing = analyze_keyword(keyword, get_client_id())
 
-        if not prices:
+        if result is None:
             return (
                 jsonify(
                     {
@@ -54,74 +384,409 @@ def search():
                 404,
             )
 
-        # 통계 분석
-        stats = analyzer.calculate_statistics(prices)
+        # 새로 수집한 결과는 이후 검색과 일괄 검색이 재사용할 수 있도록 캐시에 저장
+        result_cache.set(keyword, result)
+        response = json_response(
+            {"success": True, "cached": False, **result, "timing": format_timing(timing)}
+        )
+        response.headers["Server-Timing"] = (
+            f"queue;dur={timing['queue_wait'] * 1000:.1f}, "
+            f"service;dur={timing['service_time'] * 1000:.1f}"
+        )
+        return response
 
-        # 히스토그램 데이터 생성 (20개 구간)
-        import numpy as np
+    except OverloadedError as e:
+        return overloaded_response(e)
+    except Exception as e:
+        return jsonify({"success": False, "error": f"오류 발생: {str(e)}"}), 500
 
-        hist, bin_edges = np.histogram(prices, bins=20)
-        histogram_data = {
-            "labels": [f"{int(bin_edges[i]):,}" for i in range(len(bin_edges) - 1)],
-            "values": hist.tolist(),
-        }
 
-        # 검색 결과 자동 저장
-        save_data = {"keyword": keyword, "prices": prices, "statistics": stats}
-        saved_filename = analyzer.save_results(save_data)
-        print(f"검색 결과 자동 저장: {saved_filename}")
+@app.route("/api/search/batch", methods=["POST"])
+def search_batch():
+    """여러 키워드 일괄 검색 API (완료되는 순서대로 NDJSON 스트리밍)"""
+    data = request.get_json(silent=True) or {}
+    keywords = data.get("keywords")
 
-        return jsonify(
+    if not isinstance(keywords, list):
+        return (
+            jsonify({"success": False, "error": "keywords 목록을 입력해주세요."}),
+            400,
+        )
+
+    # 공백 제거 및 중복 제거 (입력 순서 유지)
+    keywords = list(
+        dict.fromkeys(
+            k.strip() for k in keywords if isinstance(k, str) and k.strip()
+        )
+    )
+
+    if not keywords:
+        return (
+            jsonify({"success": False, "error": "검색 키워드를 입력해주세요."}),
+            400,
+        )
+    if len(keywords) > BATCH_MAX_KEYWORDS:
+        return (
+            jsonify(
+                {
+                    "success": False,
+                    "error": f"한 번에 최대 {BATCH_MAX_KEYWORDS}개까지 검색할 수 있습니다.",
+                }
+            ),
+            400,
+        )
+
+    client_id = get_client_id()
+    futures = {
+        batch_executor.submit(batch_search_one, k, client_id): k for k in keywords
+    }
+
+    def generate():
+        for future in as_completed(futures):
+            yield api_encoding.dumps(future.result()) + b"\n"
+
+    return Response(
+        stream_with_context(generate()), mimetype="application/x-ndjson"
+    )
+
+
+@app.route("/api/admission")
+def admission_status():
+    """크롤링 대기열 상태 및 대기/실행 시간 통계 조회"""
+    return jsonify({"success": True, "admission": admission.snapshot()})
+
+
+@app.route("/api/ready")
+def readiness():
+    """
+    준비 상태 확인 (부하 분산기/배포 도구용)
+    시작 시 예열이 끝나면 200, 진행 중이면 503과 Retry-After를 반환합니다.
+    """
+    status = warmup.status()
+    response = jsonify({"success": True, "ready": status["ready"], "warmup": status})
+    if not status["ready"]:
+        response.status_code = 503
+        response.headers["Retry-After"] = "1"
+    return response
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Prometheus 텍스트 형식의 성능 지표"""
+    return Response(
+        metrics.REGISTRY.render(), mimetype="text/plain; version=0.0.4"
+    )
+
+
+def admin_allowed():
+    """프로파일 조회 권한을 확인합니다 (PROFILE_TOKEN이 없으면 같은 서버에서 접속한 경우만)."""
+    token = request.headers.get("X-Profile") or request.args.get("token")
+    return profiler.is_authorized(token, request.headers, request.remote_addr)
+
+
+@app.route("/admin/profiles")
+def list_profiles():
+    """저장된 프로파일 목록 조회"""
+    if not admin_allowed():
+        return jsonify({"success": False, "error": "권한이 없습니다."}), 403
+    return jsonify({"success": True, "profiles": profiler.list_profiles()})
+
+
+@app.route("/admin/profiles/<name>")
+def view_profile(name):
+    """프로파일 요약 리포트 보기 (?download=1이면 cProfile 원본 다운로드)"""
+    if not admin_allowed():
+        return jsonify({"success": False, "error": "권한이 없습니다."}), 403
+
+    if request.args.get("download") == "1":
+        path = profiler.profile_path(name, "prof")
+        if path is None:
+            return jsonify({"success": False, "error": "프로파일을 찾을 수 없습니다."}), 404
+        return send_file(os.path.abspath(path), as_attachment=True)
+
+    path = profiler.profile_path(name, "txt")
+    if path is None:
+        return jsonify({"success": False, "error": "프로파일을 찾을 수 없습니다."}), 404
+    with open(path, encoding="utf-8") as f:
+        return Response(f.read(), mimetype="text/plain")
+
+
+@app.route("/api/history")
+def get_history():
+    """
+    저장된 검색 결과 목록 조회
+
+    Query:
+        q: 지정하면 스냅샷 저장소에서 비슷한 키워드의 과거 검색을 순위대로 조회 (없으면 최근 pickle 결과 10개)
+        page / per_page: q 검색 결과 페이지 (기본 1 / 20, per_page 최대 100)
+    """
+    query = (request.args.get("q") or "").strip()
+    if query:
+        return _search_history(query)
+
+    try:
+        # 파일 목록과 수정 시각만 확인하고, 처음 보거나 바뀐 파일만 읽음 (시작 시 예열로 미리 채움)
+        with stage_timer("load"):
+            history = result_files.recent(HISTORY_RECENT_LIMIT)
+
+        return json_response({"success": True, "history": history})
+
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+def _search_history(query):
+    """키워드 trigram 색인으로 과거 검색(스냅샷)을 찾아 페이지 단위로 반환합니다."""
+    from datetime import datetime
+
+    try:
+        page = max(int(request.args.get("page", 1)), 1)
+        per_page = min(max(int(request.args.get("per_page", 20)), 1), 100)
+    except ValueError:
+        return jsonify({"success": False, "error": "page/per_page는 정수여야 합니다."}), 400
+
+    try:
+        with stage_timer("history_search"):
+            found = store.search_history(query, limit=per_page, offset=(page - 1) * per_page)
+
+        history = [
+            {
+                "snapshot_id": item["id"],
+                "keyword": item["keyword"],
+                "date": datetime.fromtimestamp(item["taken_at"]).strftime("%Y-%m-%d %H:%M"),
+                "stats": item["statistics"],
+                "score": item["score"],
+            }
+            for item in found["results"]
+        ]
+        return json_response(
             {
                 "success": True,
-                "keyword": keyword,
-                "stats": {
-                    "count": stats["count"],
-                    "average": round(stats["average"], 0),
-                    "max": stats["max"],
-                    "min": stats["min"],
-                    "range": stats["max"] - stats["min"],
-                },
-                "prices": prices[:50],  # 상위 50개
-                "histogram": histogram_data,
-                "saved_filename": saved_filename,  # 저장된 파일명 추가
+                "query": query,
+                "history": history,
+                "keywords": [match["keyword"] for match in found["keywords"][:10]],
+                "page": {"page": page, "per_page": per_page, "total": found["total"]},
             }
         )
 
     except Exception as e:
-        return jsonify({"success": False, "error": f"오류 발생: {str(e)}"}), 500
+        return jsonify({"success": False, "error": str(e)}), 500
 
 
-@app.route("/api/history")
-def get_history():
-    """저장된 검색 결과 목록 조회"""
-    try:
-        import glob
-        import os
-        from datetime import datetime
-
-        pkl_files = glob.glob("result_*.pkl")
-        history = []
-
-        for file in sorted(pkl_files, key=os.path.getmtime, reverse=True)[:10]:
-            try:
-                data = analyzer.load_results(file)
-                if data:
-                    mtime = os.path.getmtime(file)
-                    history.append(
-                        {
-                            "filename": file,
-                            "keyword": data.get("keyword", "Unknown"),
-                            "date": datetime.fromtimestamp(mtime).strftime(
-                                "%Y-%m-%d %H:%M"
-                            ),
-                            "stats": data.get("statistics", {}),
-                        }
-                    )
-            except:
-                continue
-
-        return jsonify({"success": True, "history": history})
+@app.route("/api/rank")
+def rank_price():
+    """
+    가격이 키워드의 최근 스냅샷과 최근 기간 기록에서 몇 백분위인지 조회 ("싼 가격인가?")
+
+    Query:
+        keyword: 검색 키워드
+        price: 확인할 가격 (원)
+        window_days: 기간 (일, 기본 30)
+    """
+    keyword = (request.args.get("keyword") or "").strip()
+    if not keyword:
+        return jsonify({"success": False, "error": "keyword를 입력해주세요."}), 400
+    try:
+        price = float(request.args["price"])
+        window_days = float(request.args.get("window_days", 30))
+    except (KeyError, ValueError):
+        return jsonify({"success": False, "error": "price와 window_days는 숫자여야 합니다."}), 400
+    if window_days <= 0:
+        return jsonify({"success": False, "error": "window_days는 0보다 커야 합니다."}), 400
+
+    try:
+        with stage_timer("rank"):
+            rank = analyzer.price_rank(store, keyword, price, window_days=window_days)
+        if rank is None:
+            return jsonify({"success": False, "error": "저장된 검색 결과가 없습니다."}), 404
+        return json_response({"success": True, **rank})
+
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+def _parse_time(value):
+    """Unix time 또는 ISO 형식 날짜/시각 문자열을 Unix time으로 변환합니다 (빈 값이면 None)."""
+    from datetime import datetime
+
+    if value in (None, ""):
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def _parse_id(value):
+    return int(value) if value not in (None, "") else None
+
+
+@app.route("/api/diff")
+def diff_snapshots():
+    """
+    키워드의 두 스냅샷 사이 가격 변화 (추가/삭제된 가격, 통계 변화)
+
+    Query:
+        keyword: 검색 키워드
+        from / to: 비교할 시각 (Unix time 또는 "2024-06-01T12:00", 그 시각 이전의 가장 최근 스냅샷)
+        from_id / to_id: 비교할 스냅샷 id (시각보다 우선)
+        (모두 없으면 최근 스냅샷과 직전 스냅샷 비교)
+    """
+    keyword = (request.args.get("keyword") or "").strip()
+    if not keyword:
+        return jsonify({"success": False, "error": "keyword를 입력해주세요."}), 400
+    try:
+        start = _parse_time(request.args.get("from"))
+        end = _parse_time(request.args.get("to"))
+        from_id = _parse_id(request.args.get("from_id"))
+        to_id = _parse_id(request.args.get("to_id"))
+    except ValueError:
+        return jsonify({"success": False, "error": "from/to는 Unix time 또는 ISO 형식이어야 합니다."}), 400
+
+    try:
+        with stage_timer("diff"):
+            diff = store.diff(keyword, from_id=from_id, to_id=to_id, start=start, end=end)
+        if diff is None:
+            return jsonify({"success": False, "error": "비교할 스냅샷을 찾을 수 없습니다."}), 404
+        return json_response({"success": True, **diff})
+
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route("/api/diff/timeline")
+def diff_timeline():
+    """
+    키워드의 이웃한 스냅샷 사이 변화 타임라인 (저장할 때 기록한 차이 사용)
+
+    Query:
+        keyword: 검색 키워드
+        from / to: 시각 범위 (Unix time 또는 ISO 형식, 선택)
+        limit: 최대 개수 (기본 100, 최대 1000)
+    """
+    keyword = (request.args.get("keyword") or "").strip()
+    if not keyword:
+        return jsonify({"success": False, "error": "keyword를 입력해주세요."}), 400
+    try:
+        start = _parse_time(request.args.get("from"))
+        end = _parse_time(request.args.get("to"))
+        limit = min(max(int(request.args.get("limit", 100)), 1), 1000)
+    except ValueError:
+        return jsonify({"success": False, "error": "from/to/limit 형식이 올바르지 않습니다."}), 400
+
+    try:
+        with stage_timer("diff"):
+            timeline = store.diff_timeline(keyword, start=start, end=end, limit=limit)
+        return json_response({"success": True, "keyword": keyword, "timeline": timeline})
+
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route("/api/compare")
+def compare_keywords():
+    """
+    여러 키워드의 최근 스냅샷 분포를 나란히 비교 (저장할 때 계산한 요약 사용, 가격 배열을 다시 읽지 않음)
+
+    Query:
+        keywords: 쉼표로 구분한 키워드 (keyword를 여러 번 지정해도 됨, 최대 COMPARE_MAX_KEYWORDS개)
+        at: 기준 시각 (Unix time 또는 ISO 형식, 그 시각 이전의 가장 최근 스냅샷, 선택)
+    """
+    keywords = [
+        keyword.strip()
+        for value in request.args.getlist("keywords") + request.args.getlist("keyword")
+        for keyword in value.split(",")
+        if keyword.strip()
+    ]
+    keywords = list(dict.fromkeys(keywords))
+    if not keywords:
+        return jsonify({"success": False, "error": "비교할 키워드를 입력해주세요."}), 400
+    if len(keywords) > COMPARE_MAX_KEYWORDS:
+        return jsonify(
+            {"success": False, "error": f"키워드는 최대 {COMPARE_MAX_KEYWORDS}개까지 비교할 수 있습니다."}
+        ), 400
+    try:
+        at = _parse_time(request.args.get("at"))
+    except ValueError:
+        return jsonify({"success": False, "error": "at은 Unix time 또는 ISO 형식이어야 합니다."}), 400
+
+    try:
+        with stage_timer("compare"):
+            comparison = store.compare(keywords, at=at)
+        if not comparison["keywords"]:
+            return jsonify({"success": False, "error": "저장된 검색 결과가 없습니다."}), 404
+        return json_response({"success": True, **comparison})
+
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
+
+@app.route("/api/export")
+def export_history():
+    """
+    스냅샷 기록을 CSV, NDJSON 또는 Parquet으로 내려받기 (청크 전송, 저장소에서 나누어 읽으며 바로 전송)
+
+    Query:
+        format: csv(기본), ndjson, parquet (parquet은 pyarrow 필요)
+        keyword: 키워드 (없으면 전체)
+        from / to: 시각 범위 (Unix time 또는 ISO 형식, 선택)
+        level: prices(기본, 가격 하나당 한 행) 또는 snapshots(스냅샷 하나당 한 행)
+    """
+    fmt = request.args.get("format", "csv")
+    level = request.args.get("level", "prices")
+    keyword = (request.args.get("keyword") or "").strip() or None
+    try:
+        start = _parse_time(request.args.get("from"))
+        end = _parse_time(request.args.get("to"))
+    except ValueError:
+        return jsonify({"success": False, "error": "from/to는 Unix time 또는 ISO 형식이어야 합니다."}), 400
+
+    try:
+        chunks = history_export.iter_export(store, fmt, keyword=keyword, start=start, end=end, level=level)
+    except history_export.ExportUnavailable as e:
+        return jsonify({"success": False, "error": str(e)}), 501
+    except ValueError as e:
+        return jsonify({"success": False, "error": str(e)}), 400
+
+    def generate():
+        with stage_timer("export"):
+            yield from chunks
+
+    filename = f"price_history_{keyword or 'all'}.{fmt}"
+    response = Response(stream_with_context(generate()), mimetype=history_export.MIMETYPES[fmt])
+    response.headers["Content-Disposition"] = f"attachment; filename*=UTF-8''{quote(filename)}"
+    return response
+
+
+@app.route("/api/products")
+def search_products():
+    """
+    저장된 상품을 상품명 역색인으로 검색 (다시 수집하지 않음)
+
+    Query:
+        q: 상품명 검색어 (공백으로 구분한 단어를 모두 포함)
+        max_price / min_price: 가격 범위 (원, 선택)
+        limit: 최대 개수 (기본 50, 최대 500)
+    """
+    query = (request.args.get("q") or "").strip()
+    if not query:
+        return jsonify({"success": False, "error": "검색어(q)를 입력해주세요."}), 400
+
+    try:
+        max_price, min_price = (
+            int(value) if value not in (None, "") else None
+            for value in (request.args.get("max_price"), request.args.get("min_price"))
+        )
+        limit = min(max(int(request.args.get("limit", 50)), 1), 500)
+    except ValueError:
+        return jsonify({"success": False, "error": "max_price/min_price/limit은 정수여야 합니다."}), 400
+
+    try:
+        with stage_timer("product_search"):
+            products = store.search_products(
+                query, max_price=max_price, min_price=min_price, limit=limit
+            )
+        return json_response({"success": True, "query": query, "products": products})
 
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
@@ -138,7 +803,8 @@ def save_result():
 
         save_data = {"keyword": keyword, "prices": prices, "statistics": stats}
 
-        filename = analyzer.save_results(save_data)
+        with stage_timer("persist"):
+            filename = analyzer.save_results(save_data)
 
         return jsonify(
             {
@@ -154,20 +820,135 @@ def save_result():
 
 @app.route("/api/load/<filename>")
 def load_result(filename):
-    """저장된 결과 불러오기"""
+    """
+    저장된 결과 불러오기 (가격 목록은 커서 기반 페이지 단위)
+
+    Query:
+        limit: 한 번에 받을 가격 개수 (기본 200, 최대 5000)
+        cursor: 이전 페이지의 next_cursor (이 가격보다 큰 가격부터)
+    """
+    from bisect import bisect_right
+
     try:
-        data = analyzer.load_results(filename)
+        limit = min(max(int(request.args.get("limit", LOAD_PAGE_DEFAULT)), 1), LOAD_PAGE_MAX)
+        cursor = request.args.get("cursor")
+        cursor = int(cursor) if cursor not in (None, "") else None
+    except ValueError:
+        return jsonify({"success": False, "error": "limit/cursor는 정수여야 합니다."}), 400
+
+    try:
+        with stage_timer("load"):
+            data = analyzer.load_results(filename)
 
         if not data:
             return jsonify({"success": False, "error": "파일을 찾을 수 없습니다."}), 404
 
-        return jsonify({"success": True, "data": data})
+        prices = data.get("prices") or []
+        # 저장된 가격은 오름차순이므로 커서 위치를 이진 탐색으로 찾음
+        start = bisect_right(prices, cursor) if cursor is not None else 0
+        page = prices[start:start + limit]
+        has_more = start + len(page) < len(prices)
+
+        payload = {k: v for k, v in data.items() if k != "prices"}
+        payload["prices"] = page
+        if cursor is None:
+            # 첫 페이지에만 전체 가격 기준 히스토그램 포함 (브라우저가 전체 목록을 받을 필요 없음)
+            payload["histogram"] = build_histogram(prices) if prices else None
+
+        return json_response(
+            {
+                "success": True,
+                "data": payload,
+                "page": {
+                    "limit": limit,
+                    "total": len(prices),
+                    "next_cursor": page[-1] if has_more else None,
+                },
+            }
+        )
 
     except Exception as e:
         return jsonify({"success": False, "error": str(e)}), 500
 
 
+# ---- 시작 시 예열 ----
+# 재시작 직후 첫 요청들이 파일 읽기, 색인 생성, 크롤링을 모두 떠안지 않도록 백그라운드에서 미리 채움
+
+
+def _warm_history_files():
+    """최근 결과 파일 요약을 읽어 둡니다."""
+    return len(result_files.recent(HISTORY_RECENT_LIMIT))
+
+
+def _warm_keyword_index():
+    """스냅샷 저장소 전체를 한 번 훑어 키워드 trigram 색인을 만듭니다."""
+    return len(store.refresh_keyword_index())
+
+
+def _popular_keywords():
+    return [item["keyword"] for item in store.refresh_keyword_index().top(WARMUP_TOP_KEYWORDS)]
+
+
+def _warm_latest_snapshots():
+    """
+    인기 키워드의 최근 스냅샷을 불러와, 수집한 지 TTL이 지나지 않은 것은 결과 캐시에 넣습니다.
+    캐시 항목은 수집 시각 기준으로 만료되므로 재시작 때문에 오래된 결과를 더 오래 보여 주지는 않습니다.
+    """
+    cached = 0
+    now = time.time()
+    for keyword in _popular_keywords():
+        snapshot = store.latest(keyword)
+        if snapshot is None or not snapshot["prices"]:
+            continue
+        age = max(0.0, now - snapshot["taken_at"])
+        if age >= CACHE_TTL_SECONDS:
+            continue
+        result_cache.set(
+            keyword,
+            {
+                "keyword": keyword,
+                "stats": format_stats(snapshot["statistics"]),
+                "prices": snapshot["prices"][:50],
+                "histogram": build_histogram(snapshot["prices"]),
+                "saved_filename": None,
+                "snapshot_id": snapshot["id"],
+            },
+            age=age,
+        )
+        cached += 1
+    return cached
+
+
+def _warm_aggregates():
+    """인기 키워드의 최근 스냅샷 비교용 요약(분위수, 공통 구간 개수)을 채워 둡니다."""
+    keywords = _popular_keywords()
+    for start in range(0, len(keywords), COMPARE_MAX_KEYWORDS):
+        store.compare(keywords[start:start + COMPARE_MAX_KEYWORDS])
+    return len(keywords)
+
+
+warmup = Warmup()
+warmup.add_step("history_files", _warm_history_files)
+warmup.add_step("keyword_index", _warm_keyword_index)
+warmup.add_step("latest_snapshots", _warm_latest_snapshots)
+warmup.add_step("aggregates", _warm_aggregates)
+WARMUP_READY.set_function(lambda: int(warmup.ready))
+
+
+def start_warmup():
+    """
+    시작 시 예열을 백그라운드에서 시작합니다 (WARMUP=0이면 생략).
+    app.py 직접 실행과 serve.py 작업 프로세스가 요청을 받기 전에 호출합니다.
+    """
+    if os.environ.get("WARMUP", "1") != "0":
+        warmup.start()
+
+
 if __name__ == "__main__":
+    # 디버그 모드의 자동 재시작 감시 프로세스가 아니라 실제 서버 프로세스에서만 예열
+    if os.environ.get("WERKZEUG_RUN_MAIN") == "true":
+        start_warmup()
+
     print("\n" + "=" * 60)
     print("🌐 Flask 웹 대시보드 시작!")
     print("=" * 60)
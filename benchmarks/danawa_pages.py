@@ -0,0 +1,127 @@
+"""
+다나와 검색 결과 페이지 HTML 생성기
+벤치마크 코퍼스와 로컬 테스트 서버에서 사용하는, 다나와 상품 목록과 같은 구조의 HTML을 만듭니다.
+"""
+
+import html
+import random
+from typing import Dict, List
+
+BRANDS = ["로지텍", "삼성전자", "LG전자", "앱코", "레이저", "커세어", "한성컴퓨터", "ASUS", "MSI", "제닉스"]
+MODELS = ["PRO", "PLUS", "MASTER", "LITE", "SILENT", "X", "ULTRA", "MINI", "AIR", "G"]
+SPECS = [
+    "무선 / 블루투스 / 2.4GHz",
+    "유선 / USB / RGB",
+    "저소음 / 충전식 / 1000mAh",
+    "기계식 / 적축 / 풀배열",
+    "27인치 / IPS / 144Hz",
+    "USB-C / 고속충전 / 65W",
+]
+SELLERS = ["정품", "병행수입", "해외구매", "리퍼"]
+
+
+def generate_products(
+    keyword: str,
+    count: int,
+    seed: int = 0,
+    median_price: float = 45000,
+    sigma: float = 0.6,
+) -> List[Dict]:
+    """
+    로그정규분포를 따르는 가격의 상품 목록을 생성합니다.
+
+    Args:
+        keyword: 상품명에 포함할 검색 키워드
+        count: 상품 개수
+        seed: 난수 시드 (같은 시드는 같은 결과)
+        median_price: 가격 중앙값 (원)
+        sigma: 로그 가격의 표준편차 (클수록 가격 분포가 넓음)
+
+    Returns:
+        {"id", "name", "spec", "prices"} 딕셔너리 리스트
+    """
+    rng = random.Random(seed)
+    products = []
+    for i in range(count):
+        base = rng.lognormvariate(0, sigma) * median_price
+        # 판매처별 가격 (1~3개), 10원 단위로 반올림
+        prices = sorted(
+            max(1000, int(round(base * rng.uniform(0.95, 1.1), -1)))
+            for _ in range(rng.randint(1, 3))
+        )
+        products.append(
+            {
+                "id": 10000000 + rng.randrange(9000000) * 10 + i % 10,
+                "name": f"{rng.choice(BRANDS)} {keyword} {rng.choice(MODELS)}{rng.randint(1, 999)}",
+                "spec": rng.choice(SPECS),
+                "prices": prices,
+            }
+        )
+    return products
+
+
+def render_product(product: Dict) -> str:
+    """상품 하나를 다나와 상품 목록 항목(li.prod_item) HTML로 변환합니다."""
+    pcode = product["id"]
+    name = html.escape(product["name"])
+    options = "".join(
+        f"""
+            <li id="productInfoDetail_{pcode}_{n}">
+              <p class="memory_sect"><span class="text">{SELLERS[n % len(SELLERS)]}</span></p>
+              <p class="price_sect"><a href="https://prod.danawa.com/info/?pcode={pcode}"><strong>{price:,}</strong>원</a></p>
+            </li>"""
+        for n, price in enumerate(product["prices"])
+    )
+    return f"""
+<li class="prod_item prod_layer" id="productItem{pcode}">
+  <div class="prod_main_info">
+    <div class="thumb_image"><a href="https://prod.danawa.com/info/?pcode={pcode}"><img src="//img.danawa.com/prod_img/{pcode}.jpg" alt="{name}"></a></div>
+    <div class="prod_info">
+      <p class="prod_name"><a href="https://prod.danawa.com/info/?pcode={pcode}" name="productName">{name}</a></p>
+      <div class="spec_list">{html.escape(product["spec"])}</div>
+      <div class="prod_sub_info"><span class="meta_item">배송비 {2500 if pcode % 3 else 0:,}원</span></div>
+    </div>
+    <div class="prod_pricelist">
+      <ul>{options}
+      </ul>
+    </div>
+  </div>
+</li>"""
+
+
+def render_search_page(keyword: str, products: List[Dict], page: int = 1) -> str:
+    """
+    다나와 검색 결과 페이지 전체 HTML을 생성합니다.
+
+    Args:
+        keyword: 검색 키워드
+        products: generate_products()로 만든 상품 목록
+        page: 페이지 번호
+
+    Returns:
+        HTML 문자열
+    """
+    keyword_text = html.escape(keyword)
+    items = "".join(render_product(p) for p in products)
+    return f"""<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="UTF-8">
+<title>{keyword_text} : 다나와 통합검색</title>
+<script>var searchConfig = {{"query": "{keyword_text}", "page": {page}, "limit": 40, "minPrice": "0원"}};</script>
+<style>.prod_item {{ margin: 0; }} .price_sect strong {{ color: #e00; }}</style>
+</head>
+<body>
+<div id="header"><form action="/dsearch.php"><input type="text" name="query" value="{keyword_text}"></form></div>
+<div class="search_result">
+  <div class="result_summary">'{keyword_text}' 검색결과 상품 {len(products):,}개</div>
+  <div class="main_prodlist main_prodlist_list">
+    <ul class="product_list">{items}
+    </ul>
+  </div>
+  <div class="paging_number_wrap"><a class="num now_on">{page}</a><a class="num">{page + 1}</a></div>
+</div>
+<div id="footer">무료배송 기준 30,000원 이상 구매 시 | 고객센터 1588-0000</div>
+</body>
+</html>
+"""
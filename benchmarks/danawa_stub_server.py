@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+로컬 다나와 대체 서버
+search.danawa.com/dsearch.php 처럼 query/tab/page 파라미터를 받아 검색 결과 HTML을 돌려주는
+테스트용 HTTP 서버입니다. 응답 크기, 가격 분포, 지연 시간, 오류율, 느린 응답 비율을 설정할 수 있어
+실제 사이트 없이 동시성, 캐시, 연결 풀 성능을 재현 가능하게 측정할 수 있습니다.
+
+사용법:
+    python benchmarks/danawa_stub_server.py --port 8900 --products 80 --latency 120 --error-rate 0.01
+    DANAWA_BASE_URL=http://127.0.0.1:8900/dsearch.php python app.py
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+import zlib
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from typing import Optional
+
+from danawa_pages import generate_products, render_search_page
+
+
+class StubConfig:
+    """대체 서버 동작 설정"""
+
+    def __init__(
+        self,
+        products: int = 40,
+        median_price: float = 45000,
+        sigma: float = 0.6,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0.0,
+        slow_rate: float = 0.0,
+        slow_ms: float = 2000,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            products: 페이지당 상품 개수
+            median_price: 가격 중앙값 기준 (키워드별로 0.5~2.5배 범위에서 달라짐)
+            sigma: 로그 가격의 표준편차
+            latency_ms: 기본 응답 지연 (밀리초)
+            jitter_ms: 지연 시간의 무작위 변동폭 (밀리초)
+            error_rate: 500 오류를 반환할 비율 (0.0 ~ 1.0)
+            slow_rate: 느린 응답(slow_ms 추가 지연)을 보낼 비율 (0.0 ~ 1.0)
+            slow_ms: 느린 응답의 추가 지연 (밀리초)
+            seed: 난수 시드
+        """
+        self.products = products
+        self.median_price = median_price
+        self.sigma = sigma
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.slow_rate = slow_rate
+        self.slow_ms = slow_ms
+        self.seed = seed
+
+
+class DanawaStubServer(ThreadingHTTPServer):
+    """설정과 요청 통계를 보관하는 멀티스레드 HTTP 서버"""
+
+    daemon_threads = True
+
+    def __init__(self, address, config: StubConfig):
+        super().__init__(address, DanawaStubHandler)
+        self.config = config
+        self.rng = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.stats = {"requests": 0, "errors": 0, "slow": 0}
+
+        @lru_cache(maxsize=1024)
+        def render(keyword: str, page: int) -> bytes:
+            # 같은 키워드와 페이지는 항상 같은 HTML
+            key = zlib.crc32(f"{keyword}\0{page}".encode("utf-8"))
+            median = config.median_price * (0.5 + (zlib.crc32(keyword.encode("utf-8")) % 200) / 100)
+            products = generate_products(
+                keyword, config.products, seed=config.seed ^ key, median_price=median, sigma=config.sigma
+            )
+            return render_search_page(keyword, products, page).encode("utf-8")
+
+        self.render = render
+
+    def decide(self):
+        """
+        이번 요청의 지연 시간과 오류 여부를 결정합니다.
+
+        Returns:
+            (지연 시간 초, 오류 여부, 느린 응답 여부)
+        """
+        config = self.config
+        with self.lock:
+            self.stats["requests"] += 1
+            delay = config.latency_ms + self.rng.uniform(-config.jitter_ms, config.jitter_ms)
+            slow = self.rng.random() < config.slow_rate
+            error = self.rng.random() < config.error_rate
+            if slow:
+                self.stats["slow"] += 1
+                delay += config.slow_ms
+            if error:
+                self.stats["errors"] += 1
+        return max(delay, 0) / 1000, error, slow
+
+
+class DanawaStubHandler(BaseHTTPRequestHandler):
+    """/dsearch.php 요청을 처리하는 핸들러"""
+
+    server: DanawaStubServer
+
+    def do_GET(self):
+        url = urlparse(self.path)
+
+        if url.path == "/__stats":
+            with self.server.lock:
+                body = repr(self.server.stats).encode("utf-8")
+            return self._send(200, body, "text/plain; charset=utf-8")
+
+        if url.path != "/dsearch.php":
+            return self._send(404, b"not found", "text/plain")
+
+        params = parse_qs(url.query)
+        keyword = params.get("query", [""])[0]
+        tab = params.get("tab", ["main"])[0]
+        try:
+            page = max(1, int(params.get("page", ["1"])[0]))
+        except ValueError:
+            page = 1
+
+        delay, error, _ = self.server.decide()
+        if delay:
+            time.sleep(delay)
+
+        if error:
+            return self._send(500, b"Internal Server Error", "text/plain")
+        if not keyword or tab != "goods":
+            body = render_search_page(keyword, [], page).encode("utf-8")
+        else:
+            body = self.server.render(keyword, page)
+
+        # 같은 본문이면 같은 ETag (조건부 요청이 일치하면 본문 없이 304)
+        etag = f'"{zlib.crc32(body):08x}"'
+        if self.headers.get("If-None-Match") == etag:
+            return self._send(304, b"", None, etag)
+        self._send(200, body, "text/html; charset=UTF-8", etag)
+
+    def _send(self, status: int, body: bytes, content_type: Optional[str], etag: Optional[str] = None):
+        self.send_response(status)
+        if content_type:
+            self.send_header("Content-Type", content_type)
+        if etag:
+            self.send_header("ETag", etag)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        # 부하 테스트 중 콘솔 출력 억제
+        pass
+
+
+def start_stub_server(host: str = "127.0.0.1", port: int = 0, **config):
+    """
+    대체 서버를 백그라운드 스레드에서 시작합니다.
+
+    Args:
+        host: 바인딩할 주소
+        port: 포트 (0이면 빈 포트 자동 선택)
+        **config: StubConfig 설정값
+
+    Returns:
+        (서버 객체, PriceScraper.base_url에 지정할 URL)
+    """
+    server = DanawaStubServer((host, port), StubConfig(**config))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f"http://{host}:{server.server_address[1]}/dsearch.php"
+    return server, url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="로컬 다나와 대체 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--products", type=int, default=40, help="페이지당 상품 개수")
+    parser.add_argument("--median-price", type=float, default=45000, help="가격 중앙값 기준 (원)")
+    parser.add_argument("--sigma", type=float, default=0.6, help="로그 가격 표준편차")
+    parser.add_argument("--latency", type=float, default=0, help="기본 응답 지연 (ms)")
+    parser.add_argument("--jitter", type=float, default=0, help="지연 변동폭 (ms)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 오류 비율")
+    parser.add_argument("--slow-rate", type=float, default=0.0, help="느린 응답 비율")
+    parser.add_argument("--slow-ms", type=float, default=2000, help="느린 응답 추가 지연 (ms)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = StubConfig(
+        products=args.products,
+        median_price=args.median_price,
+        sigma=args.sigma,
+        latency_ms=args.latency,
+        jitter_ms=args.jitter,
+        error_rate=args.error_rate,
+        slow_rate=args.slow_rate,
+        slow_ms=args.slow_ms,
+        seed=args.seed,
+    )
+    server = DanawaStubServer((args.host, args.port), config)
+    url = f"http://{args.host}:{server.server_address[1]}/dsearch.php"
+    print(f"🧪 다나와 대체 서버 시작: {url}")
+    print(f"   DANAWA_BASE_URL={url} 로 지정하여 사용하세요. (종료: Ctrl+C)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n서버를 종료합니다.")
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+웹 대시보드 부하 테스트
+/api/search, /api/history, /api/load/<filename>, /api/save 를 정해진 비율로 섞어
+동시에 호출하고, 엔드포인트별 처리량, 지연 시간 백분위수, 오류율을 보고합니다.
+키워드는 Zipf 분포(소수의 인기 키워드에 요청 집중)로 선택합니다.
+
+기본적으로 로컬 다나와 대체 서버와 대시보드를 이 프로세스 안에서 띄워 실제 사이트 없이 실행하며,
+--target 을 지정하면 이미 실행 중인 서버(예: 대체 서버에 연결된 app.py)를 대상으로 합니다.
+
+사용법:
+    python benchmarks/load_test.py --concurrency 16 --duration 30 --keywords 200
+    python benchmarks/load_test.py --target http://127.0.0.1:8080 --mix search=0.3,history=0.4,load=0.25,save=0.05
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from collections import Counter, defaultdict
+
+import requests
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+DEFAULT_MIX = "search=0.4,history=0.3,load=0.25,save=0.05"
+
+
+def parse_mix(text: str) -> dict:
+    """'search=0.4,history=0.3' 형식의 요청 비율을 해석합니다."""
+    mix = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in ("search", "history", "load", "save"):
+            raise ValueError(f"알 수 없는 엔드포인트: {name}")
+        mix[name] = float(weight)
+    return mix
+
+
+class ZipfKeywords:
+    """Zipf 분포로 키워드를 선택하는 클래스 (순위 k의 선택 확률 ∝ 1/k^s)"""
+
+    def __init__(self, keywords: list, s: float):
+        self.keywords = keywords
+        total = 0.0
+        self.cum_weights = []
+        for rank in range(1, len(keywords) + 1):
+            total += 1 / rank**s
+            self.cum_weights.append(total)
+
+    def choose(self, rng: random.Random) -> str:
+        return rng.choices(self.keywords, cum_weights=self.cum_weights)[0]
+
+
+class LoadTest:
+    """부하 생성 및 결과 집계 클래스"""
+
+    def __init__(self, target: str, mix: dict, keywords: ZipfKeywords, seed: int):
+        self.target = target.rstrip("/")
+        self.names = list(mix)
+        self.weights = [mix[n] for n in self.names]
+        self.keywords = keywords
+        self.seed = seed
+
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.saved_files = []
+        self.last_results = []
+
+    def record(self, endpoint: str, latency: float, status):
+        with self.lock:
+            self.latencies[endpoint].append(latency)
+            self.statuses[endpoint][status] += 1
+
+    def call(self, session: requests.Session, rng: random.Random):
+        """비율에 따라 엔드포인트 하나를 골라 호출합니다."""
+        endpoint = rng.choices(self.names, weights=self.weights)[0]
+
+        with self.lock:
+            saved = rng.choice(self.saved_files) if self.saved_files else None
+            result = rng.choice(self.last_results) if self.last_results else None
+
+        # 아직 저장된 결과가 없으면 검색부터 수행
+        if endpoint in ("load", "save") and (saved is None or result is None):
+            endpoint = "search"
+
+        start = time.perf_counter()
+        try:
+            if endpoint == "search":
+                response = session.post(
+                    f"{self.target}/api/search",
+                    json={"keyword": self.keywords.choose(rng)},
+                    timeout=60,
+                )
+            elif endpoint == "history":
+                response = session.get(f"{self.target}/api/history", timeout=60)
+            elif endpoint == "load":
+                response = session.get(f"{self.target}/api/load/{saved}", timeout=60)
+            else:
+                response = session.post(
+                    f"{self.target}/api/save",
+                    json={
+                        "keyword": result["keyword"],
+                        "prices": result["prices"],
+                        "stats": result["stats"],
+                    },
+                    timeout=60,
+                )
+            status = response.status_code
+        except requests.RequestException as e:
+            self.record(endpoint, time.perf_counter() - start, type(e).__name__)
+            return
+
+        self.record(endpoint, time.perf_counter() - start, status)
+
+        if endpoint == "search" and status == 200:
+            data = response.json()
+            with self.lock:
+                self.saved_files.append(data["saved_filename"])
+                self.last_results.append(data)
+                # 최근 결과만 유지
+                del self.saved_files[:-200]
+                del self.last_results[:-50]
+
+    def worker(self, index: int, deadline: float):
+        rng = random.Random(self.seed * 1000 + index)
+        with requests.Session() as session:
+            while time.monotonic() < deadline:
+                self.call(session, rng)
+
+    def run(self, concurrency: int, duration: float) -> float:
+        """
+        부하 테스트를 실행합니다.
+
+        Returns:
+            실제 실행 시간 (초)
+        """
+        deadline = time.monotonic() + duration
+        threads = [
+            threading.Thread(target=self.worker, args=(i, deadline), daemon=True)
+            for i in range(concurrency)
+        ]
+        start = time.monotonic()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.monotonic() - start
+
+    def report(self, elapsed: float) -> dict:
+        """엔드포인트별 처리량, 지연 시간 백분위수, 오류율을 계산합니다."""
+        report = {}
+        for endpoint in sorted(self.latencies):
+            latencies = sorted(self.latencies[endpoint])
+            statuses = self.statuses[endpoint]
+            count = len(latencies)
+            errors = sum(n for status, n in statuses.items() if not (isinstance(status, int) and status < 400))
+            report[endpoint] = {
+                "requests": count,
+                "throughput_rps": round(count / elapsed, 2),
+                "error_rate": round(errors / count, 4),
+                "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+                "p90_ms": round(percentile(latencies, 90) * 1000, 1),
+                "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+                "max_ms": round(latencies[-1] * 1000, 1),
+                "statuses": {str(k): v for k, v in sorted(statuses.items(), key=str)},
+            }
+        return report
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    """정렬된 값에서 p 백분위수를 구합니다 (nearest-rank)."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, int(round(p / 100 * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+def print_report(report: dict, elapsed: float):
+    print(f"\n실행 시간: {elapsed:.1f}초")
+    print(
+        f"{'엔드포인트':10s} {'요청':>7s} {'RPS':>8s} {'오류율':>7s} "
+        f"{'p50':>9s} {'p90':>9s} {'p99':>9s} {'max':>9s}"
+    )
+    print("-" * 76)
+    for endpoint, r in report.items():
+        print(
+            f"{endpoint:10s} {r['requests']:>7d} {r['throughput_rps']:>8.1f} {r['error_rate']:>7.1%} "
+            f"{r['p50_ms']:>7.1f}ms {r['p90_ms']:>7.1f}ms {r['p99_ms']:>7.1f}ms {r['max_ms']:>7.1f}ms"
+        )
+    print("-" * 76)
+    for endpoint, r in report.items():
+        print(f"{endpoint:10s} 상태 코드: {r['statuses']}")
+
+
+@contextlib.contextmanager
+def local_environment(args):
+    """대체 서버와 대시보드를 이 프로세스 안에서 실행합니다."""
+    from werkzeug.serving import make_server
+    from danawa_stub_server import start_stub_server
+
+    stub, stub_url = start_stub_server(
+        products=args.products,
+        latency_ms=args.stub_latency,
+        jitter_ms=args.stub_latency / 3,
+        error_rate=args.stub_error_rate,
+        slow_rate=args.stub_slow_rate,
+        seed=args.seed,
+    )
+    os.environ["DANAWA_BASE_URL"] = stub_url
+
+    # 자동 저장 파일이 저장소를 어지럽히지 않도록 임시 디렉토리에서 실행
+    workdir = tempfile.mkdtemp(prefix="price_load_")
+    original_cwd = os.getcwd()
+    os.chdir(workdir)
+
+    import app as dashboard
+
+    dashboard.scraper.base_url = stub_url
+    server = make_server("127.0.0.1", 0, dashboard.app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield f"http://127.0.0.1:{server.server_port}"
+    finally:
+        server.shutdown()
+        stub.shutdown()
+        os.chdir(original_cwd)
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="웹 대시보드 부하 테스트")
+    parser.add_argument("--target", help="대상 서버 주소 (없으면 로컬 환경을 직접 실행)")
+    parser.add_argument("--concurrency", type=int, default=8, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=20, help="실행 시간 (초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"엔드포인트 비율 (기본: {DEFAULT_MIX})")
+    parser.add_argument("--keywords", type=int, default=100, help="키워드 종류 개수")
+    parser.add_argument("--keyword-file", help="키워드 목록 파일 (한 줄에 하나, 인기순)")
+    parser.add_argument("--zipf-s", type=float, default=1.1, help="Zipf 지수 (클수록 인기 키워드 집중)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--products", type=int, default=40, help="대체 서버 페이지당 상품 개수")
+    parser.add_argument("--stub-latency", type=float, default=80, help="대체 서버 평균 지연 (ms)")
+    parser.add_argument("--stub-error-rate", type=float, default=0.0, help="대체 서버 오류율")
+    parser.add_argument("--stub-slow-rate", type=float, default=0.0, help="대체 서버 느린 응답 비율")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    if args.keyword_file:
+        with open(args.keyword_file, encoding="utf-8") as f:
+            keywords = [line.strip() for line in f if line.strip()]
+    else:
+        keywords = [f"상품{i:04d}" for i in range(args.keywords)]
+    zipf = ZipfKeywords(keywords, args.zipf_s)
+    mix = parse_mix(args.mix)
+
+    if args.target:
+        environment = contextlib.nullcontext(args.target)
+    else:
+        environment = local_environment(args)
+
+    with environment as target:
+        print(
+            f"🚀 부하 테스트 시작: {target} (동시 {args.concurrency}, {args.duration:.0f}초, "
+            f"키워드 {len(keywords)}개, Zipf s={args.zipf_s})",
+            file=sys.stderr,
+        )
+        test = LoadTest(target, mix, zipf, args.seed)
+        elapsed = test.run(args.concurrency, args.duration)
+
+    report = test.report(elapsed)
+    print_report(report, elapsed)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(
+                {"config": vars(args), "elapsed": elapsed, "endpoints": report},
+                f,
+                ensure_ascii=False,
+                indent=2,
+            )
+        print(f"\n결과 저장 완료: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
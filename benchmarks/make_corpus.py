@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+"""
+벤치마크 코퍼스 생성 스크립트
+다나와 검색 결과 페이지 구조를 본뜬 크기별 HTML을 benchmarks/corpus/에 저장합니다.
+같은 시드로 생성하므로 다시 실행해도 같은 파일이 만들어집니다.
+"""
+
+import os
+
+from danawa_pages import generate_products, render_search_page
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+# 이름: (키워드, 상품 개수, 시드)
+CORPUS = {
+    "small": ("무선마우스", 40, 1),
+    "medium": ("기계식키보드", 200, 2),
+    "large": ("모니터", 1000, 3),
+}
+
+
+def corpus_path(name: str) -> str:
+    """코퍼스 파일 경로를 반환합니다."""
+    return os.path.join(CORPUS_DIR, f"danawa_{name}.html")
+
+
+def main():
+    os.makedirs(CORPUS_DIR, exist_ok=True)
+    for name, (keyword, count, seed) in CORPUS.items():
+        products = generate_products(keyword, count, seed=seed)
+        page = render_search_page(keyword, products)
+        with open(corpus_path(name), "w", encoding="utf-8") as f:
+            f.write(page)
+        print(f"{corpus_path(name)}: 상품 {count}개, {len(page.encode('utf-8')):,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+크롤링 → 분석 → 저장 파이프라인 벤치마크
+저장된 다나와 검색 결과 HTML(benchmarks/corpus)로 네트워크 없이 각 단계를 측정하고,
+결과를 JSON으로 저장하며 기준(baseline) 결과와 비교합니다.
+
+사용법:
+    python benchmarks/run_benchmarks.py                         # 측정 후 결과 출력
+    python benchmarks/run_benchmarks.py --output result.json    # 결과 저장
+    python benchmarks/run_benchmarks.py --compare               # baseline.json과 비교 (회귀 시 종료 코드 1)
+    python benchmarks/run_benchmarks.py --update-baseline       # baseline.json 갱신
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import pickle
+import platform
+import random
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from make_corpus import CORPUS, corpus_path  # noqa: E402
+from price_engine import PriceScraper, DataAnalyzer  # noqa: E402
+
+BASELINE_PATH = os.path.join(BENCH_DIR, "baseline.json")
+DEFAULT_THRESHOLD = 0.25  # 기준 대비 25% 이상 느려지면 회귀로 판단 (최솟값 기준)
+ARCHIVE_SIZES = (100, 1000)  # /api/history 측정용 저장 파일 개수
+
+
+class FakeResponse:
+    """requests 응답을 흉내 내는 객체 (네트워크 대체용)"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.content = text.encode("utf-8")
+        self.status_code = 200
+        self.encoding = "utf-8"
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size: int = 1):
+        for start in range(0, len(self.content), chunk_size):
+            yield self.content[start:start + chunk_size]
+
+    def close(self):
+        pass
+
+
+def measure(function, repeat: int, min_batch_seconds: float = 0.05):
+    """
+    함수를 여러 번 실행하여 1회당 소요 시간(ms)을 측정합니다.
+    실행 시간이 짧은 함수는 한 번의 측정에서 여러 번 반복 실행하여 타이머 오차를 줄입니다.
+
+    Returns:
+        {"min_ms", "median_ms", "mean_ms", "repeat", "number"} 딕셔너리
+    """
+    # 워밍업 겸 1회 측정 배치 크기 결정
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        if time.perf_counter() - start >= min_batch_seconds or number >= 10000:
+            break
+        number *= 2
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        timings.append((time.perf_counter() - start) * 1000 / number)
+
+    return {
+        "min_ms": round(min(timings), 4),
+        "median_ms": round(statistics.median(timings), 4),
+        "mean_ms": round(statistics.mean(timings), 4),
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def bench_scrape(results: dict, repeat: int):
+    """네트워크를 대체한 상태에서 scrape_prices 파싱 시간 측정"""
+    for name in CORPUS:
+        with open(corpus_path(name), encoding="utf-8") as f:
+            response = FakeResponse(f.read())
+
+        scraper = PriceScraper()
+        scraper.session.get = lambda *args, **kwargs: response
+
+        def run():
+            # CLI 버전의 진행 메시지 출력 억제
+            with contextlib.redirect_stdout(io.StringIO()):
+                return scraper.scrape_prices(CORPUS[name][0])
+
+        results[f"scrape_prices[{name}]"] = measure(run, repeat)
+
+
+def make_prices(count: int, seed: int = 0):
+    rng = random.Random(seed)
+    return sorted({int(rng.lognormvariate(10.7, 0.6)) for _ in range(count)})
+
+
+def bench_analyze(results: dict, repeat: int):
+    """calculate_statistics 및 히스토그램 계산 시간 측정"""
+    import numpy as np
+
+    for count in (1000, 100000):
+        prices = make_prices(count)
+        results[f"calculate_statistics[{count}]"] = measure(
+            lambda: DataAnalyzer.calculate_statistics(prices), repeat
+        )
+        results[f"np.histogram[{count}]"] = measure(
+            lambda: np.histogram(prices, bins=20), repeat
+        )
+
+
+def bench_persist(results: dict, repeat: int, workdir: str):
+    """save_results / load_results 시간 측정"""
+    for count in (1000, 100000):
+        prices = make_prices(count)
+        data = {
+            "keyword": "벤치마크",
+            "prices": prices,
+            "statistics": DataAnalyzer.calculate_statistics(prices),
+        }
+        filename = os.path.join(workdir, f"bench_{count}.pkl")
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            results[f"save_results[{count}]"] = measure(
+                lambda: DataAnalyzer.save_results(data, filename), repeat
+            )
+            results[f"load_results[{count}]"] = measure(
+                lambda: DataAnalyzer.load_results(filename), repeat
+            )
+
+
+def bench_history(results: dict, repeat: int, workdir: str):
+    """저장 파일 개수별 /api/history 응답 시간 측정"""
+    import app as dashboard
+
+    client = dashboard.app.test_client()
+    archive_dir = os.path.join(workdir, "archive")
+    os.makedirs(archive_dir)
+    original_cwd = os.getcwd()
+    created = 0
+
+    try:
+        os.chdir(archive_dir)
+        for size in ARCHIVE_SIZES:
+            # 실제 사용과 비슷하게 검색 결과당 가격 150개
+            for i in range(created, size):
+                prices = make_prices(150, seed=i)
+                data = {
+                    "keyword": f"상품{i % 50}",
+                    "prices": prices,
+                    "statistics": DataAnalyzer.calculate_statistics(prices),
+                }
+                with open(f"result_상품{i % 50}_{i:08d}.pkl", "wb") as f:
+                    pickle.dump(data, f)
+            created = size
+
+            def run():
+                with contextlib.redirect_stdout(io.StringIO()):
+                    response = client.get("/api/history")
+                assert response.status_code == 200
+
+            results[f"api_history[{size}]"] = measure(run, repeat)
+    finally:
+        os.chdir(original_cwd)
+
+
+def run_all(repeat: int) -> dict:
+    """모든 벤치마크를 실행합니다."""
+    results = {}
+    workdir = tempfile.mkdtemp(prefix="price_bench_")
+    try:
+        bench_scrape(results, repeat)
+        bench_analyze(results, repeat)
+        bench_persist(results, repeat, workdir)
+        bench_history(results, repeat, workdir)
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+    return {
+        "created_at": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> list:
+    """
+    기준 결과와 비교하여 회귀 항목을 찾습니다.
+
+    Returns:
+        (이름, 기준 ms, 현재 ms, 변화율) 튜플의 회귀 목록
+    """
+    regressions = []
+    print(f"\n{'벤치마크':40s} {'기준(ms)':>12s} {'현재(ms)':>12s} {'변화':>9s}")
+    print("-" * 76)
+    for name, result in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            print(f"{name:40s} {'-':>12s} {result['min_ms']:>12.3f} {'신규':>9s}")
+            continue
+        # 잡음에 덜 민감한 최솟값으로 비교
+        change = result["min_ms"] / base["min_ms"] - 1 if base["min_ms"] else 0
+        mark = " ⚠️" if change > threshold else ""
+        print(
+            f"{name:40s} {base['min_ms']:>12.3f} {result['min_ms']:>12.3f} {change:>+8.1%}{mark}"
+        )
+        if change > threshold:
+            regressions.append((name, base["min_ms"], result["min_ms"], change))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가격 분석 파이프라인 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="항목별 반복 횟수")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준 JSON 파일")
+    parser.add_argument("--compare", action="store_true", help="기준 결과와 비교")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="회귀로 판단할 최솟값 증가율 (기본 0.25 = 25%%)",
+    )
+    parser.add_argument("--update-baseline", action="store_true", help="기준 결과 갱신")
+    args = parser.parse_args()
+
+    current = run_all(args.repeat)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"결과 저장 완료: {args.output}")
+
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, ensure_ascii=False, indent=2)
+        print(f"기준 결과 갱신 완료: {args.baseline}")
+        return 0
+
+    if args.compare:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건 (기준 대비 +{args.threshold:.0%} 초과)")
+            return 1
+        print("\n✅ 성능 회귀 없음")
+        return 0
+
+    print(json.dumps(current, ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
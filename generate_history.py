@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+대용량 가격 히스토리 생성 스크립트
+NumPy 일괄 샘플링으로 수백만 개의 스냅샷을 만들어 스냅샷 저장소(SQLite)에 바로 저장합니다.
+키워드별 가격대, 장기 추세, 계절성, 가격 하락 이벤트를 반영하여
+히스토리/추세/집계 조회를 실제 운영 규모에서 벤치마크할 수 있습니다.
+
+사용법:
+    python generate_history.py --keywords 1000 --days 365 --interval-hours 6 --db snapshots.db
+"""
+
+import argparse
+import sys
+import time
+
+import numpy as np
+
+from snapshot_store import PRICE_DTYPE, SnapshotStore
+
+KEYWORD_WORDS = ["무선마우스", "키보드", "모니터", "노트북", "헤드셋", "SSD", "웹캠", "스피커", "태블릿", "공유기"]
+KEYWORD_SUFFIXES = ["", "게이밍", "저소음", "블루투스", "사무용", "휴대용", "프리미엄", "미니"]
+
+MIN_PRICE = 1000
+MAX_PRICE = 100000000
+DAY = 86400.0
+
+
+def make_keywords(count: int) -> list:
+    """서로 다른 키워드 이름 목록을 만듭니다."""
+    keywords = []
+    for i in range(count):
+        word = KEYWORD_WORDS[i % len(KEYWORD_WORDS)]
+        suffix = KEYWORD_SUFFIXES[(i // len(KEYWORD_WORDS)) % len(KEYWORD_SUFFIXES)]
+        serial = i // (len(KEYWORD_WORDS) * len(KEYWORD_SUFFIXES))
+        name = f"{suffix} {word}".strip()
+        keywords.append(f"{name} {serial}" if serial else name)
+    return keywords
+
+
+def price_levels(
+    rng: np.random.Generator,
+    t_days: np.ndarray,
+    base: float,
+    trend: float,
+    seasonality: float,
+    drop_rate: float,
+) -> np.ndarray:
+    """
+    시각별 가격 수준(중앙값)을 계산합니다.
+
+    Args:
+        t_days: 시작 시점부터의 경과 일수 배열
+        base: 시작 가격 수준
+        trend: 연간 가격 변화율 (예: -0.1 = 1년에 10% 하락)
+        seasonality: 연 주기 계절 변동폭 (예: 0.05 = ±5%)
+        drop_rate: 30일당 평균 가격 하락 이벤트 횟수
+
+    Returns:
+        t_days와 같은 길이의 가격 수준 배열
+    """
+    level = base * np.exp(trend * t_days / 365.0)
+    phase = rng.uniform(0, 2 * np.pi)
+    level *= 1 + seasonality * np.sin(2 * np.pi * t_days / 365.0 + phase)
+
+    # 가격 하락 이벤트 (할인 행사 등): 시작 시각, 하락폭 10~40%, 기간 1~14일
+    span = float(t_days[-1]) if t_days.size else 0.0
+    events = rng.poisson(drop_rate * span / 30.0)
+    if events:
+        starts = rng.uniform(0, span, events)
+        depths = rng.uniform(0.1, 0.4, events)
+        durations = rng.uniform(1, 14, events)
+        for start, depth, duration in zip(starts, depths, durations):
+            window = (t_days >= start) & (t_days < start + duration)
+            level[window] *= 1 - depth
+    return level
+
+
+def generate_keyword_rows(
+    rng: np.random.Generator,
+    keyword: str,
+    times: np.ndarray,
+    prices_per_snapshot: int,
+    trend_range: float,
+    seasonality: float,
+    drop_rate: float,
+):
+    """
+    키워드 하나의 모든 스냅샷을 한 번에 샘플링하여 저장용 행을 만듭니다.
+
+    Yields:
+        (keyword, taken_at, count, average, min, max, prices_bytes) 튜플
+    """
+    base = float(np.exp(rng.uniform(np.log(5000), np.log(2000000))))
+    trend = rng.uniform(-trend_range, trend_range)
+    t_days = (times - times[0]) / DAY
+    levels = price_levels(rng, t_days, base, trend, seasonality, drop_rate)
+
+    # 스냅샷별 가격: 로그정규 잡음 (스냅샷 수 x 가격 수), 10원 단위 반올림 후 정렬
+    n = max(1, int(rng.poisson(prices_per_snapshot)))
+    sigma = rng.uniform(0.2, 0.7)
+    noise = rng.lognormal(0.0, sigma, size=(times.size, n))
+    prices = np.rint(levels[:, None] * noise / 10) * 10
+    prices = np.clip(prices, MIN_PRICE, MAX_PRICE).astype(PRICE_DTYPE)
+    prices.sort(axis=1)
+
+    # 중복 제거 마스크 (scrape_prices 결과처럼 정렬된 고유 가격)
+    unique = np.ones(prices.shape, dtype=bool)
+    unique[:, 1:] = prices[:, 1:] != prices[:, :-1]
+    counts = unique.sum(axis=1)
+    sums = np.where(unique, prices, 0).sum(axis=1)
+    averages = sums / counts
+    minimums = prices[:, 0]
+    maximums = prices[:, -1]
+
+    for i in range(times.size):
+        row = prices[i] if counts[i] == n else prices[i][unique[i]]
+        yield (
+            keyword,
+            float(times[i]),
+            int(counts[i]),
+            float(averages[i]),
+            int(minimums[i]),
+            int(maximums[i]),
+            row.tobytes(),
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대용량 가격 히스토리 생성")
+    parser.add_argument("--db", default="snapshots.db", help="스냅샷 저장소 파일")
+    parser.add_argument("--keywords", type=int, default=100, help="키워드 개수")
+    parser.add_argument("--days", type=float, default=365, help="기간 (일)")
+    parser.add_argument("--interval-hours", type=float, default=24, help="스냅샷 간격 (시간)")
+    parser.add_argument("--prices", type=int, default=40, help="스냅샷당 평균 가격 개수")
+    parser.add_argument("--trend", type=float, default=0.2, help="연간 추세 최대 변화율 (±)")
+    parser.add_argument("--seasonality", type=float, default=0.05, help="계절 변동폭")
+    parser.add_argument("--drop-rate", type=float, default=1.0, help="30일당 평균 가격 하락 이벤트 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    store = SnapshotStore(args.db)
+    keywords = make_keywords(args.keywords)
+
+    end = time.time()
+    start = end - args.days * DAY
+    steps = max(1, int(args.days * 24 / args.interval_hours))
+    grid = start + np.arange(steps) * args.interval_hours * 3600
+
+    print(f"📊 {len(keywords)}개 키워드 x {steps}개 시점 = {len(keywords) * steps:,}개 스냅샷 생성 중...")
+    began = time.perf_counter()
+    total = 0
+
+    with store.bulk_load():
+        for i, keyword in enumerate(keywords, 1):
+            # 수집 시각에 약간의 흔들림 추가 (간격의 10% 이내)
+            jitter = rng.uniform(0, 0.1 * args.interval_hours * 3600, steps)
+            times = np.minimum(grid + jitter, end)
+            rows = generate_keyword_rows(
+                rng, keyword, times, args.prices, args.trend, args.seasonality, args.drop_rate
+            )
+            total += store.add_snapshots_bulk(rows)
+
+            if i % 100 == 0 or i == len(keywords):
+                elapsed = time.perf_counter() - began
+                print(f"  {i}/{len(keywords)} 키워드, {total:,}개 저장 ({total / elapsed:,.0f}개/초)")
+
+    print(f"✅ 완료: {args.db} (총 {store.count():,}개 스냅샷, {time.perf_counter() - began:.1f}초)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
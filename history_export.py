@@ -0,0 +1,236 @@
+"""
+스냅샷 기록 내보내기
+키워드와 기간으로 고른 스냅샷을 CSV, NDJSON 또는 Parquet(pyarrow가 설치된 경우) 바이트 조각으로 만듭니다.
+저장소에서 batch_size개씩 읽어 바로 변환하는 제너레이터이므로 가격이 수백만 개여도 메모리 사용량이 일정하고,
+첫 조각을 곧바로 보낼 수 있습니다 (웹 스트리밍 응답과 CLI 파일 출력에서 함께 사용).
+
+    SnapshotStore.iter_snapshots() → iter_export() → b"snapshot_id,keyword,taken_at,price\\n..." 조각들
+
+행 단위(level):
+    prices:    가격 하나당 한 행 (snapshot_id, keyword, taken_at, price)
+    snapshots: 스냅샷 하나당 한 행 (snapshot_id, keyword, taken_at, count, average, min, max)
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # 선택 의존성
+    pa = pq = None
+
+FORMATS = ("csv", "ndjson", "parquet")
+LEVELS = ("prices", "snapshots")
+
+COLUMNS = {
+    "prices": ("snapshot_id", "keyword", "taken_at", "price"),
+    "snapshots": ("snapshot_id", "keyword", "taken_at", "count", "average", "min", "max"),
+}
+
+MIMETYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# 한 번에 읽는 스냅샷 개수 (Parquet은 이 단위가 행 그룹 하나)
+DEFAULT_BATCH_SIZE = 500
+
+
+class ExportUnavailable(Exception):
+    """요청한 형식을 이 환경에서 쓸 수 없는 경우 (Parquet인데 pyarrow가 없음)"""
+
+
+def check_options(fmt: str, level: str = "prices"):
+    """
+    내보내기 형식과 행 단위를 확인합니다 (스트리밍을 시작하기 전에 오류를 알리기 위해 따로 호출).
+
+    Raises:
+        ValueError: 알 수 없는 형식 또는 행 단위
+        ExportUnavailable: Parquet인데 pyarrow가 설치되어 있지 않은 경우
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (가능: {', '.join(FORMATS)})")
+    if level not in LEVELS:
+        raise ValueError(f"지원하지 않는 행 단위: {level} (가능: {', '.join(LEVELS)})")
+    if fmt == "parquet" and pa is None:
+        raise ExportUnavailable("Parquet으로 내보내려면 pyarrow를 설치해야 합니다 (pip install pyarrow).")
+
+
+def iter_export(
+    store,
+    fmt: str = "csv",
+    keyword: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    level: str = "prices",
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[bytes]:
+    """
+    스냅샷 기록을 시간순으로 내보낼 바이트 조각 제너레이터를 만듭니다.
+    형식 확인은 바로 하고, 저장소 읽기는 첫 조각을 요청할 때 시작합니다.
+
+    Args:
+        store: SnapshotStore
+        fmt: "csv", "ndjson" 또는 "parquet"
+        keyword: 키워드 (None이면 전체)
+        start / end: 시각 범위 (Unix time, 포함)
+        level: 행 단위 ("prices" 또는 "snapshots")
+        batch_size: 한 번에 읽는 스냅샷 개수
+
+    Returns:
+        bytes 조각 이터레이터 (CSV는 머리글 행으로 시작, 빈 선택이면 머리글만)
+
+    Raises:
+        ValueError / ExportUnavailable: check_options()와 같음
+    """
+    check_options(fmt, level)
+    batches = store.iter_snapshots(keyword, start, end, batch_size=batch_size)
+    if fmt == "parquet":
+        return _iter_parquet(batches, level)
+    return _iter_text(batches, fmt, level)
+
+
+def _iter_text(batches: Iterable[List[Dict]], fmt: str, level: str) -> Iterator[bytes]:
+    if fmt == "csv":
+        yield (",".join(COLUMNS[level]) + "\n").encode("utf-8")
+    for batch in batches:
+        lines = []
+        for snapshot in batch:
+            if fmt == "csv":
+                prefix = f"{snapshot['id']},{_csv_field(snapshot['keyword'])},{snapshot['taken_at']!r}"
+            else:
+                prefix = (
+                    f'{{"snapshot_id":{snapshot["id"]},'
+                    f'"keyword":{json.dumps(snapshot["keyword"], ensure_ascii=False)},'
+                    f'"taken_at":{snapshot["taken_at"]!r}'
+                )
+            lines.extend(_rows(prefix, snapshot, fmt, level))
+        if lines:
+            yield "".join(lines).encode("utf-8")
+
+
+def _rows(prefix: str, snapshot: Dict, fmt: str, level: str) -> List[str]:
+    """스냅샷 하나의 CSV/NDJSON 줄 목록 (키워드 등 공통 앞부분은 스냅샷마다 한 번만 만듦)"""
+    if level == "prices":
+        if fmt == "csv":
+            return [f"{prefix},{price}\n" for price in snapshot["prices"].tolist()]
+        return [f'{prefix},"price":{price}}}\n' for price in snapshot["prices"].tolist()]
+
+    stats = snapshot["statistics"]
+    if fmt == "csv":
+        return [f"{prefix},{stats['count']},{stats['average']!r},{stats['min']},{stats['max']}\n"]
+    return [
+        f'{prefix},"count":{stats["count"]},"average":{stats["average"]!r},'
+        f'"min":{stats["min"]},"max":{stats["max"]}}}\n'
+    ]
+
+
+def _csv_field(text: str) -> str:
+    """CSV 규칙에 따라 필요한 경우에만 따옴표로 감쌉니다."""
+    buffer = io.StringIO()
+    csv.writer(buffer, lineterminator="").writerow([text])
+    return buffer.getvalue()
+
+
+class _ChunkSink:
+    """ParquetWriter가 쓴 바이트를 모아 두었다가 조각으로 꺼내는 쓰기 전용 파일 객체"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self):
+        pass
+
+    def writable(self) -> bool:
+        return True
+
+    def readable(self) -> bool:
+        return False
+
+    def seekable(self) -> bool:
+        return False
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _parquet_schema(level: str):
+    fields = [
+        ("snapshot_id", pa.int64()),
+        # 같은 키워드가 반복되므로 사전 인코딩
+        ("keyword", pa.dictionary(pa.int32(), pa.string())),
+        ("taken_at", pa.float64()),
+    ]
+    if level == "prices":
+        fields.append(("price", pa.int64()))
+    else:
+        fields += [("count", pa.int64()), ("average", pa.float64()), ("min", pa.int64()), ("max", pa.int64())]
+    return pa.schema(fields)
+
+
+def _parquet_table(batch: List[Dict], level: str, schema):
+    """스냅샷 묶음 하나를 Arrow 테이블(행 그룹 하나)로 변환합니다."""
+    keywords = list(dict.fromkeys(snapshot["keyword"] for snapshot in batch))
+    codes = {keyword: code for code, keyword in enumerate(keywords)}
+    ids = np.fromiter((snapshot["id"] for snapshot in batch), dtype=np.int64, count=len(batch))
+    taken = np.fromiter((snapshot["taken_at"] for snapshot in batch), dtype=np.float64, count=len(batch))
+    keyword_codes = np.fromiter(
+        (codes[snapshot["keyword"]] for snapshot in batch), dtype=np.int32, count=len(batch)
+    )
+
+    if level == "prices":
+        # 스냅샷 열을 가격 개수만큼 반복하여 가격 행으로 펼침
+        repeats = np.fromiter(
+            (len(snapshot["prices"]) for snapshot in batch), dtype=np.int64, count=len(batch)
+        )
+        ids, taken, keyword_codes = (np.repeat(column, repeats) for column in (ids, taken, keyword_codes))
+        extra = [np.concatenate([snapshot["prices"] for snapshot in batch]).astype(np.int64, copy=False)]
+    else:
+        extra = [
+            np.array([snapshot["statistics"][field] for snapshot in batch], dtype=dtype)
+            for field, dtype in (("count", np.int64), ("average", np.float64), ("min", np.int64), ("max", np.int64))
+        ]
+
+    keyword_column = pa.DictionaryArray.from_arrays(
+        pa.array(keyword_codes), pa.array(keywords, pa.string())
+    )
+    columns = [pa.array(ids), keyword_column, pa.array(taken)] + [pa.array(column) for column in extra]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _iter_parquet(batches: Iterable[List[Dict]], level: str) -> Iterator[bytes]:
+    schema = _parquet_schema(level)
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    try:
+        for batch in batches:
+            writer.write_table(_parquet_table(batch, level, schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        # 중간에 연결이 끊겨도 작성기를 닫아 자원을 정리 (이 경우 파일 끝 메타데이터는 보내지 못함)
+        writer.close()
+    yield sink.drain()
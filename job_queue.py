@@ -0,0 +1,315 @@
+"""
+수집 작업 대기열
+키워드 수집 작업을 SQLite 파일 하나에 보관하는 내구성 있는 대기열입니다 (별도 메시지 브로커 없음).
+여러 작업 프로세스(scrape_worker.py)가 같은 파일을 열어 작업을 임대(lease)하고, 끝나면 완료/실패를 기록합니다.
+
+    enqueue(키워드) → queued ─ lease() ─→ leased ─ complete() ─→ done
+                        ↑                  │  └── fail() ──────→ 다시 queued (지수 백오프) / failed (재시도 소진)
+                        └── 임대 만료 ──────┘  (작업 프로세스가 죽으면 visibility_timeout 뒤 다른 프로세스가 가져감)
+
+키워드마다 crc32 값을 저장해 두고 lease(shard=(i, n))는 crc32 % n == i인 작업만 가져가므로,
+작업 프로세스 n개가 같은 키워드를 나누어 맡고 같은 키워드의 응답 캐시도 한 프로세스에 모입니다.
+대기 중이거나 처리 중인 같은 키워드는 다시 넣지 않으므로 주기적으로 전체 목록을 넣어도 중복되지 않습니다.
+
+기본 WAL 모드는 공유 메모리(-shm) 파일을 쓰므로 한 호스트 안에서만 안전합니다.
+여러 호스트가 공유 파일 시스템의 같은 파일을 쓰려면 모든 프로세스가 journal_mode="DELETE"(롤백 저널)를 사용해야 합니다.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL,
+    shard_key INTEGER NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_expires_at REAL,
+    last_error TEXT,
+    snapshot_id INTEGER,
+    created_at REAL NOT NULL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_queued ON jobs (status, available_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_leased ON jobs (status, lease_expires_at);
+-- 대기 중이거나 처리 중인 키워드는 하나씩만
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_pending ON jobs (keyword) WHERE status IN ('queued', 'leased');
+"""
+
+STATUSES = ("queued", "leased", "done", "failed")
+
+
+def shard_key(keyword: str) -> int:
+    """키워드의 샤드 키 (crc32, 프로세스와 호스트가 달라도 같은 값)"""
+    return zlib.crc32(keyword.encode("utf-8"))
+
+
+def parse_shard(text: str) -> Tuple[int, int]:
+    """
+    "i/n" 형식의 샤드 지정을 (i, n)으로 변환합니다.
+
+    Raises:
+        ValueError: 형식이 틀렸거나 0 <= i < n이 아닌 경우
+    """
+    index, _, count = text.partition("/")
+    index, count = int(index), int(count)
+    if not 0 <= index < count:
+        raise ValueError(f"샤드는 0 <= i < n 이어야 합니다: {text}")
+    return index, count
+
+
+class JobQueue:
+    """SQLite 파일 기반의 수집 작업 대기열 클래스 (스레드 안전, 프로세스 간 공유)"""
+
+    def __init__(
+        self,
+        path: str = "jobs.db",
+        visibility_timeout: float = 120,
+        max_attempts: int = 3,
+        retry_delay: float = 30,
+        journal_mode: Optional[str] = None,
+    ):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (모든 작업 프로세스가 같은 경로 사용)
+            visibility_timeout: 임대 유효 시간 (초, 이 시간 안에 완료하지 못하면 다른 프로세스가 다시 가져감)
+            max_attempts: 최대 시도 횟수 (넘으면 failed로 남김)
+            retry_delay: 첫 재시도 전 대기 시간 (초, 이후 시도마다 두 배)
+            journal_mode: "WAL" 또는 "DELETE" (None이면 SQLITE_JOURNAL_MODE 환경 변수 또는 WAL,
+                          여러 호스트가 공유 파일 시스템에서 함께 쓰면 DELETE)
+        """
+        self.path = path
+        self.journal_mode = (journal_mode or os.environ.get("SQLITE_JOURNAL_MODE", "WAL")).upper()
+        if self.journal_mode not in ("WAL", "DELETE"):
+            raise ValueError(f"journal_mode는 WAL 또는 DELETE여야 합니다: {self.journal_mode}")
+        self.visibility_timeout = visibility_timeout
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self._local = threading.local()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환합니다 (fork로 물려받은 부모 프로세스의 연결은 쓰지 않음)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # 임대는 BEGIN IMMEDIATE로 직접 시작 (두 프로세스가 같은 작업을 가져가지 않도록)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            conn.execute("PRAGMA synchronous=" + ("NORMAL" if self.journal_mode == "WAL" else "FULL"))
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (예외가 나면 되돌림)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def enqueue(self, keywords: Iterable[str], delay: float = 0) -> int:
+        """
+        키워드 수집 작업을 추가합니다 (이미 대기 중이거나 처리 중인 키워드는 건너뜀).
+
+        Args:
+            keywords: 키워드 목록
+            delay: 처리 시작 전 대기 시간 (초)
+
+        Returns:
+            새로 추가된 작업 개수
+        """
+        now = time.time()
+        rows = [
+            (keyword, shard_key(keyword), now + delay, now)
+            for keyword in dict.fromkeys(k.strip() for k in keywords)
+            if keyword
+        ]
+        with self._transaction() as conn:
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO jobs (keyword, shard_key, available_at, created_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            return conn.total_changes - before
+
+    def lease(
+        self, owner: str, limit: int = 1, shard: Optional[Tuple[int, int]] = None
+    ) -> List[Dict]:
+        """
+        처리할 작업을 임대합니다.
+        대기 중이고 시작 시각이 지난 작업과, 임대가 만료된 작업(처리하던 프로세스가 죽은 경우)을 오래된 순으로 가져갑니다.
+
+        Args:
+            owner: 임대하는 작업자 식별자 (complete/fail 때 같은 값을 넘겨야 함)
+            limit: 최대 작업 개수
+            shard: (i, n)이면 crc32(키워드) % n == i인 작업만
+
+        Returns:
+            {"id", "keyword", "attempts"} 리스트 (attempts는 이번 시도를 포함한 횟수)
+        """
+        now = time.time()
+        shard_clause, shard_params = "", []
+        if shard is not None:
+            shard_clause = " AND shard_key % ? = ?"
+            shard_params = [shard[1], shard[0]]
+
+        with self._transaction() as conn:
+            # 임대가 만료된 작업 중 시도 횟수를 다 쓴 작업은 실패로 확정
+            conn.execute(
+                "UPDATE jobs SET status = 'failed', finished_at = ?, lease_owner = NULL, "
+                "last_error = COALESCE(last_error, '임대 시간 초과') "
+                "WHERE status = 'leased' AND lease_expires_at <= ? AND attempts >= ?",
+                (now, now, self.max_attempts),
+            )
+            rows = conn.execute(
+                "SELECT id FROM ("
+                f" SELECT id, available_at AS ready FROM jobs WHERE status = 'queued' AND available_at <= ?{shard_clause}"
+                " UNION ALL"
+                f" SELECT id, lease_expires_at AS ready FROM jobs WHERE status = 'leased' AND lease_expires_at <= ?{shard_clause}"
+                ") ORDER BY ready, id LIMIT ?",
+                [now, *shard_params, now, *shard_params, limit],
+            ).fetchall()
+            ids = [row["id"] for row in rows]
+            if not ids:
+                return []
+
+            placeholders = ",".join("?" * len(ids))
+            conn.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_expires_at = ?, attempts = attempts + 1 "
+                f"WHERE id IN ({placeholders})",
+                [owner, now + self.visibility_timeout, *ids],
+            )
+            leased = conn.execute(
+                f"SELECT id, keyword, attempts FROM jobs WHERE id IN ({placeholders}) ORDER BY id", ids
+            ).fetchall()
+        return [dict(row) for row in leased]
+
+    def extend(self, job_id: int, owner: str) -> bool:
+        """
+        처리 중인 작업의 임대를 visibility_timeout만큼 연장합니다 (오래 걸리는 작업용).
+
+        Returns:
+            연장했는지 여부 (임대가 이미 다른 작업자에게 넘어갔으면 False)
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires_at = ? WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time() + self.visibility_timeout, job_id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, job_id: int, owner: str, snapshot_id: Optional[int] = None) -> bool:
+        """
+        작업을 완료로 기록합니다.
+
+        Args:
+            job_id: 작업 id
+            owner: lease()에 넘긴 작업자 식별자
+            snapshot_id: 저장된 스냅샷 id (가격이 없었으면 None)
+
+        Returns:
+            기록했는지 여부 (임대가 만료되어 다른 작업자에게 넘어갔으면 False)
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET status = 'done', finished_at = ?, snapshot_id = ?, lease_owner = NULL "
+                "WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (time.time(), snapshot_id, job_id, owner),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, job_id: int, owner: str, error: str) -> Optional[str]:
+        """
+        작업 실패를 기록합니다. 시도 횟수가 남았으면 retry_delay * 2^(시도-1)초 뒤에 다시 처리합니다.
+
+        Args:
+            job_id: 작업 id
+            owner: lease()에 넘긴 작업자 식별자
+            error: 오류 메시지
+
+        Returns:
+            바뀐 상태 ("queued" 또는 "failed"), 임대가 이미 넘어갔으면 None
+        """
+        now = time.time()
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT attempts FROM jobs WHERE id = ? AND status = 'leased' AND lease_owner = ?",
+                (job_id, owner),
+            ).fetchone()
+            if row is None:
+                return None
+            if row["attempts"] >= self.max_attempts:
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', finished_at = ?, last_error = ?, lease_owner = NULL "
+                    "WHERE id = ?",
+                    (now, error, job_id),
+                )
+                return "failed"
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', available_at = ?, last_error = ?, lease_owner = NULL "
+                "WHERE id = ?",
+                (now + self.retry_delay * 2 ** (row["attempts"] - 1), error, job_id),
+            )
+            return "queued"
+
+    def counts(self) -> Dict[str, int]:
+        """상태별 작업 개수를 반환합니다."""
+        rows = self._connect().execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall()
+        counts = dict.fromkeys(STATUSES, 0)
+        counts.update({status: count for status, count in rows})
+        return counts
+
+    def failed(self, limit: int = 20) -> List[Dict]:
+        """최근 실패한 작업 목록 ({"id", "keyword", "attempts", "last_error", "finished_at"})"""
+        rows = self._connect().execute(
+            "SELECT id, keyword, attempts, last_error, finished_at FROM jobs WHERE status = 'failed' "
+            "ORDER BY finished_at DESC LIMIT ?",
+            (limit,),
+        ).fetchall()
+        return [dict(row) for row in rows]
+
+    def pending(self, shard: Optional[Tuple[int, int]] = None) -> int:
+        """아직 끝나지 않은 작업 개수 (queued + leased, shard를 주면 그 샤드만)"""
+        sql = "SELECT COUNT(*) FROM jobs WHERE status IN ('queued', 'leased')"
+        params: list = []
+        if shard is not None:
+            sql += " AND shard_key % ? = ?"
+            params = [shard[1], shard[0]]
+        return self._connect().execute(sql, params).fetchone()[0]
+
+    def purge(self, older_than: float) -> int:
+        """
+        끝난 지(done/failed) older_than초가 지난 작업 기록을 지웁니다.
+
+        Returns:
+            지운 작업 개수
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN ('done', 'failed') AND finished_at <= ?",
+                (time.time() - older_than,),
+            )
+        return cursor.rowcount
+
+    def close(self):
+        """현재 스레드의 연결을 닫습니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,181 @@
+"""
+검색 키워드 색인
+저장된 키워드를 정규화(공백 제거, 소문자, 한글 자모 분해)한 뒤 3글자 단위(trigram)로 색인하여
+"마우스", "무선마우스", "무선 마우수"(오타)처럼 비슷한 키워드를 밀리초 미만으로 찾습니다.
+
+    "무선 마우스" → "ㅁㅜㅅㅓㄴㅁㅏㅇㅜㅅㅡ" → {"ㅁㅜㅅ", "ㅜㅅㅓ", "ㅅㅓㄴ", ...}
+
+한글을 자모 단위로 나누므로 받침 하나가 틀린 오타도 대부분의 trigram이 그대로 일치합니다.
+색인 대상은 스냅샷이 아니라 고유 키워드이므로 스냅샷이 수십만 개여도 색인 크기는 키워드 개수에 비례합니다.
+"""
+
+import heapq
+import threading
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+NGRAM = 3
+
+# 한글 음절 → 호환 자모 (초성, 중성, 종성)
+_CHOSEONG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSEONG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSEONG = ["", *"ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"]
+_HANGUL_START = 0xAC00
+
+# str.translate로 한 번에 분해하기 위한 음절 11,172개 변환표
+_JAMO_TABLE = {
+    _HANGUL_START + index: _CHOSEONG[index // 588] + _JUNGSEONG[index // 28 % 21] + _JONGSEONG[index % 28]
+    for index in range(11172)
+}
+
+
+def normalize_keyword(keyword: str) -> str:
+    """
+    비교용 키워드를 만듭니다 (공백 제거, 소문자, 한글 음절을 자모로 분해).
+
+    Args:
+        keyword: 원래 키워드
+
+    Returns:
+        정규화된 문자열 (예: "무선 마우스" → "ㅁㅜㅅㅓㄴㅁㅏㅇㅜㅅㅡ")
+    """
+    text = unicodedata.normalize("NFC", keyword).lower()
+    return "".join(text.split()).translate(_JAMO_TABLE)
+
+
+def ngrams(normalized: str, n: int = NGRAM) -> Set[str]:
+    """정규화된 문자열의 n-gram 집합을 만듭니다 (n보다 짧으면 문자열 자체)."""
+    if len(normalized) <= n:
+        return {normalized} if normalized else set()
+    return {normalized[i:i + n] for i in range(len(normalized) - n + 1)}
+
+
+class KeywordIndex:
+    """고유 키워드의 trigram 역색인과 키워드별 스냅샷 개수, 최근 수집 시각을 보관하는 스레드 안전 클래스"""
+
+    def __init__(self, min_score: float = 0.5):
+        """
+        Args:
+            min_score: 결과에 포함할 최소 유사도 (검색어 trigram 중 키워드에 있는 비율, 0.0 ~ 1.0)
+        """
+        self.min_score = min_score
+        self._postings: Dict[str, Set[str]] = defaultdict(set)
+        self._normalized: Dict[str, str] = {}
+        self._gram_counts: Dict[str, int] = {}
+        self._stats: Dict[str, List] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._stats)
+
+    def add(self, keyword: str, snapshots: int = 1, last_taken_at: float = 0.0):
+        """
+        키워드를 색인에 추가하거나 스냅샷 개수와 최근 수집 시각을 갱신합니다.
+
+        Args:
+            keyword: 원래 키워드
+            snapshots: 추가된 스냅샷 개수
+            last_taken_at: 추가된 스냅샷 중 가장 최근 수집 시각
+        """
+        with self._lock:
+            stats = self._stats.get(keyword)
+            if stats is not None:
+                stats[0] += snapshots
+                stats[1] = max(stats[1], last_taken_at)
+                return
+            normalized = normalize_keyword(keyword)
+            self._stats[keyword] = [snapshots, last_taken_at]
+            self._normalized[keyword] = normalized
+            grams = ngrams(normalized)
+            self._gram_counts[keyword] = len(grams)
+            for gram in grams:
+                self._postings[gram].add(keyword)
+
+    def add_many(self, rows: Iterable[Tuple[str, int, float]]):
+        """(키워드, 스냅샷 개수, 최근 수집 시각) 여러 개를 추가합니다."""
+        for keyword, snapshots, last_taken_at in rows:
+            self.add(keyword, snapshots, last_taken_at)
+
+    def snapshots(self, keyword: str) -> int:
+        """키워드의 스냅샷 개수를 반환합니다."""
+        stats = self._stats.get(keyword)
+        return stats[0] if stats else 0
+
+    def top(self, limit: int) -> List[Dict]:
+        """
+        스냅샷이 많은(자주 검색된) 키워드를 순서대로 반환합니다.
+
+        Args:
+            limit: 최대 키워드 개수
+
+        Returns:
+            {"keyword", "snapshots", "last_taken_at"} 리스트 (스냅샷 개수, 최근 수집 시각 순)
+        """
+        with self._lock:
+            items = heapq.nsmallest(
+                limit, self._stats.items(), key=lambda item: (-item[1][0], -item[1][1], item[0])
+            )
+        return [
+            {"keyword": keyword, "snapshots": snapshots, "last_taken_at": last_taken_at}
+            for keyword, (snapshots, last_taken_at) in items
+        ]
+
+    def search(self, query: str, limit: Optional[int] = None) -> List[Dict]:
+        """
+        검색어와 비슷한 키워드를 순위대로 찾습니다.
+        정확히 같은 키워드 → 검색어를 포함하는 키워드 → 그 밖의 비슷한 키워드 순이며,
+        같은 순위 안에서는 trigram 유사도(Dice 계수), 최근 수집 시각 순입니다.
+
+        Args:
+            query: 검색어 (공백, 대소문자 무시)
+            limit: 최대 키워드 개수 (None이면 전체)
+
+        Returns:
+            {"keyword", "score", "snapshots", "last_taken_at"} 리스트
+            (score = 순위(2: 일치, 1: 포함, 0: 유사) + 유사도, 클수록 먼저)
+        """
+        normalized = normalize_keyword(query)
+        grams = ngrams(normalized)
+        if not grams:
+            return []
+
+        with self._lock:
+            if len(normalized) < NGRAM:
+                # trigram보다 짧은 검색어는 포함 여부로만 판단 (고유 키워드 개수만큼만 비교)
+                candidates = {kw: 1 for kw, norm in self._normalized.items() if normalized in norm}
+            else:
+                candidates: Dict[str, int] = defaultdict(int)
+                for gram in grams:
+                    for keyword in self._postings.get(gram, ()):
+                        candidates[keyword] += 1
+
+            results = []
+            for keyword, shared in candidates.items():
+                coverage = shared / len(grams)
+                if coverage < self.min_score:
+                    continue
+                target = self._normalized[keyword]
+                if target == normalized:
+                    rank = 2
+                elif normalized in target:
+                    rank = 1
+                else:
+                    rank = 0
+                # 같은 순위에서는 검색어와 길이가 비슷한 키워드를 우선 (Dice 계수)
+                score = 2 * shared / (len(grams) + self._gram_counts[keyword])
+                snapshots, last_taken_at = self._stats[keyword]
+                results.append((rank, round(score, 4), last_taken_at, keyword, snapshots))
+
+        results.sort(key=lambda item: (-item[0], -item[1], -item[2], item[3]))
+        if limit is not None:
+            results = results[:limit]
+        return [
+            {
+                "keyword": keyword,
+                "score": rank + score,
+                "snapshots": snapshots,
+                "last_taken_at": last_taken_at,
+            }
+            for rank, score, last_taken_at, keyword, snapshots in results
+        ]
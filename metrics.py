@@ -0,0 +1,298 @@
+"""
+성능 측정 지표 (Prometheus 텍스트 형식)
+크롤링 → 분석 → 저장 파이프라인의 단계별 소요 시간과 처리량을 기록합니다.
+"""
+
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, List, Sequence, Tuple
+
+# 기본 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+def _escape(value: str) -> str:
+    """레이블 값의 특수문자를 이스케이프합니다."""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """레이블 이름과 값으로 {name="value"} 문자열을 만듭니다."""
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _CounterValue:
+    """레이블 조합 하나에 대한 카운터 값"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    def get(self) -> float:
+        return self._value
+
+
+class _GaugeValue:
+    """레이블 조합 하나에 대한 게이지 값"""
+
+    def __init__(self):
+        self._value = 0.0
+        self._function = None
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self._value += amount
+
+    def dec(self, amount: float = 1):
+        with self._lock:
+            self._value -= amount
+
+    def set(self, value: float):
+        self._value = value
+
+    def set_function(self, function: Callable[[], float]):
+        """출력 시점에 값을 계산할 함수를 지정합니다."""
+        self._function = function
+
+    @contextmanager
+    def track_inprogress(self):
+        """블록 안에 있는 동안 값을 1 증가시킵니다."""
+        self.inc()
+        try:
+            yield
+        finally:
+            self.dec()
+
+    def get(self) -> float:
+        if self._function is not None:
+            return self._function()
+        return self._value
+
+
+class _HistogramValue:
+    """레이블 조합 하나에 대한 히스토그램 값"""
+
+    def __init__(self, buckets: Tuple[float, ...]):
+        self._buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect.bisect_left(self._buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self):
+        """블록 실행 시간을 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def get(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self._counts), self._sum
+
+
+class _Metric:
+    """레이블별 값을 관리하는 지표의 공통 부모 클래스"""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), registry=None):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children = {}
+        self._lock = threading.Lock()
+        (registry or REGISTRY).register(self)
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def labels(self, *values: str):
+        """레이블 값 조합에 해당하는 값 객체를 반환합니다."""
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name}: 레이블 개수가 맞지 않습니다 {self.labelnames}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _items(self):
+        with self._lock:
+            return sorted(self._children.items())
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for values, child in self._items():
+            lines.append(
+                f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.get())}"
+            )
+        return lines
+
+
+class Counter(_Metric):
+    """누적 증가하는 지표"""
+
+    type_name = "counter"
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric):
+    """증가와 감소가 가능한 현재 값 지표"""
+
+    type_name = "gauge"
+
+    def _new_child(self):
+        return _GaugeValue()
+
+    def set(self, value: float):
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]):
+        self.labels().set_function(function)
+
+
+class Histogram(_Metric):
+    """구간별 관측 횟수를 기록하는 지표"""
+
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets=DEFAULT_BUCKETS, registry=None):
+        self.buckets = tuple(sorted(buckets))
+        super().__init__(name, documentation, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def render(self) -> List[str]:
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        for values, child in self._items():
+            counts, total = child.get()
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, values, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class Registry:
+    """지표 목록을 보관하고 Prometheus 텍스트 형식으로 출력하는 클래스"""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric):
+        with self._lock:
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+# 파이프라인 공통 지표
+STAGE_LATENCY = Histogram(
+    "price_pipeline_stage_duration_seconds",
+    "Time spent in each scrape/analyze/persist pipeline stage.",
+    ["stage"],
+)
+STAGE_IN_FLIGHT = Gauge(
+    "price_pipeline_stage_in_flight",
+    "Number of pipeline stages currently running.",
+    ["stage"],
+)
+PRICES_EXTRACTED = Counter(
+    "price_pipeline_prices_extracted_total",
+    "Price strings matched by the extraction regex.",
+)
+PRICES_FILTERED = Counter(
+    "price_pipeline_prices_filtered_total",
+    "Extracted prices dropped during cleaning.",
+    ["reason"],
+)
+CACHE_REQUESTS = Counter(
+    "price_cache_requests_total",
+    "Cache lookups by cache name and result (hit/miss).",
+    ["cache", "result"],
+)
+SOURCE_REQUESTS = Counter(
+    "price_source_requests_total",
+    "Price source collections by source and outcome (ok/error/timeout).",
+    ["source", "outcome"],
+)
+SOURCE_LATENCY = Histogram(
+    "price_source_duration_seconds",
+    "Time spent collecting prices from each source.",
+    ["source"],
+)
+
+
+@contextmanager
+def stage_timer(stage: str):
+    """
+    파이프라인 단계 하나의 소요 시간과 실행 중인 개수를 기록합니다.
+
+    Args:
+        stage: 단계 이름 (fetch, parse, extract, filter, analyze, histogram, persist 등)
+    """
+    in_flight = STAGE_IN_FLIGHT.labels(stage)
+    in_flight.inc()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_LATENCY.labels(stage).observe(time.perf_counter() - start)
+        in_flight.dec()
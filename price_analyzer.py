@@ -1,258 +1,395 @@
-import requests
-from bs4 import BeautifulSoup
-import re
-import matplotlib.pyplot as plt
-import matplotlib.font_manager as fm
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import tkinter as tk
-from tkinter import scrolledtext, messagebox
-import pickle
+from tkinter import scrolledtext, messagebox, ttk
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor
 import threading
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
+
+# 수집기, 분석기, 시각화 도구는 CLI/웹과 함께 쓰는 핵심 엔진에서 가져옴 (기존 import 경로 호환)
+from price_engine import (
+    DataAnalyzer,
+    PipelineCancelled,
+    PricePipeline,
+    PriceScraper,
+    Visualizer,
+)
+
+
+class VirtualPriceList(tk.Frame):
+    """
+    가격 목록을 보이는 줄만큼의 Treeview 행으로 표시하는 위젯
+    수만 개의 가격도 행을 모두 만들지 않고, 스크롤할 때 보이는 행의 값만 바꿉니다.
+    """
+
+    COLUMNS = (("rank", "순위", 70), ("price", "가격 (원)", 150), ("diff", "평균 대비", 150))
+
+    def __init__(self, master, **kwargs):
+        super().__init__(master, **kwargs)
+        self.prices: List[int] = []
+        self.average = 0.0
+        self.offset = 0
+        self.visible_rows = 0
+
+        self.tree = ttk.Treeview(
+            self, columns=[c[0] for c in self.COLUMNS], show="headings", selectmode="none"
+        )
+        for name, title, width in self.COLUMNS:
+            self.tree.heading(name, text=title)
+            self.tree.column(name, width=width, anchor=tk.E)
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        self.tree.bind("<Configure>", self._on_resize)
+        for widget in (self.tree, self.scrollbar):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda e: self.scroll_to(self.offset - 3))
+            widget.bind("<Button-5>", lambda e: self.scroll_to(self.offset + 3))
+
+    def set_prices(self, prices: List[int]):
+        """표시할 가격 리스트를 바꾸고 맨 위로 이동합니다."""
+        self.prices = prices
+        self.average = sum(prices) / len(prices) if prices else 0.0
+        self.offset = 0
+        self._render()
+
+    def scroll_to(self, offset: int):
+        """첫 번째로 보이는 가격의 위치를 바꿉니다."""
+        last = max(0, len(self.prices) - self.visible_rows)
+        offset = max(0, min(int(offset), last))
+        if offset != self.offset:
+            self.offset = offset
+            self._render()
+
+    def _row_height(self) -> int:
+        style = ttk.Style(self)
+        return int(style.lookup("Treeview", "rowheight") or 20)
+
+    def _on_resize(self, event):
+        # 제목 행을 제외하고 보이는 줄 수만큼만 행을 유지
+        rows = max(1, event.height // self._row_height() - 1)
+        if rows != self.visible_rows:
+            self.visible_rows = rows
+            self.offset = max(0, min(self.offset, len(self.prices) - rows))
+            self._render()
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.scroll_to(round(float(amount) * len(self.prices)))
+        elif action == "scroll":
+            step = self.visible_rows if unit == "pages" else 1
+            self.scroll_to(self.offset + int(amount) * step)
+
+    def _on_wheel(self, event):
+        self.scroll_to(self.offset - (3 if event.delta > 0 else -3))
+
+    def _render(self):
+        """보이는 구간의 값만 기존 행에 채웁니다 (행 개수는 보이는 줄 수로 고정)."""
+        rows = self.tree.get_children()
+        window = self.prices[self.offset:self.offset + self.visible_rows]
+
+        # 보이는 줄 수에 맞게 행 추가/삭제
+        if len(rows) > len(window):
+            self.tree.delete(*rows[len(window):])
+            rows = rows[:len(window)]
+        while len(rows) < len(window):
+            rows += (self.tree.insert("", tk.END),)
+
+        for i, (row, price) in enumerate(zip(rows, window), self.offset + 1):
+            self.tree.item(row, values=(f"{i:,}", f"{price:,}", f"{price - self.average:+,.0f}"))
+
+        total = len(self.prices)
+        if total:
+            self.scrollbar.set(self.offset / total, (self.offset + len(window)) / total)
+        else:
+            self.scrollbar.set(0, 1)
 
 
-class PriceScraper:
-    """다나와 웹사이트에서 가격 데이터를 크롤링하는 클래스"""
+def _button(master, text: str, command, color: str, **kwargs) -> tk.Button:
+    """공통 스타일 버튼을 만듭니다."""
+    return tk.Button(
+        master,
+        text=text,
+        command=command,
+        bg=color,
+        fg="white",
+        font=("Arial", 11, "bold"),
+        padx=10,
+        **kwargs,
+    )
 
-    def __init__(self):
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        self.base_url = "http://search.danawa.com/dsearch.php"
-        self.min_price = 1000
-        self.max_price = 100000000
 
-    def scrape_prices(self, keyword: str) -> List[int]:
-        """
-        특정 키워드로 다나와를 검색하고 가격 데이터를 수집합니다.
+class SearchSession(tk.Frame):
+    """
+    검색 탭 하나를 담당하는 클래스
+    키워드, 수집 결과, 진행 상태, 취소 토큰을 탭마다 따로 보관합니다.
+    """
 
-        Args:
-            keyword: 검색할 상품 키워드
+    def __init__(self, master, gui: "PriceAnalyzerGUI"):
+        super().__init__(master)
+        self.gui = gui
 
-        Returns:
-            수집된 가격 리스트 (정수형)
-        """
-        prices = []
+        # 탭별 데이터
+        self.keyword = ""
+        self.prices: List[int] = []
+        self.statistics: Dict = {}
 
-        try:
-            # 검색 요청
-            params = {"query": keyword, "tab": "goods"}
+        # 수집 작업 상태 (취소 토큰, 스레드 풀 작업)
+        self.cancel_event: Optional[threading.Event] = None
+        self.future: Optional[Future] = None
 
-            response = requests.get(
-                self.base_url, params=params, headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
+        # 결과가 바뀔 때마다 증가하는 데이터셋 번호와 현재 데이터셋으로 한 번만 그린 차트
+        self.dataset_id = 0
+        self._chart_id = None
+        self._chart: Optional[FigureCanvasTkAgg] = None
 
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, "html.parser")
+        self._setup_widgets()
 
-            # 가격 데이터 추출 (정규표현식 사용)
-            price_pattern = r"(\d[\d,]*)\s*원"
-            text_content = soup.get_text()
+    @property
+    def running(self) -> bool:
+        """수집 작업이 진행 중인지 여부"""
+        return self.future is not None and not self.future.done()
 
-            # 모든 가격 패턴 찾기
-            matches = re.findall(price_pattern, text_content)
+    def _setup_widgets(self):
+        """탭 안의 레이아웃을 구성합니다."""
 
-            # 리스트 함축을 사용한 데이터 정제
-            prices = [
-                int(match.replace(",", ""))
-                for match in matches
-                if self._is_valid_price(match)
-            ]
+        # 상단: 진행 상태
+        status_frame = tk.Frame(self, pady=5)
+        status_frame.pack(fill=tk.X, padx=5)
 
-            # 중복 제거 및 정렬
-            prices = sorted(list(set(prices)))
+        self.status_label = tk.Label(status_frame, text="대기 중", font=("Arial", 10), width=24, anchor=tk.W)
+        self.status_label.pack(side=tk.LEFT)
 
-        except requests.exceptions.RequestException as e:
-            print(f"네트워크 오류 발생: {e}")
-            raise Exception(f"크롤링 중 네트워크 오류가 발생했습니다: {str(e)}")
-        except Exception as e:
-            print(f"데이터 파싱 오류: {e}")
-            raise Exception(f"데이터 파싱 중 오류가 발생했습니다: {str(e)}")
+        self.progress = ttk.Progressbar(status_frame, maximum=100, length=200)
+        self.progress.pack(side=tk.LEFT, padx=5)
 
-        return prices
+        self.cancel_btn = _button(status_frame, "취소", self.cancel, "#757575", state=tk.DISABLED)
+        self.cancel_btn.pack(side=tk.LEFT, padx=5)
 
-    def _is_valid_price(self, price_str: str) -> bool:
-        """
-        가격이 유효한 범위 내에 있는지 확인합니다.
+        # 중단: 결과 표시 영역 (왼쪽: 통계와 가격 목록, 오른쪽: 그래프)
+        middle_frame = tk.PanedWindow(self, orient=tk.HORIZONTAL, sashwidth=6)
+        middle_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
 
-        Args:
-            price_str: 쉼표가 포함된 가격 문자열
+        left_frame = tk.Frame(middle_frame)
+        tk.Label(
+            left_frame, text="수집 결과 및 통계:", font=("Arial", 11, "bold")
+        ).pack(anchor=tk.W)
 
-        Returns:
-            유효 여부
-        """
-        try:
-            price = int(price_str.replace(",", ""))
-            return self.min_price <= price <= self.max_price
-        except ValueError:
-            return False
+        self.result_text = scrolledtext.ScrolledText(
+            left_frame, width=60, height=11, font=("Courier", 10), wrap=tk.WORD
+        )
+        self.result_text.pack(fill=tk.X, pady=5)
 
+        tk.Label(left_frame, text="전체 가격 목록:", font=("Arial", 11, "bold")).pack(
+            anchor=tk.W
+        )
+        self.price_list = VirtualPriceList(left_frame)
+        self.price_list.pack(fill=tk.BOTH, expand=True, pady=5)
+        middle_frame.add(left_frame, minsize=380)
 
-class DataAnalyzer:
-    """가격 데이터의 통계 분석을 수행하는 클래스"""
+        self.chart_frame = tk.Frame(middle_frame, bg="white")
+        middle_frame.add(self.chart_frame, minsize=300)
 
-    @staticmethod
-    def calculate_statistics(prices: List[int]) -> Dict[str, float]:
-        """
-        가격 리스트의 통계를 계산합니다.
+        # 하단: 탭별 기능 버튼
+        bottom_frame = tk.Frame(self, pady=5)
+        bottom_frame.pack(fill=tk.X, padx=5)
 
-        Args:
-            prices: 가격 데이터 리스트
+        self.graph_btn = _button(bottom_frame, "그래프 보기", self.show_graph, "#2196F3", state=tk.DISABLED)
+        self.graph_btn.pack(side=tk.LEFT, padx=5)
 
-        Returns:
-            통계 정보 딕셔너리 (평균, 최대, 최소, 개수)
-        """
-        if not prices:
-            return {"average": 0, "max": 0, "min": 0, "count": 0}
-
-        return {
-            "average": sum(prices) / len(prices),
-            "max": max(prices),
-            "min": min(prices),
-            "count": len(prices),
-        }
-
-    @staticmethod
-    def save_results(data: Dict, filename: str = None):
-        """
-        분석 결과를 pickle 파일로 저장합니다.
-
-        Args:
-            data: 저장할 데이터
-            filename: 저장할 파일명 (None이면 자동 생성)
-        """
-        try:
-            # 파일명이 지정되지 않은 경우 자동 생성
-            if filename is None:
-                from datetime import datetime
-
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                keyword = data.get("keyword", "unknown")
-                # 파일명에 사용할 수 없는 문자 제거
-                safe_keyword = "".join(
-                    c for c in keyword if c.isalnum() or c in (" ", "_")
-                ).strip()
-                safe_keyword = safe_keyword.replace(" ", "_")[:20]  # 최대 20자로 제한
-                filename = f"result_{safe_keyword}_{timestamp}.pkl"
-
-            with open(filename, "wb") as f:
-                pickle.dump(data, f)
-
-            return filename  # 저장된 파일명 반환
-        except Exception as e:
-            print(f"파일 저장 오류: {e}")
-            raise
+        self.save_btn = _button(bottom_frame, "결과 저장", self.save_results, "#FF9800", state=tk.DISABLED)
+        self.save_btn.pack(side=tk.LEFT, padx=5)
 
-    @staticmethod
-    def load_results(filename: str = "last_result.pkl") -> Optional[Dict]:
-        """
-        pickle 파일에서 분석 결과를 불러옵니다.
+    def set_text(self, lines: List[str]):
+        """결과 텍스트 영역을 한 번에 바꿉니다."""
+        self.result_text.delete(1.0, tk.END)
+        self.result_text.insert(tk.END, "\n".join(lines) + "\n")
+
+    def begin(self, keyword: str, cancel_event: threading.Event):
+        """새 수집 작업을 시작한 상태로 바꿉니다."""
+        self.keyword = keyword
+        self.cancel_event = cancel_event
+        self.set_text(
+            [f"'{keyword}' 검색 중...", "데이터를 수집하고 있습니다. 잠시만 기다려주세요..."]
+        )
+        self.set_progress("대기 중 (작업 순서 기다리는 중)", 0)
+        self.cancel_btn.config(state=tk.NORMAL)
+        self.gui.update_tab_title(self, "⏳")
 
-        Args:
-            filename: 불러올 파일명
+    def set_progress(self, status: str, value: float, token: Optional[threading.Event] = None):
+        """진행 상태를 표시합니다 (취소되었거나 이전 작업의 알림이면 무시)."""
+        if token is not None and (token is not self.cancel_event or token.is_set()):
+            return
+        self.status_label.config(text=status)
+        self.progress.config(value=value)
+
+    def _finish(self, status: str, value: float, mark: str):
+        self.set_progress(status, value)
+        self.cancel_btn.config(state=tk.DISABLED)
+        self.gui.update_tab_title(self, mark)
+
+    def show_results(
+        self, prices: List[int], statistics: Dict, token: Optional[threading.Event] = None
+    ):
+        """수집 결과를 탭에 표시합니다."""
+        if token is not None and (token is not self.cancel_event or token.is_set()):
+            return
 
-        Returns:
-            저장된 데이터 또는 None
-        """
-        try:
-            with open(filename, "rb") as f:
-                return pickle.load(f)
-        except FileNotFoundError:
-            print("저장된 결과 파일이 없습니다.")
-            return None
-        except Exception as e:
-            print(f"파일 불러오기 오류: {e}")
-            return None
+        self.prices = prices
+        self.statistics = statistics
+        self.dataset_id += 1
+        self.price_list.set_prices(prices)
+        self._hide_chart()
+
+        if not prices:
+            lines = [
+                "수집된 가격 데이터가 없습니다.",
+                "다른 키워드로 다시 시도해보세요.",
+            ]
+            self.graph_btn.config(state=tk.DISABLED)
+            self.save_btn.config(state=tk.DISABLED)
+        else:
+            stats = statistics
+            # 결과 텍스트를 모아서 한 번에 출력 (전체 가격은 아래 목록에 표시)
+            lines = [
+                "=" * 60,
+                f"검색 키워드: {self.keyword}",
+                "=" * 60,
+                "",
+                "📊 통계 분석 결과",
+                "-" * 60,
+                f"수집된 가격 개수: {stats['count']:,}개",
+                f"평균 가격: {stats['average']:,.0f}원",
+                f"최고 가격: {stats['max']:,}원",
+                f"최저 가격: {stats['min']:,}원",
+                f"가격 범위: {stats['max'] - stats['min']:,}원",
+                "-" * 60,
+            ]
+
+            # 버튼 활성화
+            self.graph_btn.config(state=tk.NORMAL)
+            self.save_btn.config(state=tk.NORMAL)
 
+        self.set_text(lines)
+        self._finish(f"완료 ({len(prices):,}개)", 100, "✅")
 
-class Visualizer:
-    """데이터 시각화를 담당하는 클래스"""
+    def show_error(self, error_msg: str, token: Optional[threading.Event] = None):
+        """오류 메시지를 표시합니다."""
+        if token is not None and (token is not self.cancel_event or token.is_set()):
+            return
+        self.result_text.insert(tk.END, f"\n오류 발생: {error_msg}\n")
+        self._finish("오류", 0, "❌")
+        messagebox.showerror("오류", f"[{self.keyword}] {error_msg}")
+
+    def cancel(self):
+        """진행 중인 수집 작업을 취소합니다 (이미 받은 응답은 버림)."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+        if self.cancel_btn.cget("state") == tk.NORMAL:
+            self.result_text.insert(tk.END, "\n수집을 취소했습니다.\n")
+            self._finish("취소됨", 0, "⛔")
 
-    def __init__(self):
-        self._setup_korean_font()
+    def show_graph(self):
+        """히스토그램을 오른쪽 영역에 표시합니다 (데이터셋마다 한 번만 그림)."""
+        if not self.prices:
+            messagebox.showwarning("경고", "표시할 데이터가 없습니다.")
+            return
 
-    def _setup_korean_font(self):
-        """한글 깨짐 방지를 위한 폰트 설정"""
-        try:
-            # macOS용 한글 폰트 설정
-            plt.rcParams["font.family"] = "AppleGothic"
-            plt.rcParams["axes.unicode_minus"] = False
-        except:
+        if self._chart_id != self.dataset_id:
             try:
-                # Windows용 한글 폰트 설정
-                plt.rcParams["font.family"] = "Malgun Gothic"
-                plt.rcParams["axes.unicode_minus"] = False
-            except:
-                print("한글 폰트 설정 실패. 기본 폰트를 사용합니다.")
-
-    def plot_histogram(self, prices: List[int], keyword: str):
-        """
-        가격 분포 히스토그램을 그립니다.
-
-        Args:
-            prices: 가격 데이터 리스트
-            keyword: 검색 키워드
-        """
-        if not prices:
-            messagebox.showwarning("경고", "시각화할 데이터가 없습니다.")
-            return
+                figure = self.gui.visualizer.create_histogram_figure(self.prices, self.keyword)
+            except Exception as e:
+                messagebox.showerror(
+                    "오류", f"그래프 생성 중 오류가 발생했습니다: {str(e)}"
+                )
+                return
+            self._destroy_chart()
+            self._chart = FigureCanvasTkAgg(figure, master=self.chart_frame)
+            self._chart.draw()
+            self._chart_id = self.dataset_id
 
-        try:
-            plt.figure(figsize=(10, 6))
-
-            # 히스토그램 생성
-            plt.hist(prices, bins=20, color="skyblue", edgecolor="black", alpha=0.7)
-
-            # 차트 설정
-            plt.title(f"Price Distribution - {keyword}", fontsize=16, fontweight="bold")
-            plt.xlabel("가격 (원)", fontsize=12)
-            plt.ylabel("빈도", fontsize=12)
-            plt.grid(axis="y", alpha=0.3)
-
-            # 통계선 추가
-            avg_price = sum(prices) / len(prices)
-            plt.axvline(
-                avg_price,
-                color="red",
-                linestyle="--",
-                linewidth=2,
-                label=f"평균: {avg_price:,.0f}원",
-            )
-            plt.legend()
+        self._chart.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
-            # 가격 포맷팅
-            ax = plt.gca()
-            ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"{int(x):,}"))
+    def _hide_chart(self):
+        """표시 중인 차트를 숨깁니다 (같은 데이터셋이면 다시 그리지 않고 재사용)."""
+        if self._chart is not None:
+            self._chart.get_tk_widget().pack_forget()
 
-            plt.tight_layout()
-            plt.show()
+    def _destroy_chart(self):
+        if self._chart is not None:
+            self._chart.get_tk_widget().destroy()
+            self._chart = None
+            self._chart_id = None
 
-        except Exception as e:
-            print(f"시각화 오류: {e}")
-            messagebox.showerror(
-                "오류", f"그래프 생성 중 오류가 발생했습니다: {str(e)}"
+    def save_results(self):
+        """현재 탭의 결과를 파일로 저장합니다."""
+        if not self.prices:
+            messagebox.showwarning("경고", "저장할 데이터가 없습니다.")
+            return
+
+        try:
+            data = {
+                "keyword": self.keyword,
+                "prices": self.prices,
+                "statistics": self.statistics,
+            }
+
+            # 자동으로 고유한 파일명 생성
+            saved_filename = self.gui.analyzer.save_results(data)
+            messagebox.showinfo(
+                "성공", f"결과가 '{saved_filename}' 파일로 저장되었습니다."
             )
+        except Exception as e:
+            messagebox.showerror("오류", f"저장 중 오류가 발생했습니다: {str(e)}")
+
+    def dispose(self):
+        """탭을 닫기 전에 작업을 취소하고 차트를 정리합니다."""
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+        if self.future is not None:
+            self.future.cancel()
+        self._destroy_chart()
+        self.destroy()
 
 
 class PriceAnalyzerGUI:
-    """전체 기능을 통합하는 GUI 클래스"""
+    """전체 기능을 통합하는 GUI 클래스 (검색마다 탭 하나)"""
+
+    # 동시에 수집할 최대 키워드 개수
+    MAX_WORKERS = 4
+    # 작업 스레드 알림을 GUI에 반영하는 간격 (ms)과 한 번에 처리할 최대 알림 수
+    DISPATCH_INTERVAL_MS = 50
+    DISPATCH_BATCH = 100
 
     def __init__(self, root: tk.Tk):
         self.root = root
         self.root.title("상품 가격 분석 및 추적 시스템")
-        self.root.geometry("700x600")
+        self.root.geometry("1100x700")
 
         # 컴포넌트 초기화
-        self.scraper = PriceScraper()
+        self.scraper = PriceScraper(verbose=False)
         self.analyzer = DataAnalyzer()
         self.visualizer = Visualizer()
 
-        # 데이터 저장 변수
-        self.current_prices = []
-        self.current_keyword = ""
+        # 탭에서는 수집과 분석만 수행 (저장은 "결과 저장" 버튼, 차트는 "그래프 보기"에서 처리)
+        self.pipeline = PricePipeline(scraper=self.scraper, analyzer=self.analyzer)
+
+        # 모든 탭이 함께 쓰는 작업 스레드 풀과 GUI 알림 큐
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.MAX_WORKERS, thread_name_prefix="collector"
+        )
+        self.events: "queue.Queue" = queue.Queue()
 
         # GUI 구성
         self._setup_gui()
+        self.new_session()
+
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.root.after(self.DISPATCH_INTERVAL_MS, self._dispatch_events)
 
     def _setup_gui(self):
         """GUI 레이아웃을 구성합니다."""
@@ -269,192 +406,112 @@ class PriceAnalyzerGUI:
         self.keyword_entry.pack(side=tk.LEFT, padx=5)
         self.keyword_entry.bind("<Return>", lambda e: self.start_collection())
 
-        self.collect_btn = tk.Button(
-            top_frame,
-            text="수집 시작",
-            command=self.start_collection,
-            bg="#4CAF50",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            padx=10,
-        )
-        self.collect_btn.pack(side=tk.LEFT, padx=5)
+        _button(top_frame, "수집 시작", self.start_collection, "#4CAF50").pack(side=tk.LEFT, padx=5)
+
+        _button(top_frame, "탭 닫기", self.close_session, "#F44336").pack(side=tk.RIGHT, padx=5)
+        _button(top_frame, "결과 불러오기", self.load_results, "#9C27B0").pack(side=tk.RIGHT, padx=5)
+        _button(top_frame, "새 탭", self.new_session, "#607D8B").pack(side=tk.RIGHT, padx=5)
+
+        # 검색 탭 영역
+        self.notebook = ttk.Notebook(self.root)
+        self.notebook.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+
+    # ---- 탭 관리 ----
+
+    def new_session(self) -> SearchSession:
+        """빈 검색 탭을 추가하고 선택합니다."""
+        session = SearchSession(self.notebook, self)
+        self.notebook.add(session, text="새 검색")
+        self.notebook.select(session)
+        return session
+
+    def current_session(self) -> Optional[SearchSession]:
+        """선택된 탭을 반환합니다."""
+        selected = self.notebook.select()
+        return self.notebook.nametowidget(selected) if selected else None
+
+    def _idle_session(self) -> SearchSession:
+        """선택된 탭이 비어 있으면 그 탭을, 아니면 새 탭을 반환합니다."""
+        session = self.current_session()
+        if session is None or session.running or session.keyword:
+            session = self.new_session()
+        return session
+
+    def update_tab_title(self, session: SearchSession, mark: str = ""):
+        """탭 제목을 '상태 표시 + 키워드'로 바꿉니다."""
+        title = session.keyword if len(session.keyword) <= 15 else session.keyword[:14] + "…"
+        self.notebook.tab(session, text=f"{mark} {title}".strip() or "새 검색")
+
+    def close_session(self):
+        """선택된 탭을 닫습니다 (진행 중인 작업은 취소)."""
+        session = self.current_session()
+        if session is None:
+            return
+        self.notebook.forget(session)
+        session.dispose()
+        if not self.notebook.tabs():
+            self.new_session()
 
-        # 중단 프레임: 결과 표시 영역
-        middle_frame = tk.Frame(self.root)
-        middle_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+    # ---- 작업 스레드 → GUI 알림 ----
 
-        tk.Label(
-            middle_frame, text="수집 결과 및 통계:", font=("Arial", 11, "bold")
-        ).pack(anchor=tk.W)
+    def post(self, callback: Callable, *args):
+        """작업 스레드에서 GUI 갱신을 요청합니다 (메인 스레드에서 순서대로 실행)."""
+        self.events.put((callback, args))
 
-        self.result_text = scrolledtext.ScrolledText(
-            middle_frame, width=80, height=20, font=("Courier", 10), wrap=tk.WORD
-        )
-        self.result_text.pack(fill=tk.BOTH, expand=True, pady=5)
-
-        # 하단 프레임: 기능 버튼들
-        bottom_frame = tk.Frame(self.root, pady=10)
-        bottom_frame.pack(fill=tk.X, padx=10)
-
-        self.graph_btn = tk.Button(
-            bottom_frame,
-            text="그래프 보기",
-            command=self.show_graph,
-            bg="#2196F3",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            padx=10,
-            state=tk.DISABLED,
-        )
-        self.graph_btn.pack(side=tk.LEFT, padx=5)
-
-        self.save_btn = tk.Button(
-            bottom_frame,
-            text="결과 저장",
-            command=self.save_results,
-            bg="#FF9800",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            padx=10,
-            state=tk.DISABLED,
-        )
-        self.save_btn.pack(side=tk.LEFT, padx=5)
+    def _dispatch_events(self):
+        """쌓인 알림을 메인 스레드에서 처리하고 다음 확인을 예약합니다."""
+        self.root.after(self.DISPATCH_INTERVAL_MS, self._dispatch_events)
+        for _ in range(self.DISPATCH_BATCH):
+            try:
+                callback, args = self.events.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback(*args)
+            except tk.TclError:
+                # 알림이 도착하기 전에 탭이 닫힌 경우
+                pass
 
-        self.load_btn = tk.Button(
-            bottom_frame,
-            text="결과 불러오기",
-            command=self.load_results,
-            bg="#9C27B0",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            padx=10,
-        )
-        self.load_btn.pack(side=tk.LEFT, padx=5)
-
-        tk.Button(
-            bottom_frame,
-            text="초기화",
-            command=self.clear_results,
-            bg="#F44336",
-            fg="white",
-            font=("Arial", 11, "bold"),
-            padx=10,
-        ).pack(side=tk.RIGHT, padx=5)
+    # ---- 수집 ----
 
     def start_collection(self):
-        """가격 데이터 수집을 시작합니다 (비동기 처리)"""
+        """가격 데이터 수집을 시작합니다 (스레드 풀에서 비동기 처리)"""
         keyword = self.keyword_entry.get().strip()
 
         if not keyword:
             messagebox.showwarning("경고", "검색 키워드를 입력해주세요.")
             return
 
-        self.current_keyword = keyword
-        self.collect_btn.config(state=tk.DISABLED, text="수집 중...")
-        self.result_text.delete(1.0, tk.END)
-        self.result_text.insert(tk.END, f"'{keyword}' 검색 중...\n")
-        self.result_text.insert(
-            tk.END, "데이터를 수집하고 있습니다. 잠시만 기다려주세요...\n\n"
-        )
-
-        # 비동기 처리를 위한 쓰레드 생성
-        thread = threading.Thread(target=self._collect_data, args=(keyword,))
-        thread.daemon = True
-        thread.start()
-
-    def _collect_data(self, keyword: str):
-        """실제 데이터 수집을 수행합니다 (백그라운드)"""
-        try:
-            # 가격 데이터 크롤링
-            prices = self.scraper.scrape_prices(keyword)
-
-            # GUI 업데이트는 메인 쓰레드에서
-            self.root.after(0, self._update_results, prices)
+        session = self._idle_session()
+        token = threading.Event()
+        session.begin(keyword, token)
+        session.future = self.executor.submit(self._collect_data, session, keyword, token)
+        self.keyword_entry.delete(0, tk.END)
 
-        except Exception as e:
-            self.root.after(0, self._show_error, str(e))
+    def _collect_data(self, session: SearchSession, keyword: str, token: threading.Event):
+        """실제 데이터 수집을 수행합니다 (백그라운드, 취소 토큰 확인)"""
+        progress = {"fetch": ("요청 중...", 10), "filter": ("수집 중...", 40), "analyze": ("분석 중...", 80)}
 
-    def _update_results(self, prices: List[int]):
-        """수집 결과를 GUI에 업데이트합니다."""
-        self.current_prices = prices
+        def on_stage(name: str):
+            if name in progress:
+                self.post(session.set_progress, *progress[name], token)
 
-        if not prices:
-            self.result_text.insert(tk.END, "수집된 가격 데이터가 없습니다.\n")
-            self.result_text.insert(tk.END, "다른 키워드로 다시 시도해보세요.")
-        else:
-            # 통계 계산
-            stats = self.analyzer.calculate_statistics(prices)
-
-            # 결과 출력
-            self.result_text.insert(tk.END, "=" * 60 + "\n")
-            self.result_text.insert(tk.END, f"검색 키워드: {self.current_keyword}\n")
-            self.result_text.insert(tk.END, "=" * 60 + "\n\n")
-
-            self.result_text.insert(tk.END, "📊 통계 분석 결과\n")
-            self.result_text.insert(tk.END, "-" * 60 + "\n")
-            self.result_text.insert(tk.END, f"수집된 가격 개수: {stats['count']:,}개\n")
-            self.result_text.insert(tk.END, f"평균 가격: {stats['average']:,.0f}원\n")
-            self.result_text.insert(tk.END, f"최고 가격: {stats['max']:,}원\n")
-            self.result_text.insert(tk.END, f"최저 가격: {stats['min']:,}원\n")
-            self.result_text.insert(
-                tk.END, f"가격 범위: {stats['max'] - stats['min']:,}원\n"
+        try:
+            context = self.pipeline.run(
+                keyword, until="analyze", cancel_event=token, on_stage=on_stage
             )
-            self.result_text.insert(tk.END, "-" * 60 + "\n\n")
-
-            # 가격 리스트 출력 (상위 10개)
-            self.result_text.insert(tk.END, "수집된 가격 목록 (일부)\n")
-            self.result_text.insert(tk.END, "-" * 60 + "\n")
-            for i, price in enumerate(prices[:10], 1):
-                self.result_text.insert(tk.END, f"{i:2d}. {price:,}원\n")
-
-            if len(prices) > 10:
-                self.result_text.insert(tk.END, f"... 외 {len(prices) - 10}개\n")
-
-            # 버튼 활성화
-            self.graph_btn.config(state=tk.NORMAL)
-            self.save_btn.config(state=tk.NORMAL)
-
-        self.collect_btn.config(state=tk.NORMAL, text="수집 시작")
-
-    def _show_error(self, error_msg: str):
-        """오류 메시지를 표시합니다."""
-        self.result_text.insert(tk.END, f"\n오류 발생: {error_msg}\n")
-        self.collect_btn.config(state=tk.NORMAL, text="수집 시작")
-        messagebox.showerror("오류", error_msg)
-
-    def show_graph(self):
-        """히스토그램을 새 창으로 표시합니다."""
-        if not self.current_prices:
-            messagebox.showwarning("경고", "표시할 데이터가 없습니다.")
+        except PipelineCancelled:
             return
-
-        self.visualizer.plot_histogram(self.current_prices, self.current_keyword)
-
-    def save_results(self):
-        """현재 결과를 파일로 저장합니다."""
-        if not self.current_prices:
-            messagebox.showwarning("경고", "저장할 데이터가 없습니다.")
+        except Exception as e:
+            self.post(session.show_error, str(e), token)
             return
 
-        try:
-            stats = self.analyzer.calculate_statistics(self.current_prices)
-            data = {
-                "keyword": self.current_keyword,
-                "prices": self.current_prices,
-                "statistics": stats,
-            }
-
-            # 자동으로 고유한 파일명 생성
-            saved_filename = self.analyzer.save_results(data)
-            messagebox.showinfo(
-                "성공", f"결과가 '{saved_filename}' 파일로 저장되었습니다."
-            )
-        except Exception as e:
-            messagebox.showerror("오류", f"저장 중 오류가 발생했습니다: {str(e)}")
+        # 가격이 없으면 filter 단계에서 멈추므로 빈 통계 사용
+        statistics = context.get("statistics") or self.analyzer.calculate_statistics([])
+        self.post(session.show_results, context["prices"], statistics, token)
 
     def load_results(self):
-        """저장된 결과를 불러옵니다."""
+        """저장된 결과를 새 탭으로 불러옵니다."""
         from tkinter import filedialog
         import os
 
@@ -476,28 +533,27 @@ class PriceAnalyzerGUI:
                 return
 
             # 데이터 복원
-            self.current_keyword = data.get("keyword", "Unknown")
-            self.current_prices = data.get("prices", [])
-            stats = data.get("statistics", {})
+            session = self._idle_session()
+            session.keyword = data.get("keyword", "Unknown")
+            prices = data.get("prices", [])
+            stats = data.get("statistics") or self.analyzer.calculate_statistics(prices)
 
-            # 결과 표시
-            self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(tk.END, "📂 저장된 결과를 불러왔습니다.\n\n")
-
-            self._update_results(self.current_prices)
+            session.show_results(prices, stats)
+            session.result_text.insert(1.0, "📂 저장된 결과를 불러왔습니다.\n\n")
+            self.update_tab_title(session, "📂")
 
             messagebox.showinfo("성공", "결과를 성공적으로 불러왔습니다.")
         except Exception as e:
             messagebox.showerror("오류", f"불러오기 중 오류가 발생했습니다: {str(e)}")
 
-    def clear_results(self):
-        """결과를 초기화합니다."""
-        self.result_text.delete(1.0, tk.END)
-        self.keyword_entry.delete(0, tk.END)
-        self.current_prices = []
-        self.current_keyword = ""
-        self.graph_btn.config(state=tk.DISABLED)
-        self.save_btn.config(state=tk.DISABLED)
+    def close(self):
+        """모든 작업을 취소하고 창을 닫습니다."""
+        for tab in self.notebook.tabs():
+            session = self.notebook.nametowidget(tab)
+            if session.cancel_event is not None:
+                session.cancel_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
 
 
 def main():
@@ -1,247 +1,17 @@
-import requests
-from bs4 import BeautifulSoup
-import re
 import matplotlib
 
 matplotlib.use("Agg")  # GUI 백엔드 사용하지 않음
-import matplotlib.pyplot as plt
-import pickle
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Iterable, Iterator
 import os
 
-
-class PriceScraper:
-    """다나와 웹사이트에서 가격 데이터를 크롤링하는 클래스"""
-
-    def __init__(self):
-        self.headers = {
-            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-        }
-        self.base_url = "http://search.danawa.com/dsearch.php"
-        self.min_price = 1000
-        self.max_price = 100000000
-
-    def scrape_prices(self, keyword: str) -> List[int]:
-        """
-        특정 키워드로 다나와를 검색하고 가격 데이터를 수집합니다.
-
-        Args:
-            keyword: 검색할 상품 키워드
-
-        Returns:
-            수집된 가격 리스트 (정수형)
-        """
-        prices = []
-
-        try:
-            print(f"\n🔍 '{keyword}' 검색 중...")
-
-            # 검색 요청
-            params = {"query": keyword, "tab": "goods"}
-
-            response = requests.get(
-                self.base_url, params=params, headers=self.headers, timeout=10
-            )
-            response.raise_for_status()
-
-            # HTML 파싱
-            soup = BeautifulSoup(response.text, "html.parser")
-
-            # 가격 데이터 추출 (정규표현식 사용)
-            price_pattern = r"(\d[\d,]*)\s*원"
-            text_content = soup.get_text()
-
-            # 모든 가격 패턴 찾기
-            matches = re.findall(price_pattern, text_content)
-
-            # 리스트 함축을 사용한 데이터 정제
-            prices = [
-                int(match.replace(",", ""))
-                for match in matches
-                if self._is_valid_price(match)
-            ]
-
-            # 중복 제거 및 정렬
-            prices = sorted(list(set(prices)))
-
-            print(f"✅ {len(prices)}개의 가격 데이터 수집 완료")
-
-        except requests.exceptions.RequestException as e:
-            print(f"네트워크 오류: {e}")
-            raise Exception(f"크롤링 중 네트워크 오류가 발생했습니다: {str(e)}")
-        except Exception as e:
-            print(f"데이터 파싱 오류: {e}")
-            raise Exception(f"데이터 파싱 중 오류가 발생했습니다: {str(e)}")
-
-        return prices
-
-    def _is_valid_price(self, price_str: str) -> bool:
-        """
-        가격이 유효한 범위 내에 있는지 확인합니다.
-
-        Args:
-            price_str: 쉼표가 포함된 가격 문자열
-
-        Returns:
-            유효 여부
-        """
-        try:
-            price = int(price_str.replace(",", ""))
-            return self.min_price <= price <= self.max_price
-        except ValueError:
-            return False
-
-
-class DataAnalyzer:
-    """가격 데이터의 통계 분석을 수행하는 클래스"""
-
-    @staticmethod
-    def calculate_statistics(prices: List[int]) -> Dict[str, float]:
-        """
-        가격 리스트의 통계를 계산합니다.
-
-        Args:
-            prices: 가격 데이터 리스트
-
-        Returns:
-            통계 정보 딕셔너리 (평균, 최대, 최소, 개수)
-        """
-        if not prices:
-            return {"average": 0, "max": 0, "min": 0, "count": 0}
-
-        return {
-            "average": sum(prices) / len(prices),
-            "max": max(prices),
-            "min": min(prices),
-            "count": len(prices),
-        }
-
-    @staticmethod
-    def save_results(data: Dict, filename: str = None):
-        """
-        분석 결과를 pickle 파일로 저장합니다.
-
-        Args:
-            data: 저장할 데이터
-            filename: 저장할 파일명 (None이면 자동 생성)
-        """
-        try:
-            # 파일명이 지정되지 않은 경우 자동 생성
-            if filename is None:
-                from datetime import datetime
-
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                keyword = data.get("keyword", "unknown")
-                # 파일명에 사용할 수 없는 문자 제거
-                safe_keyword = "".join(
-                    c for c in keyword if c.isalnum() or c in (" ", "_")
-                ).strip()
-                safe_keyword = safe_keyword.replace(" ", "_")[:20]  # 최대 20자로 제한
-                filename = f"result_{safe_keyword}_{timestamp}.pkl"
-
-            with open(filename, "wb") as f:
-                pickle.dump(data, f)
-            print(f"결과 저장 완료: {filename}")
-
-            return filename  # 저장된 파일명 반환
-        except Exception as e:
-            print(f"파일 저장 오류: {e}")
-            raise
-
-    @staticmethod
-    def load_results(filename: str = "last_result.pkl") -> Optional[Dict]:
-        """
-        pickle 파일에서 분석 결과를 불러옵니다.
-
-        Args:
-            filename: 불러올 파일명
-
-        Returns:
-            저장된 데이터 또는 None
-        """
-        try:
-            with open(filename, "rb") as f:
-                data = pickle.load(f)
-            print(f"결과 불러오기 완료: {filename}")
-            return data
-        except FileNotFoundError:
-            print(f"파일을 찾을 수 없습니다: {filename}")
-            return None
-        except Exception as e:
-            print(f"파일 불러오기 오류: {e}")
-            return None
-
-
-class Visualizer:
-    """데이터 시각화를 담당하는 클래스"""
-
-    def __init__(self):
-        self._setup_korean_font()
-
-    def _setup_korean_font(self):
-        """한글 깨짐 방지를 위한 폰트 설정"""
-        try:
-            # macOS용 한글 폰트 설정
-            plt.rcParams["font.family"] = "AppleGothic"
-            plt.rcParams["axes.unicode_minus"] = False
-        except:
-            try:
-                # Windows용 한글 폰트 설정
-                plt.rcParams["font.family"] = "Malgun Gothic"
-                plt.rcParams["axes.unicode_minus"] = False
-            except:
-                print("⚠️  한글 폰트 설정 실패. 기본 폰트를 사용합니다.")
-
-    def save_histogram(
-        self, prices: List[int], keyword: str, filename: str = "price_histogram.png"
-    ):
-        """
-        가격 분포 히스토그램을 파일로 저장합니다.
-
-        Args:
-            prices: 가격 데이터 리스트
-            keyword: 검색 키워드
-            filename: 저장할 파일명
-        """
-        if not prices:
-            print("시각화할 데이터가 없습니다.")
-            return
-
-        try:
-            plt.figure(figsize=(10, 6))
-
-            # 히스토그램 생성
-            plt.hist(prices, bins=20, color="skyblue", edgecolor="black", alpha=0.7)
-
-            # 차트 설정
-            plt.title(f"Price Distribution - {keyword}", fontsize=16, fontweight="bold")
-            plt.xlabel("가격 (원)", fontsize=12)
-            plt.ylabel("빈도", fontsize=12)
-            plt.grid(axis="y", alpha=0.3)
-
-            # 통계선 추가
-            avg_price = sum(prices) / len(prices)
-            plt.axvline(
-                avg_price,
-                color="red",
-                linestyle="--",
-                linewidth=2,
-                label=f"평균: {avg_price:,.0f}원",
-            )
-            plt.legend()
-
-            # 가격 포맷팅
-            ax = plt.gca()
-            ax.xaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f"{int(x):,}"))
-
-            plt.tight_layout()
-            plt.savefig(filename, dpi=150, bbox_inches="tight")
-            plt.close()
-
-            print(f"히스토그램 저장 완료: {filename}")
-
-        except Exception as e:
-            print(f"시각화 오류: {e}")
+# 수집기, 분석기, 시각화 도구는 GUI/웹과 함께 쓰는 핵심 엔진에서 가져옴 (기존 import 경로 호환)
+from price_engine import (
+    DataAnalyzer,
+    PricePipeline,
+    PriceScraper,
+    Visualizer,
+    build_sources,
+)
 
 
 def print_statistics(stats: Dict, keyword: str):
@@ -268,8 +38,243 @@ def print_price_list(prices: List[int], limit: int = 10):
         print(f"... 외 {len(prices) - limit}개")
 
 
-def interactive_mode():
-    """대화형 모드로 프로그램을 실행합니다."""
+def format_price_change(label: str, old: float, new: float) -> str:
+    """지표 하나의 변화를 '최저 15,900원 → 14,900원 (▼1,000)' 형식으로 만듭니다."""
+    delta = new - old
+    arrow = "▲" if delta > 0 else "▼"
+    return f"{label} {old:,.0f}원 → {new:,.0f}원 ({arrow}{abs(delta):,.0f})"
+
+
+def print_price_changes(
+    keyword: str, old: List[int], new: List[int], limit: int = 10, out=None
+) -> bool:
+    """
+    이전 수집 결과와 비교하여 달라진 부분만 출력합니다.
+
+    Args:
+        keyword: 검색 키워드
+        old: 이전 가격 리스트 (오름차순)
+        new: 새 가격 리스트 (오름차순)
+        limit: 추가/제거 가격을 각각 최대 몇 개까지 출력할지
+        out: 출력 스트림 (None이면 표준 출력)
+
+    Returns:
+        변경 사항이 있었는지 여부
+    """
+    import sys
+    import time
+
+    out = out or sys.stdout
+    added, removed = DataAnalyzer.diff_prices(old, new)
+    stamp = time.strftime("%H:%M:%S")
+    if not added and not removed:
+        print(f"[{stamp}] {keyword}: 변경 없음 ({len(new):,}개)", file=out)
+        return False
+
+    print(
+        f"[{stamp}] {keyword}: +{len(added)} / -{len(removed)} (총 {len(new):,}개)", file=out
+    )
+    for sign, prices in (("+", added), ("-", removed)):
+        for price in prices[:limit]:
+            print(f"  {sign} {price:>15,}원", file=out)
+        if len(prices) > limit:
+            print(f"  {sign} ... 외 {len(prices) - limit}개", file=out)
+
+    moves = []
+    if old and new:
+        for label, before, after in (
+            ("최저", old[0], new[0]),
+            ("중앙값", DataAnalyzer.median(old), DataAnalyzer.median(new)),
+            ("평균", sum(old) / len(old), sum(new) / len(new)),
+        ):
+            if round(before) != round(after):
+                moves.append(format_price_change(label, before, after))
+    if moves:
+        print("  " + " | ".join(moves), file=out)
+    return True
+
+
+def watch_prices(
+    keyword: str,
+    interval: float = 60,
+    scraper: Optional[PriceScraper] = None,
+    cycles: Optional[int] = None,
+    out=None,
+    sources: Optional[str] = None,
+    pipeline: Optional[PricePipeline] = None,
+):
+    """
+    키워드를 주기적으로 다시 수집하고 이전 결과와 달라진 부분만 출력합니다.
+    같은 세션(연결 풀)과 응답 캐시를 계속 사용하므로 페이지가 바뀌지 않았으면 파싱도 생략됩니다.
+
+    Args:
+        keyword: 감시할 키워드
+        interval: 수집 간격 (초, 수집 시작 시각 기준)
+        scraper: 사용할 스크래퍼 (None이면 새로 생성)
+        cycles: 수집 횟수 (None이면 Ctrl+C 까지 계속)
+        out: 출력 스트림 (None이면 표준 출력)
+        sources: 가격 소스 설정 (build_sources 형식, None이면 PRICE_SOURCES 환경 변수)
+        pipeline: 사용할 PricePipeline (None이면 scraper와 sources로 생성, analyze 단계까지 실행)
+    """
+    import sys
+    import time
+
+    out = out or sys.stdout
+    if pipeline is None:
+        scraper = scraper or PriceScraper(verbose=False)
+        pipeline = PricePipeline(scraper=scraper, sources=build_sources(sources, danawa_scraper=scraper))
+    previous = None
+    cycle = 0
+
+    try:
+        while cycles is None or cycle < cycles:
+            started = time.monotonic()
+            cycle += 1
+            try:
+                context = pipeline.run(keyword, until="analyze")
+            except Exception as e:
+                print(f"[{time.strftime('%H:%M:%S')}] ❌ {e}", file=out)
+            else:
+                prices = context["prices"]
+                if previous is None:
+                    # 첫 수집만 전체 결과 출력 (가격이 없으면 analyze 단계를 건너뛰므로 여기서 계산)
+                    stats = context.get("statistics") or DataAnalyzer.calculate_statistics(prices)
+                    print(
+                        f"[{time.strftime('%H:%M:%S')}] 👀 '{keyword}' 감시 시작: "
+                        f"{stats['count']:,}개, 최저 {stats['min']:,}원, "
+                        f"중앙값 {DataAnalyzer.median(prices):,.0f}원, 평균 {stats['average']:,.0f}원 "
+                        f"(간격 {interval:g}초, Ctrl+C로 종료)",
+                        file=out,
+                    )
+                else:
+                    print_price_changes(keyword, previous, prices, out=out)
+                previous = prices
+            out.flush()
+
+            if cycles is not None and cycle >= cycles:
+                break
+            time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        print("\n감시를 종료합니다.", file=out)
+
+
+def print_history_search(store, query: str, page: int = 1, per_page: int = 20, out=None) -> int:
+    """
+    스냅샷 저장소에서 비슷한 키워드의 과거 검색을 순위대로 출력합니다 (키워드 trigram 색인 사용).
+
+    Args:
+        store: SnapshotStore
+        query: 검색어 (공백, 대소문자 무시, 한글 오타 일부 허용)
+        page: 페이지 번호 (1부터)
+        per_page: 페이지당 개수
+        out: 출력 스트림 (None이면 표준 출력)
+
+    Returns:
+        일치한 전체 스냅샷 개수
+    """
+    import sys
+    import time
+
+    out = out or sys.stdout
+    found = store.search_history(query, limit=per_page, offset=(page - 1) * per_page)
+    total = found["total"]
+    if not total:
+        print(f"'{query}'와 비슷한 검색 기록이 없습니다.", file=out)
+        return 0
+
+    pages = (total + per_page - 1) // per_page
+    keywords = ", ".join(match["keyword"] for match in found["keywords"][:5])
+    print(f"🔎 '{query}' 검색 기록 {total:,}개 ({page}/{pages} 페이지) - 키워드: {keywords}", file=out)
+    for item in found["results"]:
+        stats = item["statistics"]
+        taken = time.strftime("%Y-%m-%d %H:%M", time.localtime(item["taken_at"]))
+        print(
+            f"  #{item['id']:<8} {taken}  {item['keyword']:<16} "
+            f"{stats['count']:>4}개  최저 {stats['min']:>10,}원  평균 {stats['average']:>12,.0f}원",
+            file=out,
+        )
+    return total
+
+
+def export_history(
+    store,
+    path: str,
+    fmt: Optional[str] = None,
+    keyword: Optional[str] = None,
+    start: Optional[float] = None,
+    end: Optional[float] = None,
+    level: str = "prices",
+) -> int:
+    """
+    스냅샷 기록을 파일로 내보냅니다 (저장소에서 나누어 읽으며 바로 쓰므로 메모리 사용량이 일정).
+
+    Args:
+        store: SnapshotStore
+        path: 출력 파일 경로 ('-'이면 표준 출력)
+        fmt: "csv", "ndjson" 또는 "parquet" (None이면 확장자로 판단, 알 수 없으면 csv)
+        keyword: 키워드 (None이면 전체)
+        start / end: 시각 범위 (Unix time, 포함)
+        level: "prices"(가격 하나당 한 행) 또는 "snapshots"(스냅샷 하나당 한 행)
+
+    Returns:
+        기록한 바이트 수
+    """
+    import sys
+
+    import history_export
+
+    if fmt is None:
+        extension = os.path.splitext(path)[1].lstrip(".").lower()
+        fmt = {"jsonl": "ndjson", "pq": "parquet"}.get(extension, extension)
+        if fmt not in history_export.FORMATS:
+            fmt = "csv"
+
+    chunks = history_export.iter_export(store, fmt, keyword=keyword, start=start, end=end, level=level)
+    written = 0
+    out = sys.stdout.buffer if path == "-" else open(path, "wb")
+    try:
+        for chunk in chunks:
+            out.write(chunk)
+            written += len(chunk)
+    finally:
+        if path == "-":
+            out.flush()
+        else:
+            out.close()
+    return written
+
+
+def _parse_time_arg(value: Optional[str]) -> Optional[float]:
+    """--from/--to 값 (Unix time 또는 ISO 형식 날짜/시각)을 Unix time으로 변환합니다."""
+    from datetime import datetime
+
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return datetime.fromisoformat(value).timestamp()
+
+
+def _report_stage(context: Dict):
+    """파이프라인 analyze 단계 뒤에 추가하는 결과 출력 단계 (빠른 분석, 대화형 모드 공통)"""
+    # 소스별 수집 결과 (여러 소스를 사용한 경우)
+    for name, item in context.get("sources", {}).items():
+        status = f"{item['count']}개" if item["status"] == "ok" else item["error"]
+        print(f"  - {name}: {status} ({item['elapsed_ms']:.0f}ms)")
+
+    # 결과 출력
+    print_statistics(context["statistics"], context["keyword"])
+    print_price_list(context["prices"], limit=10)
+
+
+def interactive_mode(sources: Optional[str] = None):
+    """
+    대화형 모드로 프로그램을 실행합니다.
+
+    Args:
+        sources: 가격 소스 설정 (build_sources 형식, None이면 PRICE_SOURCES 환경 변수)
+    """
     print("\n" + "╔" + "=" * 58 + "╗")
     print("║" + " " * 58 + "║")
     print("║" + "  상품 가격 분석 및 추적 시스템 (CLI 버전)".center(58) + "║")
@@ -280,6 +285,15 @@ def interactive_mode():
     analyzer = DataAnalyzer()
     visualizer = Visualizer()
 
+    # 수집 → 분석 → 결과 출력 → 히스토그램 (저장은 사용자에게 물어본 뒤 진행)
+    pipeline = PricePipeline(
+        scraper=scraper,
+        analyzer=analyzer,
+        render=lambda context: visualizer.save_histogram(context["prices"], context["keyword"]),
+        sources=build_sources(sources, danawa_scraper=scraper),
+    )
+    pipeline.insert_stage("report", _report_stage, after="analyze")
+
     while True:
         print("\n" + "-" * 60)
         print("메뉴:")
@@ -298,27 +312,16 @@ def interactive_mode():
                 continue
 
             try:
-                # 가격 수집
-                prices = scraper.scrape_prices(keyword)
+                context = pipeline.run(keyword)
 
-                if not prices:
+                if not context["prices"]:
                     print("수집된 가격 데이터가 없습니다.")
                     continue
 
-                # 통계 분석
-                stats = analyzer.calculate_statistics(prices)
-
-                # 결과 출력
-                print_statistics(stats, keyword)
-                print_price_list(prices, limit=10)
-
-                # 히스토그램 생성
-                visualizer.save_histogram(prices, keyword)
-
                 # 결과 저장 여부
                 save = input("\n결과를 저장하시겠습니까? (y/n): ").strip().lower()
                 if save == "y":
-                    data = {"keyword": keyword, "prices": prices, "statistics": stats}
+                    data = {"keyword": keyword, "prices": context["prices"], "statistics": context["statistics"]}
                     analyzer.save_results(data)
 
             except Exception as e:
@@ -379,52 +382,317 @@ def interactive_mode():
             print("올바른 메뉴를 선택해주세요.")
 
 
-def quick_analyze(keyword: str):
-    """빠른 분석 모드 (커맨드라인 인자로 실행)"""
+def quick_analyze(keyword: str, sources: Optional[str] = None):
+    """
+    빠른 분석 모드 (커맨드라인 인자로 실행)
+
+    Args:
+        keyword: 검색 키워드
+        sources: 가격 소스 설정 (build_sources 형식, None이면 PRICE_SOURCES 환경 변수)
+    """
     print("\n" + "=" * 60)
     print(f"빠른 분석 모드: {keyword}")
     print("=" * 60)
 
-    scraper = PriceScraper()
-    analyzer = DataAnalyzer()
     visualizer = Visualizer()
 
+    def render(context: Dict):
+        # 히스토그램 생성
+        visualizer.save_histogram(context["prices"], keyword)
+
+    # 수집 → 분석 → 결과 출력 → 자동 저장 → 히스토그램
+    scraper = PriceScraper()
+    pipeline = PricePipeline(
+        scraper=scraper,
+        save_pickle=True,
+        render=render,
+        sources=build_sources(sources, danawa_scraper=scraper),
+    )
+    pipeline.insert_stage("report", _report_stage, after="analyze")
+
     try:
-        # 가격 수집
-        prices = scraper.scrape_prices(keyword)
+        print(f"\n🔍 '{keyword}' 검색 중...")
+        context = pipeline.run(keyword)
 
-        if not prices:
+        if not context["prices"]:
             print("수집된 가격 데이터가 없습니다.")
-            return
 
-        # 통계 분석
-        stats = analyzer.calculate_statistics(prices)
+    except Exception as e:
+        print(f"\n오류 발생: {e}")
 
-        # 결과 출력
-        print_statistics(stats, keyword)
-        print_price_list(prices, limit=10)
 
-        # 히스토그램 생성
-        visualizer.save_histogram(prices, keyword)
+def read_keywords(source: str) -> Iterator[str]:
+    """
+    파일 또는 표준 입력에서 키워드를 한 줄씩 읽습니다 (빈 줄, # 주석 제외).
 
-        # 자동 저장
-        data = {"keyword": keyword, "prices": prices, "statistics": stats}
-        analyzer.save_results(data)
+    Args:
+        source: 파일 경로 ('-'이면 표준 입력)
+    """
+    import sys
 
-    except Exception as e:
-        print(f"\n오류 발생: {e}")
+    stream = sys.stdin if source == "-" else open(source, encoding="utf-8")
+    try:
+        for line in stream:
+            keyword = line.strip()
+            if keyword and not keyword.startswith("#"):
+                yield keyword
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def format_batch_result(result: Dict, fmt: str, with_prices: bool) -> str:
+    """일괄 처리 결과 하나를 JSONL 또는 CSV 한 줄로 변환합니다."""
+    import csv
+    import io
+    import json
+
+    stats = result.get("statistics") or {}
+    if fmt == "jsonl":
+        line = {"keyword": result["keyword"], "success": result["success"]}
+        if result["success"]:
+            line["statistics"] = stats
+            if with_prices:
+                line["prices"] = result["prices"]
+        else:
+            line["error"] = result["error"]
+        line["elapsed_ms"] = result["elapsed_ms"]
+        return json.dumps(line, ensure_ascii=False)
+
+    buffer = io.StringIO()
+    row = [
+        result["keyword"],
+        int(result["success"]),
+        stats.get("count", ""),
+        round(stats["average"], 1) if "average" in stats else "",
+        stats.get("min", ""),
+        stats.get("max", ""),
+        result.get("error", ""),
+        result["elapsed_ms"],
+    ]
+    if with_prices:
+        row.append(" ".join(str(p) for p in result.get("prices", [])))
+    csv.writer(buffer, lineterminator="").writerow(row)
+    return buffer.getvalue()
+
+
+def batch_analyze(
+    keywords: Iterable[str],
+    workers: int = 4,
+    fmt: str = "jsonl",
+    with_prices: bool = False,
+    store=None,
+    histogram_dir: Optional[str] = None,
+    out=None,
+    sources: Optional[str] = None,
+) -> int:
+    """
+    여러 키워드를 동시에 수집하여 끝나는 순서대로 한 줄씩 출력합니다.
+    수집 스레드는 파이프라인을 analyze 단계까지 실행하고, 이후 단계(스냅샷 저장, 히스토그램 생성)는
+    별도 작업 스레드에서 이어서 실행하여 출력을 늦추지 않습니다.
+
+    Args:
+        keywords: 키워드 목록 (파일에서 읽는 중인 반복자도 가능)
+        workers: 동시에 수집할 키워드 개수
+        fmt: 출력 형식 ("jsonl" 또는 "csv")
+        with_prices: 가격 목록 포함 여부
+        store: 결과를 기록할 SnapshotStore (None이면 저장하지 않음)
+        histogram_dir: 히스토그램 PNG를 저장할 디렉토리 (None이면 생성하지 않음)
+        out: 출력 스트림 (기본값: 표준 출력)
+        sources: 가격 소스 설정 (build_sources 형식, None이면 PRICE_SOURCES 환경 변수)
+
+    Returns:
+        실패한 키워드 개수
+    """
+    import sys
+    import time
+    from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+    out = out or sys.stdout
+    visualizer = Visualizer(verbose=False) if histogram_dir else None
+    if histogram_dir:
+        os.makedirs(histogram_dir, exist_ok=True)
+
+    def render(context: Dict):
+        if visualizer is not None:
+            filename = os.path.join(
+                histogram_dir, f"histogram_{DataAnalyzer.safe_keyword(context['keyword'])}.png"
+            )
+            visualizer.save_histogram(context["prices"], context["keyword"], filename)
+
+    scraper = PriceScraper(verbose=False)
+    pipeline = PricePipeline(
+        scraper=scraper,
+        store=store,
+        render=render,
+        sources=build_sources(sources, danawa_scraper=scraper),
+    )
+
+    def analyze_one(keyword: str) -> Dict:
+        start = time.perf_counter()
+        try:
+            # 통계는 filter 단계에서 가격을 받는 동안 함께 누적 (별도 계산 단계 없음)
+            context = pipeline.run(keyword, until="analyze")
+            if not context["prices"]:
+                result = {"keyword": keyword, "success": False, "error": "수집된 가격 데이터가 없습니다."}
+            else:
+                result = {
+                    "keyword": keyword,
+                    "success": True,
+                    "prices": context["prices"],
+                    "statistics": context["statistics"],
+                    "context": context,
+                }
+        except Exception as e:
+            result = {"keyword": keyword, "success": False, "error": str(e)}
+        result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        return result
+
+    def persist(result: Dict):
+        # analyze 이후 단계 (matplotlib과 SQLite 쓰기는 한 스레드에서만 처리)
+        pipeline.resume(result.pop("context"), after="analyze")
+
+    if fmt == "csv":
+        header = "keyword,success,count,average,min,max,error,elapsed_ms"
+        print(header + (",prices" if with_prices else ""), file=out, flush=True)
+
+    failures = 0
+    keyword_iter = iter(keywords)
+    pending = set()
+    side_futures = []
+
+    with ThreadPoolExecutor(max_workers=workers) as pool, ThreadPoolExecutor(max_workers=1) as side:
+        # 수천 개의 키워드도 메모리를 적게 쓰도록 진행 중인 작업 수를 제한
+        for keyword in keyword_iter:
+            pending.add(pool.submit(analyze_one, keyword))
+            if len(pending) >= workers * 2:
+                break
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                print(format_batch_result(result, fmt, with_prices), file=out, flush=True)
+                if result["success"]:
+                    side_futures.append(side.submit(persist, result))
+                else:
+                    failures += 1
+
+                next_keyword = next(keyword_iter, None)
+                if next_keyword is not None:
+                    pending.add(pool.submit(analyze_one, next_keyword))
+
+            # 끝난 저장 작업 정리 (오류는 표준 에러로 보고)
+            for side_future in [f for f in side_futures if f.done()]:
+                side_futures.remove(side_future)
+                if side_future.exception():
+                    print(f"저장 오류: {side_future.exception()}", file=sys.stderr)
+
+    for side_future in side_futures:
+        if side_future.exception():
+            print(f"저장 오류: {side_future.exception()}", file=sys.stderr)
+
+    return failures
 
 
 def main():
     """메인 실행 함수"""
+    import argparse
     import sys
 
+    parser = argparse.ArgumentParser(description="상품 가격 분석 및 추적 시스템 (CLI 버전)")
+    parser.add_argument("keyword", nargs="*", help="빠른 분석할 키워드 (없으면 대화형 모드)")
+    parser.add_argument(
+        "--batch", metavar="FILE", help="키워드 목록 파일로 일괄 처리 ('-'이면 표준 입력)"
+    )
+    parser.add_argument("--workers", type=int, default=4, help="동시에 수집할 키워드 개수")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl", help="일괄 처리 출력 형식")
+    parser.add_argument("--with-prices", action="store_true", help="출력에 가격 목록 포함")
+    parser.add_argument("--save", action="store_true", help="일괄 처리 결과를 스냅샷 저장소에 기록")
+    parser.add_argument(
+        "--db", default=os.environ.get("SNAPSHOT_DB", "snapshots.db"), help="스냅샷 저장소 파일"
+    )
+    parser.add_argument("--histogram-dir", help="일괄 처리 시 히스토그램 PNG 저장 디렉토리")
+    parser.add_argument("--watch", metavar="KEYWORD", help="키워드를 주기적으로 수집하여 변경 사항만 출력")
+    parser.add_argument("--interval", type=float, default=60, help="감시 모드 수집 간격 (초)")
+    parser.add_argument("--history", metavar="QUERY", help="스냅샷 저장소에서 비슷한 키워드의 과거 검색 조회")
+    parser.add_argument("--page", type=int, default=1, help="--history 결과 페이지 번호")
+    parser.add_argument("--per-page", type=int, default=20, help="--history 페이지당 개수")
+    parser.add_argument(
+        "--export", metavar="FILE", help="스냅샷 기록을 파일로 내보내기 ('-'이면 표준 출력, 키워드를 주면 그 키워드만)"
+    )
+    parser.add_argument(
+        "--export-format",
+        choices=["csv", "ndjson", "parquet"],
+        help="내보내기 형식 (기본: 파일 확장자로 판단, parquet은 pyarrow 필요)",
+    )
+    parser.add_argument(
+        "--level", choices=["prices", "snapshots"], default="prices", help="내보내기 행 단위 (가격별/스냅샷별)"
+    )
+    parser.add_argument("--from", dest="start", help="내보내기 시작 시각 (Unix time 또는 2024-06-01T12:00)")
+    parser.add_argument("--to", dest="end", help="내보내기 종료 시각 (Unix time 또는 ISO 형식)")
+    parser.add_argument(
+        "--sources",
+        help="동시에 검색할 가격 소스 (예: danawa,shop=http://127.0.0.1:8901/dsearch.php, 기본: PRICE_SOURCES)",
+    )
+    args = parser.parse_args()
+
+    if args.watch:
+        watch_prices(args.watch, interval=max(1.0, args.interval), sources=args.sources)
+        return
+
+    if args.history:
+        from snapshot_store import SnapshotStore
+
+        print_history_search(
+            SnapshotStore(args.db), args.history, page=max(1, args.page), per_page=max(1, args.per_page)
+        )
+        return
+
+    if args.export:
+        import history_export
+        from snapshot_store import SnapshotStore
+
+        try:
+            written = export_history(
+                SnapshotStore(args.db),
+                args.export,
+                fmt=args.export_format,
+                keyword=" ".join(args.keyword) or None,
+                start=_parse_time_arg(args.start),
+                end=_parse_time_arg(args.end),
+                level=args.level,
+            )
+        except (ValueError, history_export.ExportUnavailable) as e:
+            print(f"내보내기 오류: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.export != "-":
+            print(f"내보내기 완료: {args.export} ({written:,} bytes)", file=sys.stderr)
+        return
+
+    if args.batch:
+        store = None
+        if args.save:
+            from snapshot_store import SnapshotStore
+
+            store = SnapshotStore(args.db)
+        failures = batch_analyze(
+            read_keywords(args.batch),
+            workers=max(1, args.workers),
+            fmt=args.format,
+            with_prices=args.with_prices,
+            store=store,
+            histogram_dir=args.histogram_dir,
+            sources=args.sources,
+        )
+        sys.exit(1 if failures else 0)
+
     # 커맨드라인 인자 확인
-    if len(sys.argv) > 1:
-        keyword = " ".join(sys.argv[1:])
-        quick_analyze(keyword)
+    if args.keyword:
+        keyword = " ".join(args.keyword)
+        quick_analyze(keyword, sources=args.sources)
     else:
-        interactive_mode()
+        interactive_mode(sources=args.sources)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,31 @@
+"""
+가격 분석 핵심 엔진
+GUI(price_analyzer.py), CLI(price_analyzer_cli.py), 웹 대시보드(app.py)가 함께 사용하는
+수집기, 분석기, 시각화 도구와 단계별 파이프라인입니다.
+연결 풀, 캐시, 저장소 같은 최적화는 이곳에 한 번만 추가하면 모든 프런트엔드에 적용됩니다.
+"""
+
+from .analyzer import DataAnalyzer
+from .pipeline import STAGES, PipelineCancelled, PricePipeline
+from .scraper import PriceScraper
+from .sources import DanawaSource, HtmlSource, MultiSource, PriceSource, SourceTimeout, build_sources
+from .stream import OnlineStats, Product, stream_prices
+from .visualizer import Visualizer
+
+__all__ = [
+    "DanawaSource",
+    "DataAnalyzer",
+    "HtmlSource",
+    "MultiSource",
+    "OnlineStats",
+    "PipelineCancelled",
+    "PricePipeline",
+    "Product",
+    "PriceScraper",
+    "PriceSource",
+    "SourceTimeout",
+    "STAGES",
+    "Visualizer",
+    "build_sources",
+    "stream_prices",
+]
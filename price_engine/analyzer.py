@@ -0,0 +1,253 @@
+"""
+가격 데이터 분석 및 결과 파일 저장/불러오기
+"""
+
+import pickle
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+
+class DataAnalyzer:
+    """가격 데이터의 통계 분석을 수행하는 클래스"""
+
+    # 가격 순위 조회용 캐시 설정
+    RANK_CACHE_SIZE = 256
+
+    def __init__(self, rank_refresh_interval: float = 5.0):
+        """
+        Args:
+            rank_refresh_interval: 가격 순위 캐시가 새 스냅샷을 확인하는 최소 간격 (초)
+        """
+        self.rank_refresh_interval = rank_refresh_interval
+        # (저장소 경로, 키워드, 기간) → 최근 스냅샷과 기간 전체의 정렬된 가격 배열(누적 분포)
+        self._rank_cache: Dict[Tuple[str, str, float], Dict] = {}
+        self._rank_lock = threading.Lock()
+
+    @staticmethod
+    def calculate_statistics(prices: List[int]) -> Dict[str, float]:
+        """
+        가격 리스트의 통계를 계산합니다.
+
+        Args:
+            prices: 가격 데이터 리스트
+
+        Returns:
+            통계 정보 딕셔너리 (평균, 최대, 최소, 개수)
+        """
+        if not prices:
+            return {"average": 0, "max": 0, "min": 0, "count": 0}
+
+        return {
+            "average": sum(prices) / len(prices),
+            "max": max(prices),
+            "min": min(prices),
+            "count": len(prices),
+        }
+
+    @staticmethod
+    def median(prices: List[int]) -> float:
+        """정렬된 가격 리스트의 중앙값을 반환합니다 (빈 리스트면 0)."""
+        n = len(prices)
+        if not n:
+            return 0
+        mid = n // 2
+        return prices[mid] if n % 2 else (prices[mid - 1] + prices[mid]) / 2
+
+    @staticmethod
+    def percentile_rank(sorted_prices, price: float) -> Optional[float]:
+        """
+        정렬된 가격 배열에서 가격의 백분위 순위를 이진 탐색으로 구합니다.
+        같은 가격은 절반만 아래로 세므로(중간 순위) 0이면 가장 싸고 100이면 가장 비쌉니다.
+
+        Args:
+            sorted_prices: 오름차순 가격 리스트 또는 NumPy 배열
+            price: 확인할 가격
+
+        Returns:
+            0 ~ 100 사이 백분위 (가격이 없으면 None)
+        """
+        n = len(sorted_prices)
+        if not n:
+            return None
+        lower = int(np.searchsorted(sorted_prices, price, side="left"))
+        upper = int(np.searchsorted(sorted_prices, price, side="right"))
+        return (lower + upper) / 2 / n * 100
+
+    def price_rank(self, store, keyword: str, price: float, window_days: float = 30) -> Optional[Dict]:
+        """
+        가격이 최근 스냅샷과 최근 기간 전체 기록에서 각각 몇 백분위인지 계산합니다 ("싼 가격인가?").
+        정렬된 가격 배열을 키워드별로 캐시하고, 새 스냅샷이 생겼을 때만 다시 읽으므로
+        반복 호출은 이진 탐색 몇 번으로 끝납니다.
+
+        Args:
+            store: SnapshotStore
+            keyword: 검색 키워드
+            price: 확인할 가격
+            window_days: 기간 (일, 최근 스냅샷 시각 기준으로 이전 N일)
+
+        Returns:
+            {"keyword", "price", "latest": {...}, "window": {...}} 또는 스냅샷이 없으면 None
+            (latest/window: percentile, cheaper(더 싼 가격 수), count, min, median 등)
+        """
+        entry = self._rank_entry(store, keyword, window_days)
+        if entry is None:
+            return None
+
+        result = {"keyword": keyword, "price": price}
+        for name in ("latest", "window"):
+            prices = entry[name]
+            result[name] = {
+                **entry[name + "_meta"],
+                "percentile": self.percentile_rank(prices, price),
+                "cheaper": int(np.searchsorted(prices, price, side="left")),
+            }
+        return result
+
+    @staticmethod
+    def _summary(sorted_prices: np.ndarray) -> Dict:
+        n = int(sorted_prices.size)
+        if not n:
+            return {"count": 0, "min": None, "median": None}
+        mid = n // 2
+        median = sorted_prices[mid] if n % 2 else (sorted_prices[mid - 1] + sorted_prices[mid]) / 2
+        return {"count": n, "min": int(sorted_prices[0]), "median": float(median)}
+
+    def _rank_entry(self, store, keyword: str, window_days: float) -> Optional[Dict]:
+        """키워드의 가격 순위 캐시 항목을 반환합니다 (새 스냅샷이 있으면 다시 만듦)."""
+        key = (getattr(store, "path", str(id(store))), keyword, float(window_days))
+        now = time.monotonic()
+        with self._rank_lock:
+            entry = self._rank_cache.get(key)
+        if entry is not None and now - entry["checked_at"] < self.rank_refresh_interval:
+            return entry
+
+        latest = store.list_snapshots(keyword, limit=1)
+        if not latest:
+            return None
+        latest = latest[0]
+        if entry is not None and entry["latest_id"] == latest["id"]:
+            entry["checked_at"] = now
+            return entry
+
+        # 최근 스냅샷 가격은 이미 정렬되어 있고, 기간 전체는 한 번만 합쳐 정렬 (누적 분포)
+        start = latest["taken_at"] - window_days * 86400
+        arrays = [
+            snapshot["prices"]
+            for batch in store.iter_snapshots(keyword, start=start, end=latest["taken_at"])
+            for snapshot in batch
+        ]
+        latest_prices = np.asarray(store.get_snapshot(latest["id"])["prices"], dtype=np.int64)
+        window_prices = np.sort(np.concatenate(arrays)) if arrays else latest_prices
+        entry = {
+            "checked_at": now,
+            "latest_id": latest["id"],
+            "latest": latest_prices,
+            "latest_meta": {
+                "snapshot_id": latest["id"],
+                "taken_at": latest["taken_at"],
+                **self._summary(latest_prices),
+            },
+            "window": window_prices,
+            "window_meta": {
+                "days": window_days,
+                "start": start,
+                "snapshots": len(arrays),
+                **self._summary(window_prices),
+            },
+        }
+        with self._rank_lock:
+            self._rank_cache.pop(key, None)
+            self._rank_cache[key] = entry
+            while len(self._rank_cache) > self.RANK_CACHE_SIZE:
+                self._rank_cache.pop(next(iter(self._rank_cache)))
+        return entry
+
+    @staticmethod
+    def diff_prices(old: List[int], new: List[int]) -> Tuple[List[int], List[int]]:
+        """
+        정렬된 두 가격 리스트를 한 번씩만 훑어(병합 방식) 달라진 가격을 찾습니다.
+
+        Args:
+            old: 이전 가격 리스트 (오름차순)
+            new: 새 가격 리스트 (오름차순)
+
+        Returns:
+            (새로 생긴 가격 리스트, 사라진 가격 리스트)
+        """
+        added, removed = [], []
+        i = j = 0
+        while i < len(old) and j < len(new):
+            if old[i] == new[j]:
+                i += 1
+                j += 1
+            elif old[i] < new[j]:
+                removed.append(old[i])
+                i += 1
+            else:
+                added.append(new[j])
+                j += 1
+        removed.extend(old[i:])
+        added.extend(new[j:])
+        return added, removed
+
+    @staticmethod
+    def safe_keyword(keyword: str) -> str:
+        """키워드에서 파일명에 사용할 수 없는 문자를 제거합니다 (최대 20자)."""
+        safe_keyword = "".join(
+            c for c in keyword if c.isalnum() or c in (" ", "_")
+        ).strip()
+        return safe_keyword.replace(" ", "_")[:20]
+
+    @staticmethod
+    def save_results(data: Dict, filename: str = None):
+        """
+        분석 결과를 pickle 파일로 저장합니다.
+
+        Args:
+            data: 저장할 데이터
+            filename: 저장할 파일명 (None이면 자동 생성)
+        """
+        try:
+            # 파일명이 지정되지 않은 경우 자동 생성
+            if filename is None:
+                from datetime import datetime
+
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                keyword = data.get("keyword", "unknown")
+                safe_keyword = DataAnalyzer.safe_keyword(keyword)
+                filename = f"result_{safe_keyword}_{timestamp}.pkl"
+
+            with open(filename, "wb") as f:
+                pickle.dump(data, f)
+            print(f"결과 저장 완료: {filename}")
+
+            return filename  # 저장된 파일명 반환
+        except Exception as e:
+            print(f"파일 저장 오류: {e}")
+            raise
+
+    @staticmethod
+    def load_results(filename: str = "last_result.pkl") -> Optional[Dict]:
+        """
+        pickle 파일에서 분석 결과를 불러옵니다.
+
+        Args:
+            filename: 불러올 파일명
+
+        Returns:
+            저장된 데이터 또는 None
+        """
+        try:
+            with open(filename, "rb") as f:
+                data = pickle.load(f)
+            print(f"결과 불러오기 완료: {filename}")
+            return data
+        except FileNotFoundError:
+            print(f"파일을 찾을 수 없습니다: {filename}")
+            return None
+        except Exception as e:
+            print(f"파일 불러오기 오류: {e}")
+            return None
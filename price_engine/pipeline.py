@@ -0,0 +1,246 @@
+"""
+키워드 하나를 처리하는 단계별 파이프라인
+
+    fetch → extract → filter → analyze → persist → render
+
+각 단계는 작업 상태 딕셔너리(context)를 받아 값을 채우는 함수이며,
+프런트엔드(GUI, CLI, 웹)는 필요한 단계를 교체하거나 추가/제거하여 사용합니다.
+모든 단계의 소요 시간은 metrics.stage_timer로 기록됩니다.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+
+from metrics import stage_timer
+
+from .analyzer import DataAnalyzer
+from .scraper import PriceScraper
+from .sources import MultiSource
+from .stream import OnlineStats, ProductTokenizer
+
+STAGES = ("fetch", "extract", "filter", "analyze", "persist", "render")
+
+Stage = Callable[[Dict], None]
+
+
+class PipelineCancelled(Exception):
+    """취소 토큰이 설정되어 파이프라인을 중단한 경우"""
+
+
+class PricePipeline:
+    """
+    수집부터 저장, 시각화까지의 단계를 순서대로 실행하는 클래스
+
+    context에 담기는 값:
+        keyword: 검색 키워드
+        response: fetch 결과 (304로 이전 결과를 재사용했거나 여러 소스에서 수집하면 None)
+        sources: 여러 소스에서 수집한 경우 소스별 결과 (MultiSource.collect 형식)
+        price_strings: extract 결과 (가격 문자열 제너레이터, 스트리밍)
+        prices: filter 결과 (오름차순 고유 가격 리스트)
+        products: filter 결과 (상품 번호, 상품명, 최저가 Product 리스트, 페이지 순서,
+                  여러 소스에서 수집하면 fetch 단계에서 상품 정보를 수집하는 소스의 상품만 채움)
+        statistics: analyze 결과 (calculate_statistics 형식)
+        saved_filename / snapshot_id: persist 결과
+        chart: render 결과 (프런트엔드가 정한 형식)
+    """
+
+    def __init__(
+        self,
+        scraper: Optional[PriceScraper] = None,
+        analyzer: Optional[DataAnalyzer] = None,
+        store=None,
+        save_pickle: bool = False,
+        render: Optional[Stage] = None,
+        sources: Optional[MultiSource] = None,
+    ):
+        """
+        Args:
+            scraper: 사용할 수집기 (None이면 새로 생성, 연결 풀과 응답 캐시 공유를 위해 재사용 권장)
+            analyzer: 사용할 분석기
+            store: 스냅샷 저장소 (None이면 기록하지 않음)
+            save_pickle: persist 단계에서 pickle 결과 파일도 저장할지 여부
+            render: render 단계 함수 (None이면 아무것도 하지 않음)
+            sources: 여러 가격 소스 (지정하면 fetch 단계에서 모든 소스에 동시에 검색하여 합침)
+        """
+        self.scraper = scraper or PriceScraper(verbose=False)
+        self.analyzer = analyzer or DataAnalyzer()
+        self.store = store
+        self.save_pickle = save_pickle
+        self.sources = sources
+
+        self.stages: "OrderedDict[str, Stage]" = OrderedDict(
+            [
+                ("fetch", self.fetch),
+                ("extract", self.extract),
+                ("filter", self.filter),
+                ("analyze", self.analyze),
+                ("persist", self.persist),
+                ("render", render or (lambda context: None)),
+            ]
+        )
+
+    # ---- 단계 구성 ----
+
+    def replace_stage(self, name: str, stage: Stage):
+        """기존 단계를 다른 함수로 바꿉니다."""
+        if name not in self.stages:
+            raise KeyError(f"알 수 없는 단계: {name}")
+        self.stages[name] = stage
+
+    def insert_stage(self, name: str, stage: Stage, after: Optional[str] = None):
+        """
+        새 단계를 추가합니다.
+
+        Args:
+            name: 단계 이름 (지표의 stage 레이블로도 사용)
+            stage: context를 받는 함수
+            after: 이 단계 바로 뒤에 추가 (None이면 맨 뒤)
+        """
+        if name in self.stages:
+            raise KeyError(f"이미 있는 단계: {name}")
+        items = list(self.stages.items())
+        index = len(items) if after is None else [n for n, _ in items].index(after) + 1
+        items.insert(index, (name, stage))
+        self.stages = OrderedDict(items)
+
+    def remove_stage(self, name: str):
+        """단계를 제거합니다."""
+        del self.stages[name]
+
+    # ---- 실행 ----
+
+    def run(
+        self,
+        keyword: str,
+        until: Optional[str] = None,
+        cancel_event=None,
+        on_stage: Optional[Callable[[str], None]] = None,
+    ) -> Dict:
+        """
+        키워드 하나에 대해 단계를 순서대로 실행합니다.
+        filter 단계에서 가격이 하나도 없으면 이후 단계는 건너뜁니다.
+
+        Args:
+            keyword: 검색 키워드
+            until: 이 단계까지만 실행 (None이면 끝까지)
+            cancel_event: 설정되면 다음 단계(또는 스트리밍 도중)에서 중단할 threading.Event
+            on_stage: 각 단계를 시작하기 전에 단계 이름으로 호출할 함수 (진행 표시용)
+
+        Returns:
+            context 딕셔너리
+
+        Raises:
+            PipelineCancelled: cancel_event가 설정된 경우
+        """
+        context = {"keyword": keyword, "cancel_event": cancel_event}
+        return self._run_stages(context, list(self.stages.items()), until, on_stage)
+
+    def resume(self, context: Dict, after: str, until: Optional[str] = None) -> Dict:
+        """
+        run(until=...)으로 중간까지 실행한 context에 이어서 나머지 단계를 실행합니다.
+        수집/분석과 저장/시각화를 서로 다른 스레드에서 처리할 때 사용합니다.
+
+        Args:
+            context: run()이 반환한 context
+            after: 이미 실행한 마지막 단계 이름 (이 단계 다음부터 실행)
+            until: 이 단계까지만 실행 (None이면 끝까지)
+
+        Returns:
+            context 딕셔너리
+        """
+        if context.get("stopped"):
+            return context
+        items = list(self.stages.items())
+        index = [name for name, _ in items].index(after) + 1
+        return self._run_stages(context, items[index:], until, None)
+
+    def _run_stages(self, context: Dict, stages, until: Optional[str], on_stage) -> Dict:
+        cancel_event = context.get("cancel_event")
+        for name, stage in stages:
+            if cancel_event is not None and cancel_event.is_set():
+                raise PipelineCancelled(context["keyword"])
+            if on_stage is not None:
+                on_stage(name)
+            with stage_timer(name):
+                stage(context)
+            if name == until or context.get("stopped"):
+                break
+        return context
+
+    # ---- 기본 단계 ----
+
+    def fetch(self, context: Dict):
+        """
+        검색 요청을 보냅니다 (304면 이전 가격을 바로 prices에 채움).
+        여러 소스가 설정되어 있으면 모든 소스에서 동시에 수집한 가격을 합쳐 prices에 채우고,
+        상품 정보를 수집하는 소스(DanawaSource)의 상품을 products에 채웁니다.
+        """
+        if self.sources is not None:
+            context["response"] = None
+            keyword = context["keyword"]
+            context["prices"], context["products"], context["sources"] = self.sources.collect(keyword)
+            return
+
+        response, cached = self.scraper.fetch(context["keyword"])
+        context["response"] = response
+        if cached is not None:
+            context["prices"] = cached
+            context["products"] = self.scraper.cached_products(context["keyword"]) or []
+
+    def extract(self, context: Dict):
+        """
+        응답 본문에서 가격 문자열 제너레이터를 만듭니다 (실제 읽기는 filter에서 진행).
+        같은 파싱에서 상품 목록 항목(상품 번호, 상품명, 최저가)도 함께 모읍니다.
+        """
+        if "prices" not in context:
+            context["tokenizer"] = ProductTokenizer()
+            context["price_strings"] = self.scraper.extract(context["response"], context["tokenizer"])
+
+    def filter(self, context: Dict):
+        """가격 문자열을 읽으며 유효한 고유 가격을 모으고 통계를 함께 누적합니다."""
+        if "prices" not in context:
+            online = OnlineStats()
+            cancel_event = context.get("cancel_event")
+            prices = []
+            for price in self.scraper.filter(context.pop("price_strings"), online):
+                if cancel_event is not None and cancel_event.is_set():
+                    context["response"].close()
+                    raise PipelineCancelled(context["keyword"])
+                prices.append(price)
+            prices.sort()
+            products = [
+                product
+                for product in context.pop("tokenizer").products
+                if self.scraper.min_price <= product.price <= self.scraper.max_price
+            ]
+            self.scraper.remember(context["keyword"], context["response"], prices, products)
+            context["prices"] = prices
+            context["products"] = products
+            context["online_statistics"] = online.to_dict()
+
+        if not context["prices"]:
+            context["stopped"] = True
+
+    def analyze(self, context: Dict):
+        """통계를 계산합니다 (filter에서 누적한 값이 있으면 그대로 사용)."""
+        statistics = context.pop("online_statistics", None)
+        if statistics is None:
+            statistics = self.analyzer.calculate_statistics(context["prices"])
+        context["statistics"] = statistics
+
+    def persist(self, context: Dict):
+        """설정에 따라 pickle 결과 파일과 스냅샷 저장소에 기록합니다."""
+        if self.save_pickle:
+            data = {
+                "keyword": context["keyword"],
+                "prices": context["prices"],
+                "statistics": context["statistics"],
+            }
+            context["saved_filename"] = self.analyzer.save_results(data)
+        if self.store is not None:
+            context["snapshot_id"] = self.store.add_snapshot(
+                context["keyword"],
+                context["prices"],
+                context["statistics"],
+                products=context.get("products"),
+            )
@@ -0,0 +1,277 @@
+"""
+다나와 가격 수집기
+연결 풀을 공유하는 세션, 조건부 요청 응답 캐시, 스트리밍 추출을 사용합니다.
+"""
+
+import os
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Pattern, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from metrics import CACHE_REQUESTS, stage_timer
+
+from .stream import (
+    PRICE_PATTERN,
+    OnlineStats,
+    Product,
+    ProductTokenizer,
+    iter_price_strings,
+    iter_response_chunks,
+    iter_text,
+    iter_valid_prices,
+)
+
+
+class PriceScraper:
+    """다나와 웹사이트에서 가격 데이터를 크롤링하는 클래스"""
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        verbose: bool = True,
+        query_param: str = "query",
+        params: Optional[Dict[str, str]] = None,
+        price_pattern: Pattern = PRICE_PATTERN,
+        timeout: float = 10,
+    ):
+        """
+        Args:
+            base_url: 검색 URL (None이면 DANAWA_BASE_URL 환경 변수 또는 다나와 주소 사용)
+            verbose: 진행 메시지 출력 여부 (일괄 처리 시 출력 결과와 섞이지 않도록 끔)
+            query_param: 키워드를 담을 쿼리 파라미터 이름
+            params: 함께 보낼 고정 쿼리 파라미터 (None이면 다나와 상품 탭)
+            price_pattern: 첫 번째 그룹이 숫자 부분인 가격 패턴
+            timeout: 연결 및 읽기 타임아웃 (초)
+        """
+        self.verbose = verbose
+        self.headers = {
+            "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+        }
+        self.base_url = base_url or os.environ.get(
+            "DANAWA_BASE_URL", "http://search.danawa.com/dsearch.php"
+        )
+        self.query_param = query_param
+        self.params = {"tab": "goods"} if params is None else dict(params)
+        self.price_pattern = price_pattern
+        self.timeout = timeout
+        self.min_price = 1000
+        self.max_price = 100000000
+
+        # 여러 검색을 동시에 처리할 때 연결을 재사용하기 위한 세션
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # 키워드별 마지막 응답 검증값 (ETag, Last-Modified)과 가격 리스트, 상품 정보
+        # 다음 요청에 조건부 헤더를 보내고, 서버가 304(변경 없음)로 답하면 이전 가격을 재사용합니다.
+        # response_cache에 get/set 객체(예: shared_cache.SharedCache)를 지정하면 메모리 대신 그곳에 보관합니다.
+        self.response_cache = None
+        self.response_cache_size = 256
+        self._response_cache: Dict[
+            str, Tuple[Optional[str], Optional[str], List[int], Optional[List[Product]]]
+        ] = {}
+        self._response_lock = threading.Lock()
+        self._response_hits = CACHE_REQUESTS.labels("response", "hit")
+        self._response_misses = CACHE_REQUESTS.labels("response", "miss")
+
+    def scrape_prices(self, keyword: str) -> List[int]:
+        """
+        특정 키워드로 다나와를 검색하고 가격 데이터를 수집합니다.
+
+        Args:
+            keyword: 검색할 상품 키워드
+
+        Returns:
+            수집된 가격 리스트 (정수형, 중복 제거 후 오름차순)
+        """
+        prices = []
+
+        try:
+            if self.verbose:
+                print(f"\n🔍 '{keyword}' 검색 중...")
+
+            prices = list(self.iter_prices(keyword))
+            prices.sort()
+
+            if self.verbose:
+                print(f"✅ {len(prices)}개의 가격 데이터 수집 완료")
+
+        except requests.exceptions.RequestException as e:
+            if self.verbose:
+                print(f"네트워크 오류: {e}")
+            raise Exception(f"크롤링 중 네트워크 오류가 발생했습니다: {str(e)}")
+        except Exception as e:
+            if self.verbose:
+                print(f"데이터 파싱 오류: {e}")
+            raise Exception(f"데이터 파싱 중 오류가 발생했습니다: {str(e)}")
+
+        return prices
+
+    def iter_prices(self, keyword: str, stats: Optional[OnlineStats] = None) -> Iterator[int]:
+        """
+        검색 결과 페이지를 조각 단위로 받으면서 가격을 찾는 즉시 하나씩 내보냅니다.
+        페이지 전체를 메모리에 올리지 않으며, 호출하는 쪽은 수집 도중에도 결과를 사용할 수 있습니다.
+
+        Args:
+            keyword: 검색할 상품 키워드
+            stats: 내보낸 가격을 누적할 OnlineStats (선택)
+
+        Yields:
+            페이지에 처음 나온 순서대로의 고유 가격 (정렬되지 않음)
+
+        Raises:
+            requests.exceptions.RequestException: 네트워크 오류 또는 오류 응답
+        """
+        with stage_timer("fetch"):
+            response, cached = self.fetch(keyword)
+
+        # 페이지가 바뀌지 않았으면 이전 결과 재사용
+        if cached is not None:
+            for price in cached:
+                if stats is not None:
+                    stats.add(price)
+                yield price
+            return
+
+        found = [] if self._has_validators(response) else None
+
+        # 본문 수신 → 텍스트 추출 → 가격 추출 → 필터 (소비하는 쪽의 처리 시간 포함)
+        with stage_timer("stream"):
+            for price in self.filter(self.extract(response), stats):
+                if found is not None:
+                    found.append(price)
+                yield price
+
+        # 끝까지 읽은 경우에만 다음 조건부 요청을 위해 보관
+        if found is not None:
+            self.remember(keyword, response, found)
+
+    def fetch(
+        self, keyword: str, timeout: Optional[float] = None
+    ) -> Tuple[Optional[requests.Response], Optional[List[int]]]:
+        """
+        검색 요청을 보내고 응답 헤더까지만 받습니다 (본문은 스트리밍으로 읽음).
+        이전 응답 검증값이 있으면 조건부 요청을 보냅니다.
+
+        Args:
+            keyword: 검색 키워드
+            timeout: 이 요청의 연결 및 읽기 타임아웃 (초, None이면 self.timeout)
+
+        Returns:
+            (응답, None) 또는 서버가 304로 답한 경우 (None, 이전 가격 리스트)
+
+        Raises:
+            requests.exceptions.RequestException: 네트워크 오류 또는 오류 응답
+        """
+        params = {**self.params, self.query_param: keyword}
+        cached = self._cached_response(keyword)
+        headers = self.headers
+        if cached is not None:
+            headers = dict(self.headers)
+            if cached[0]:
+                headers["If-None-Match"] = cached[0]
+            if cached[1]:
+                headers["If-Modified-Since"] = cached[1]
+
+        response = self.session.get(
+            self.base_url,
+            params=params,
+            headers=headers,
+            timeout=self.timeout if timeout is None else timeout,
+            stream=True,
+        )
+
+        if response.status_code == 304 and cached is not None:
+            response.close()
+            self._response_hits.inc()
+            return None, list(cached[2])
+
+        try:
+            response.raise_for_status()
+        except requests.exceptions.HTTPError:
+            response.close()
+            raise
+        self._response_misses.inc()
+        return response, None
+
+    def extract(
+        self, response: requests.Response, tokenizer: Optional[ProductTokenizer] = None
+    ) -> Iterator[str]:
+        """
+        응답 본문에서 가격 문자열을 찾는 즉시 내보냅니다.
+
+        Args:
+            response: fetch() 응답
+            tokenizer: 상품 정보도 함께 모을 ProductTokenizer (다 읽은 뒤 tokenizer.products 사용)
+        """
+        return iter_price_strings(
+            iter_text(iter_response_chunks(response), tokenizer), self.price_pattern
+        )
+
+    def filter(
+        self, price_strings: Iterable[str], stats: Optional[OnlineStats] = None
+    ) -> Iterator[int]:
+        """유효 범위 안의 고유 가격만 처음 나온 순서대로 내보냅니다."""
+        return iter_valid_prices(price_strings, self.min_price, self.max_price, stats)
+
+    def remember(
+        self,
+        keyword: str,
+        response: requests.Response,
+        prices: List[int],
+        products: Optional[List[Product]] = None,
+    ):
+        """
+        응답 검증값과 가격(및 상품 정보)을 응답 캐시에 저장합니다 (검증값이 없으면 저장하지 않음).
+        가득 차면 가장 오래된 키워드부터 제거합니다.
+        """
+        if not self._has_validators(response):
+            return
+        entry = (
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+            prices,
+            products,
+        )
+        if self.response_cache is not None:
+            self.response_cache.set(keyword, entry)
+            return
+        with self._response_lock:
+            self._response_cache.pop(keyword, None)
+            self._response_cache[keyword] = entry
+            while len(self._response_cache) > self.response_cache_size:
+                self._response_cache.pop(next(iter(self._response_cache)))
+
+    def _cached_response(self, keyword: str):
+        if self.response_cache is not None:
+            return self.response_cache.get(keyword)
+        with self._response_lock:
+            return self._response_cache.get(keyword)
+
+    def cached_products(self, keyword: str) -> Optional[List[Product]]:
+        """응답 캐시에 있는 키워드의 상품 정보를 반환합니다 (304 응답으로 이전 결과를 재사용할 때)."""
+        cached = self._cached_response(keyword)
+        return list(cached[3]) if cached is not None and cached[3] is not None else None
+
+    @staticmethod
+    def _has_validators(response: requests.Response) -> bool:
+        return bool(response.headers.get("ETag") or response.headers.get("Last-Modified"))
+
+    def _is_valid_price(self, price_str: str) -> bool:
+        """
+        가격이 유효한 범위 내에 있는지 확인합니다.
+
+        Args:
+            price_str: 쉼표가 포함된 가격 문자열
+
+        Returns:
+            유효 여부
+        """
+        try:
+            price = int(price_str.replace(",", ""))
+            return self.min_price <= price <= self.max_price
+        except ValueError:
+            return False
@@ -0,0 +1,301 @@
+"""
+가격 소스 플러그인
+검색 한 번을 활성화된 모든 소스에 동시에 보내고, 소스별 제한 시간 안에 도착한 결과를 하나의 가격 집합으로 합칩니다.
+전체 소요 시간은 소스 시간의 합이 아니라 가장 느린 정상 소스 시간(최대 그 소스의 제한 시간)으로 정해집니다.
+
+    DanawaSource ─┐
+    HtmlSource  ──┼─ MultiSource.collect() → 오름차순 고유 가격 + 상품 목록 + 소스별 결과
+    HtmlSource  ──┘
+
+상품 번호는 소스마다 체계가 다르므로 상품 목록은 tracks_products가 켜진 소스(DanawaSource)에서만 모읍니다.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from metrics import SOURCE_LATENCY, SOURCE_REQUESTS, stage_timer
+
+from .scraper import PriceScraper
+from .stream import Product, ProductTokenizer
+
+DEFAULT_SOURCE_TIMEOUT = 10.0
+
+
+class SourceTimeout(Exception):
+    """소스가 제한 시간 안에 수집을 끝내지 못한 경우"""
+
+
+class PriceSource:
+    """
+    가격 소스 기본 클래스
+    하위 클래스는 collect()를 구현합니다. 여러 스레드에서 동시에 호출될 수 있습니다.
+    """
+
+    name = "source"
+    tracks_products = False
+
+    def __init__(self, timeout: float = DEFAULT_SOURCE_TIMEOUT):
+        """
+        Args:
+            timeout: 이 소스의 제한 시간 (초)
+        """
+        self.timeout = timeout
+
+    def collect(self, keyword: str, deadline: Optional[float] = None) -> List[int]:
+        """
+        키워드의 가격을 수집합니다.
+
+        Args:
+            keyword: 검색 키워드
+            deadline: time.monotonic() 기준 마감 시각 (지나면 SourceTimeout)
+
+        Returns:
+            고유 가격 리스트 (정렬 여부는 무관)
+        """
+        raise NotImplementedError
+
+    def collect_products(
+        self, keyword: str, deadline: Optional[float] = None
+    ) -> Tuple[List[int], List[Product]]:
+        """
+        가격과 상품 목록을 함께 수집합니다 (기본 구현은 상품 없이 collect() 결과만 반환).
+
+        Returns:
+            (고유 가격 리스트, 상품 리스트)
+        """
+        return self.collect(keyword, deadline), []
+
+
+class HtmlSource(PriceSource):
+    """검색 결과 HTML 페이지에서 가격을 스트리밍으로 추출하는 소스 (PriceScraper 사용)"""
+
+    def __init__(
+        self,
+        name: str,
+        base_url: Optional[str] = None,
+        timeout: float = DEFAULT_SOURCE_TIMEOUT,
+        scraper: Optional[PriceScraper] = None,
+        **scraper_options,
+    ):
+        """
+        Args:
+            name: 소스 이름 (결과와 지표의 source 레이블)
+            base_url: 검색 URL
+            timeout: 제한 시간 (초, 요청 타임아웃으로도 사용)
+            scraper: 사용할 수집기 (응답 캐시와 연결 풀을 공유하려면 전달)
+            **scraper_options: 새 PriceScraper에 넘길 설정 (query_param, params, price_pattern)
+        """
+        super().__init__(timeout)
+        self.name = name
+        self.scraper = scraper or PriceScraper(
+            base_url=base_url, verbose=False, timeout=timeout, **scraper_options
+        )
+
+    def collect(self, keyword: str, deadline: Optional[float] = None) -> List[int]:
+        return self.collect_products(keyword, deadline)[0]
+
+    def collect_products(
+        self, keyword: str, deadline: Optional[float] = None
+    ) -> Tuple[List[int], List[Product]]:
+        # 공유 수집기의 요청 타임아웃 대신 이 소스의 남은 제한 시간을 사용 (마감 뒤에 스레드가 묶여 있지 않도록)
+        timeout = self.timeout
+        if deadline is not None:
+            timeout = min(timeout, max(deadline - time.monotonic(), 0.01))
+        with stage_timer("fetch"):
+            response, cached = self.scraper.fetch(keyword, timeout=timeout)
+        if cached is not None:
+            products = self.scraper.cached_products(keyword) if self.tracks_products else None
+            return cached, products or []
+
+        tokenizer = ProductTokenizer() if self.tracks_products else None
+        prices = []
+        try:
+            with stage_timer("stream"):
+                for price in self.scraper.filter(self.scraper.extract(response, tokenizer)):
+                    # 본문을 받는 도중에도 마감을 넘기면 연결을 끊고 중단
+                    if deadline is not None and time.monotonic() > deadline:
+                        raise SourceTimeout(self.name)
+                    prices.append(price)
+        finally:
+            response.close()
+
+        products = []
+        if tokenizer is not None:
+            products = [
+                product
+                for product in tokenizer.products
+                if self.scraper.min_price <= product.price <= self.scraper.max_price
+            ]
+        self.scraper.remember(keyword, response, prices, products if tokenizer is not None else None)
+        return prices, products
+
+
+class DanawaSource(HtmlSource):
+    """다나와 검색 소스 (기본 소스, 상품 목록도 함께 수집)"""
+
+    tracks_products = True
+
+    def __init__(
+        self,
+        scraper: Optional[PriceScraper] = None,
+        timeout: float = DEFAULT_SOURCE_TIMEOUT,
+    ):
+        """
+        Args:
+            scraper: 사용할 수집기 (None이면 DANAWA_BASE_URL 또는 다나와 주소로 생성)
+            timeout: 제한 시간 (초)
+        """
+        super().__init__("danawa", timeout=timeout, scraper=scraper)
+
+
+class MultiSource:
+    """여러 소스에 동시에 검색을 보내고 결과를 합치는 클래스"""
+
+    def __init__(self, sources: Iterable[PriceSource], max_workers: Optional[int] = None):
+        """
+        Args:
+            sources: 활성화된 소스 목록 (이름은 서로 달라야 함)
+            max_workers: 동시 수집 스레드 수 (None이면 소스 개수의 4배, 여러 검색이 겹쳐도 대기하지 않도록)
+        """
+        self.sources = list(sources)
+        if not self.sources:
+            raise ValueError("소스가 하나 이상 필요합니다.")
+        names = [source.name for source in self.sources]
+        if len(set(names)) != len(names):
+            raise ValueError(f"소스 이름이 중복되었습니다: {names}")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or len(self.sources) * 4, thread_name_prefix="price-source"
+        )
+
+    def collect(self, keyword: str) -> Tuple[List[int], List[Product], Dict[str, Dict]]:
+        """
+        모든 소스에서 동시에 수집하여 합칩니다.
+        제한 시간을 넘긴 소스는 기다리지 않고 결과에서 제외합니다 (스레드는 마감 확인 후 스스로 종료).
+
+        Args:
+            keyword: 검색 키워드
+
+        Returns:
+            (오름차순 고유 가격 리스트,
+             상품 리스트 (tracks_products 소스의 상품, 소스 순서),
+             {소스 이름: {"status": "ok"/"error"/"timeout", "count", "elapsed_ms", "error"}})
+
+        Raises:
+            Exception: 모든 소스가 실패한 경우 (소스별 오류 메시지 포함)
+        """
+        start = time.monotonic()
+        pending = {}
+        for source in self.sources:
+            deadline = start + source.timeout
+            future = self._executor.submit(self._collect_one, source, keyword, deadline)
+            pending[future] = (source, deadline)
+
+        merged = set()
+        products: Dict[str, List[Product]] = {}
+        report: Dict[str, Dict] = {}
+        while pending:
+            next_deadline = min(deadline for _, deadline in pending.values())
+            done, _ = wait(
+                pending, timeout=max(next_deadline - time.monotonic(), 0), return_when=FIRST_COMPLETED
+            )
+
+            for future in done:
+                source, _ = pending.pop(future)
+                try:
+                    prices, source_products, elapsed = future.result()
+                except SourceTimeout:
+                    report[source.name] = self._record(source, "timeout", start, error="제한 시간 초과")
+                except Exception as e:
+                    report[source.name] = self._record(source, "error", start, error=str(e))
+                else:
+                    merged.update(prices)
+                    products[source.name] = source_products
+                    report[source.name] = self._record(source, "ok", start, elapsed, len(prices))
+
+            # 마감이 지난 소스는 더 기다리지 않음
+            now = time.monotonic()
+            for future, (source, deadline) in list(pending.items()):
+                if now >= deadline and not future.done():
+                    del pending[future]
+                    report[source.name] = self._record(source, "timeout", start, error="제한 시간 초과")
+
+        if not any(item["status"] == "ok" for item in report.values()):
+            errors = "; ".join(f"{name}: {item['error']}" for name, item in report.items())
+            raise Exception(f"모든 가격 소스에서 수집에 실패했습니다 ({errors})")
+
+        ordered = [product for source in self.sources for product in products.get(source.name, [])]
+        return sorted(merged), ordered, {source.name: report[source.name] for source in self.sources}
+
+    @staticmethod
+    def _collect_one(
+        source: PriceSource, keyword: str, deadline: float
+    ) -> Tuple[List[int], List[Product], float]:
+        start = time.monotonic()
+        prices, products = source.collect_products(keyword, deadline)
+        return prices, products, time.monotonic() - start
+
+    @staticmethod
+    def _record(
+        source: PriceSource,
+        status: str,
+        start: float,
+        elapsed: Optional[float] = None,
+        count: int = 0,
+        error: Optional[str] = None,
+    ) -> Dict:
+        if elapsed is None:
+            elapsed = time.monotonic() - start
+        SOURCE_REQUESTS.labels(source.name, status).inc()
+        SOURCE_LATENCY.labels(source.name).observe(elapsed)
+        return {
+            "status": status,
+            "count": count,
+            "elapsed_ms": round(elapsed * 1000, 1),
+            "error": error,
+        }
+
+    def close(self):
+        """작업 스레드를 정리합니다 (진행 중인 수집은 기다리지 않음)."""
+        self._executor.shutdown(wait=False)
+
+
+def build_sources(
+    spec: Optional[str] = None,
+    danawa_scraper: Optional[PriceScraper] = None,
+    timeout: Optional[float] = None,
+) -> Optional[MultiSource]:
+    """
+    소스 설정 문자열로 MultiSource를 만듭니다.
+
+    Args:
+        spec: 쉼표로 구분한 소스 목록. "danawa" 또는 "이름=검색 URL" (키워드는 query 파라미터로 전달)
+              예: "danawa,shop=http://127.0.0.1:8901/dsearch.php"
+              None이면 PRICE_SOURCES 환경 변수 사용
+        danawa_scraper: danawa 소스가 사용할 수집기 (응답 캐시 공유용)
+        timeout: 소스별 제한 시간 (초, None이면 PRICE_SOURCE_TIMEOUT 환경 변수 또는 10초)
+
+    Returns:
+        MultiSource 또는 설정이 없으면 None (단일 다나와 수집기를 그대로 사용)
+    """
+    if spec is None:
+        spec = os.environ.get("PRICE_SOURCES", "")
+    if timeout is None:
+        timeout = float(os.environ.get("PRICE_SOURCE_TIMEOUT", DEFAULT_SOURCE_TIMEOUT))
+
+    sources: List[PriceSource] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        if item == "danawa":
+            sources.append(DanawaSource(scraper=danawa_scraper, timeout=timeout))
+            continue
+        name, sep, url = item.partition("=")
+        if not sep or not name.strip() or not url.strip():
+            raise ValueError(f"소스 설정 형식 오류 (danawa 또는 이름=URL): {item}")
+        sources.append(HtmlSource(name.strip(), url.strip(), timeout=timeout))
+
+    return MultiSource(sources) if sources else None
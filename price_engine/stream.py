@@ -0,0 +1,286 @@
+"""
+스트리밍 가격 추출 파이프라인
+응답 본문을 조각(chunk) 단위로 읽어 가격을 찾는 즉시 하나씩 내보냅니다.
+
+    응답 조각 → 텍스트 토크나이저 → 가격 문자열 → 범위 필터/중복 제거 → 온라인 통계
+
+각 단계는 제너레이터이므로 페이지 전체 문자열, 파싱 트리, 전체 매칭 리스트를 만들지 않으며,
+메모리 사용량은 페이지 크기와 관계없이 (조각 크기 + 고유 가격 개수) 정도로 유지됩니다.
+호출하는 쪽은 수집이 끝나기 전에도 지금까지 찾은 가격을 바로 사용할 수 있습니다.
+"""
+
+import codecs
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Pattern
+
+from metrics import PRICES_EXTRACTED, PRICES_FILTERED
+
+# scrape_prices와 같은 가격 패턴 ("15,900원", "15,900 원")
+PRICE_PATTERN = re.compile(r"(\d[\d,]*)\s*원")
+# 조각 끝에 걸쳐 아직 끝나지 않았을 수 있는 가격 ("15,9" + "00원")
+PARTIAL_TAIL = re.compile(r"\d[\d,]*\s*$")
+# 다음 조각으로 넘길 최대 길이 (비정상적으로 긴 숫자열이 메모리를 차지하지 않도록)
+MAX_CARRY = 256
+
+DEFAULT_CHUNK_SIZE = 16 * 1024
+
+
+def iter_response_chunks(response, chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[str]:
+    """
+    requests 응답(stream=True)을 문자열 조각으로 읽습니다.
+    여러 바이트로 된 한글이 조각 경계에서 잘리지 않도록 점진적 디코더를 사용합니다.
+
+    Args:
+        response: requests.Response 객체
+        chunk_size: 한 번에 읽을 바이트 수
+    """
+    decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+    try:
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+    finally:
+        response.close()
+
+
+class _TextTokenizer(HTMLParser):
+    """태그를 제외한 본문 텍스트만 모으는 점진적 HTML 토크나이저 (script/style 내용은 건너뜀)"""
+
+    SKIP_TAGS = {"script", "style", "template"}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.pending: List[str] = []
+        self._skip_depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self._skip_depth += 1
+
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS and self._skip_depth:
+            self._skip_depth -= 1
+
+    def handle_data(self, data):
+        if not self._skip_depth:
+            self.pending.append(data)
+
+
+class Product(NamedTuple):
+    """검색 결과의 상품 한 건 (상품 번호, 상품명, 판매처 중 최저가)"""
+
+    id: int
+    name: str
+    price: int
+
+
+class ProductTokenizer(_TextTokenizer):
+    """
+    본문 텍스트와 함께 상품 목록 항목(li.prod_item)의 상품 번호, 상품명, 최저가를 모으는 토크나이저
+    가격 추출과 같은 한 번의 파싱으로 처리하며, 끝난 상품은 products에 순서대로 쌓입니다.
+    """
+
+    ITEM_ID_PREFIX = "productItem"
+
+    def __init__(self):
+        super().__init__()
+        self.products: List[Product] = []
+        self._item: Optional[Dict] = None
+        self._li_depth = 0
+        self._field: Optional[str] = None
+
+    def handle_starttag(self, tag, attrs):
+        super().handle_starttag(tag, attrs)
+        if tag == "li":
+            if self._item is not None:
+                self._li_depth += 1
+                return
+            attrs = dict(attrs)
+            classes = (attrs.get("class") or "").split()
+            item_id = attrs.get("id") or ""
+            if "prod_item" in classes and item_id.startswith(self.ITEM_ID_PREFIX):
+                try:
+                    product_id = int(item_id[len(self.ITEM_ID_PREFIX):])
+                except ValueError:
+                    return
+                self._item = {"id": product_id, "name": [], "prices": []}
+                self._li_depth = 1
+        elif tag == "p" and self._item is not None:
+            classes = (dict(attrs).get("class") or "").split()
+            if "prod_name" in classes:
+                self._field = "name"
+            elif "price_sect" in classes:
+                self._field = "price"
+                self._item["price_text"] = []
+
+    def handle_endtag(self, tag):
+        super().handle_endtag(tag)
+        if self._item is None:
+            return
+        if tag == "p" and self._field is not None:
+            if self._field == "price":
+                text = "".join(self._item.pop("price_text"))
+                self._item["prices"].extend(
+                    int(match.group(1).replace(",", "")) for match in PRICE_PATTERN.finditer(text)
+                )
+            self._field = None
+        elif tag == "li":
+            self._li_depth -= 1
+            if self._li_depth == 0:
+                item, self._item, self._field = self._item, None, None
+                name = " ".join("".join(item["name"]).split())
+                if name and item["prices"]:
+                    self.products.append(Product(item["id"], name, min(item["prices"])))
+
+    def handle_data(self, data):
+        super().handle_data(data)
+        if self._field == "name":
+            self._item["name"].append(data)
+        elif self._field == "price":
+            self._item["price_text"].append(data)
+
+
+def iter_text(chunks: Iterable[str], tokenizer: Optional[_TextTokenizer] = None) -> Iterator[str]:
+    """
+    HTML 조각에서 본문 텍스트 조각을 순서대로 내보냅니다.
+    BeautifulSoup의 get_text()처럼 텍스트 노드를 구분자 없이 이어 붙인 결과와 같습니다.
+
+    Args:
+        chunks: HTML 문자열 조각
+        tokenizer: 사용할 토크나이저 (상품 정보도 모으려면 ProductTokenizer 전달)
+    """
+    tokenizer = tokenizer or _TextTokenizer()
+    for chunk in chunks:
+        tokenizer.feed(chunk)
+        if tokenizer.pending:
+            yield "".join(tokenizer.pending)
+            tokenizer.pending.clear()
+    tokenizer.close()
+    if tokenizer.pending:
+        yield "".join(tokenizer.pending)
+
+
+def iter_price_strings(texts: Iterable[str], pattern: Pattern = PRICE_PATTERN) -> Iterator[str]:
+    """
+    텍스트 조각에서 가격 문자열("15,900" 등)을 찾는 즉시 내보냅니다.
+    조각 경계에 걸친 가격은 끝부분을 다음 조각으로 넘겨 이어서 찾습니다.
+
+    Args:
+        texts: 본문 텍스트 조각
+        pattern: 첫 번째 그룹이 숫자 부분인 가격 패턴 (소스마다 표기가 다른 경우 지정)
+    """
+    carry = ""
+    for text in texts:
+        buffer = carry + text
+        end = 0
+        for match in pattern.finditer(buffer):
+            yield match.group(1)
+            end = match.end()
+
+        if pattern is PRICE_PATTERN:
+            tail = PARTIAL_TAIL.search(buffer, end)
+            carry = buffer[tail.start():][-MAX_CARRY:] if tail else ""
+        else:
+            # 다른 패턴은 끝이 어떤 모양일지 모르므로 마지막 일치 뒤 텍스트를 그대로 넘김
+            carry = buffer[max(end, len(buffer) - MAX_CARRY):]
+    # 마지막 조각 뒤에는 가격이 이어질 수 없으므로 남은 부분은 버림
+
+
+def iter_valid_prices(
+    price_strings: Iterable[str],
+    min_price: int = 1000,
+    max_price: int = 100000000,
+    stats: Optional["OnlineStats"] = None,
+) -> Iterator[int]:
+    """
+    가격 문자열을 정수로 바꾸고 범위 밖 가격과 중복 가격을 걸러 처음 나온 순서대로 내보냅니다.
+
+    Args:
+        price_strings: 쉼표가 포함된 가격 문자열
+        min_price: 최소 유효 가격
+        max_price: 최대 유효 가격
+        stats: 통과한 가격을 누적할 OnlineStats (선택)
+    """
+    seen = set()
+    matched = out_of_range = duplicates = 0
+    try:
+        for text in price_strings:
+            matched += 1
+            try:
+                price = int(text.replace(",", ""))
+            except ValueError:
+                out_of_range += 1
+                continue
+            if not min_price <= price <= max_price:
+                out_of_range += 1
+                continue
+            if price in seen:
+                duplicates += 1
+                continue
+            seen.add(price)
+            if stats is not None:
+                stats.add(price)
+            yield price
+    finally:
+        # 중간에 소비를 멈춰도 지금까지 처리한 개수는 기록
+        PRICES_EXTRACTED.inc(matched)
+        PRICES_FILTERED.labels("out_of_range").inc(out_of_range)
+        PRICES_FILTERED.labels("duplicate").inc(duplicates)
+
+
+def stream_prices(
+    chunks: Iterable[str],
+    min_price: int = 1000,
+    max_price: int = 100000000,
+    stats: Optional["OnlineStats"] = None,
+) -> Iterator[int]:
+    """
+    HTML 조각부터 유효한 고유 가격까지 전체 파이프라인을 연결합니다.
+
+    Args:
+        chunks: HTML 문자열 조각 (iter_response_chunks() 결과 또는 문자열 리스트)
+        min_price: 최소 유효 가격
+        max_price: 최대 유효 가격
+        stats: 통과한 가격을 누적할 OnlineStats (선택)
+
+    Yields:
+        페이지에 처음 나온 순서대로의 가격 (정렬되지 않음)
+    """
+    return iter_valid_prices(
+        iter_price_strings(iter_text(chunks)), min_price, max_price, stats
+    )
+
+
+class OnlineStats:
+    """가격을 하나씩 받으면서 개수, 합계, 최솟값, 최댓값을 누적하는 클래스"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def add(self, price: int):
+        """가격 하나를 누적합니다."""
+        self.count += 1
+        self.total += price
+        if self.min is None or price < self.min:
+            self.min = price
+        if self.max is None or price > self.max:
+            self.max = price
+
+    def to_dict(self) -> Dict[str, float]:
+        """calculate_statistics()와 같은 형식의 통계를 반환합니다 (지금까지 받은 가격 기준)."""
+        if not self.count:
+            return {"average": 0, "max": 0, "min": 0, "count": 0}
+        return {
+            "average": self.total / self.count,
+            "max": self.max,
+            "min": self.min,
+            "count": self.count,
+        }
@@ -0,0 +1,128 @@
+"""
+가격 분포 시각화
+pyplot 전역 상태를 쓰지 않는 Figure 객체로 그리므로 여러 스레드와 GUI에서 함께 사용할 수 있습니다.
+"""
+
+from typing import List
+
+import matplotlib
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.ticker import FuncFormatter
+
+
+class Visualizer:
+    """데이터 시각화를 담당하는 클래스"""
+
+    def __init__(self, verbose: bool = True):
+        self.verbose = verbose
+        self._setup_korean_font()
+
+    def _setup_korean_font(self):
+        """한글 깨짐 방지를 위한 폰트 설정"""
+        try:
+            # macOS용 한글 폰트 설정
+            matplotlib.rcParams["font.family"] = "AppleGothic"
+            matplotlib.rcParams["axes.unicode_minus"] = False
+        except:
+            try:
+                # Windows용 한글 폰트 설정
+                matplotlib.rcParams["font.family"] = "Malgun Gothic"
+                matplotlib.rcParams["axes.unicode_minus"] = False
+            except:
+                print("⚠️  한글 폰트 설정 실패. 기본 폰트를 사용합니다.")
+
+    def create_histogram_figure(
+        self, prices: List[int], keyword: str, figsize=(6, 4)
+    ) -> Figure:
+        """
+        가격 분포 히스토그램 Figure를 만듭니다 (pyplot 창을 열지 않음).
+
+        Args:
+            prices: 가격 데이터 리스트
+            keyword: 검색 키워드
+            figsize: 그림 크기 (인치)
+
+        Returns:
+            matplotlib Figure 객체 (GUI에 포함하거나 파일로 저장)
+        """
+        fig = Figure(figsize=figsize, dpi=100)
+        self._draw_histogram(fig.add_subplot(111), prices, keyword)
+        fig.tight_layout()
+        return fig
+
+    def save_histogram(
+        self, prices: List[int], keyword: str, filename: str = "price_histogram.png"
+    ):
+        """
+        가격 분포 히스토그램을 파일로 저장합니다.
+
+        Args:
+            prices: 가격 데이터 리스트
+            keyword: 검색 키워드
+            filename: 저장할 파일명
+        """
+        if not prices:
+            if self.verbose:
+                print("시각화할 데이터가 없습니다.")
+            return
+
+        try:
+            fig = self.create_histogram_figure(prices, keyword, figsize=(10, 6))
+            FigureCanvasAgg(fig).print_figure(filename, dpi=150, bbox_inches="tight")
+
+            if self.verbose:
+                print(f"히스토그램 저장 완료: {filename}")
+
+        except Exception as e:
+            if self.verbose:
+                print(f"시각화 오류: {e}")
+
+    def plot_histogram(self, prices: List[int], keyword: str):
+        """
+        가격 분포 히스토그램을 pyplot 창으로 표시합니다 (스크립트에서 사용).
+
+        Args:
+            prices: 가격 데이터 리스트
+            keyword: 검색 키워드
+        """
+        if not prices:
+            print("시각화할 데이터가 없습니다.")
+            return
+
+        import matplotlib.pyplot as plt
+
+        try:
+            fig = plt.figure(figsize=(10, 6))
+            self._draw_histogram(fig.gca(), prices, keyword)
+            fig.tight_layout()
+            plt.show()
+
+        except Exception as e:
+            print(f"시각화 오류: {e}")
+
+    @staticmethod
+    def _draw_histogram(ax, prices: List[int], keyword: str):
+        """축(ax)에 가격 분포 히스토그램과 평균선을 그립니다."""
+        # 히스토그램 생성
+        ax.hist(prices, bins=20, color="skyblue", edgecolor="black", alpha=0.7)
+
+        # 차트 설정
+        ax.set_title(f"Price Distribution - {keyword}", fontsize=16, fontweight="bold")
+        ax.set_xlabel("가격 (원)", fontsize=12)
+        ax.set_ylabel("빈도", fontsize=12)
+        ax.grid(axis="y", alpha=0.3)
+
+        # 통계선 추가
+        avg_price = sum(prices) / len(prices)
+        ax.axvline(
+            avg_price,
+            color="red",
+            linestyle="--",
+            linewidth=2,
+            label=f"평균: {avg_price:,.0f}원",
+        )
+        ax.legend()
+
+        # 가격 포맷팅
+        ax.xaxis.set_major_formatter(FuncFormatter(lambda x, p: f"{int(x):,}"))
@@ -0,0 +1,197 @@
+"""
+요청 단위 프로파일링
+헤더/쿼리 플래그 또는 샘플링 비율로 선택된 요청만 cProfile(및 tracemalloc)로 측정하고,
+결과를 순환 디렉토리에 저장합니다.
+"""
+
+import cProfile
+import hmac
+import io
+import os
+import pstats
+import random
+import re
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# 토큰이 없을 때 프로파일링과 조회를 허용하는 주소 (같은 서버에서 접속한 경우)
+LOCAL_ADDRESSES = {"127.0.0.1", "::1", "localhost"}
+
+
+class RequestProfiler:
+    """선택된 요청을 프로파일링하고 결과 파일을 관리하는 클래스"""
+
+    def __init__(
+        self,
+        directory: str = "profiles",
+        sample_rate: float = 0.0,
+        max_files: int = 50,
+        token: Optional[str] = None,
+    ):
+        """
+        Args:
+            directory: 프로파일 결과를 저장할 디렉토리
+            sample_rate: 플래그 없이도 프로파일링할 요청 비율 (0.0 ~ 1.0)
+            max_files: 보관할 최대 프로파일 개수 (초과 시 오래된 것부터 삭제)
+            token: 설정 시 같은 값을 보낸 요청만 프로파일링 및 조회 허용
+                   (없으면 같은 서버에서 직접 접속한 요청만 허용)
+        """
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.max_files = max_files
+        self.token = token
+        # cProfile은 프로세스 안에서 동시에 하나만 실행할 수 있음
+        self._active = threading.Lock()
+
+    def is_authorized(self, supplied: Optional[str], headers, remote_addr: Optional[str]) -> bool:
+        """
+        프로파일링 요청과 프로파일 조회를 허용할지 확인합니다.
+        토큰이 설정되어 있으면 같은 토큰을 보낸 요청만, 없으면 같은 서버에서 직접 접속한 요청만 허용합니다.
+
+        Args:
+            supplied: 요청이 보낸 토큰 (X-Profile 헤더 또는 쿼리 값)
+            headers: 요청 헤더 (프록시를 거친 요청인지 확인)
+            remote_addr: 접속한 주소
+
+        Returns:
+            허용 여부
+        """
+        if self.token is not None:
+            return supplied is not None and hmac.compare_digest(supplied.encode(), self.token.encode())
+        # 같은 서버의 리버스 프록시를 거친 외부 요청은 로컬 주소로 보이므로 전달 헤더가 있으면 거부
+        if headers.get("X-Forwarded-For") or headers.get("Forwarded"):
+            return False
+        return remote_addr in LOCAL_ADDRESSES
+
+    def should_profile(self, headers, args, remote_addr: Optional[str] = None) -> bool:
+        """
+        요청을 프로파일링할지 결정합니다.
+        플래그로 요청한 경우는 is_authorized()를 통과해야 하며, 샘플링은 서버 설정이므로 항상 적용합니다.
+
+        Args:
+            headers: 요청 헤더
+            args: 쿼리 파라미터
+            remote_addr: 접속한 주소
+
+        Returns:
+            프로파일링 여부
+        """
+        requested = headers.get("X-Profile") or args.get("profile")
+        if requested:
+            return self.is_authorized(requested, headers, remote_addr)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def wants_memory(self, headers, args) -> bool:
+        """메모리 할당(tracemalloc) 측정도 요청했는지 확인합니다."""
+        return (headers.get("X-Profile-Memory") or args.get("profile_memory")) == "1"
+
+    def start(self, memory: bool = False) -> Optional[Dict]:
+        """
+        프로파일링을 시작합니다.
+
+        Returns:
+            진행 중인 프로파일 상태 또는 None (다른 요청이 프로파일링 중인 경우)
+        """
+        if not self._active.acquire(blocking=False):
+            return None
+
+        session = {"profiler": cProfile.Profile(), "memory": False, "start": time.perf_counter()}
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            session["memory"] = True
+        session["profiler"].enable()
+        return session
+
+    def stop(self, session: Dict, label: str) -> str:
+        """
+        프로파일링을 종료하고 결과를 저장합니다.
+
+        Args:
+            session: start()가 반환한 상태
+            label: 파일명에 사용할 요청 이름 (예: "POST /api/search")
+
+        Returns:
+            저장된 프로파일 이름
+        """
+        try:
+            session["profiler"].disable()
+            elapsed = time.perf_counter() - session["start"]
+
+            memory_report = ""
+            if session["memory"]:
+                snapshot = tracemalloc.take_snapshot()
+                current, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                top = snapshot.statistics("lineno")[:20]
+                memory_report = (
+                    f"\n\n# tracemalloc: current={current:,} bytes, peak={peak:,} bytes\n"
+                    + "\n".join(str(stat) for stat in top)
+                )
+
+            os.makedirs(self.directory, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+            safe_label = re.sub(r"[^A-Za-z0-9]+", "_", label).strip("_")[:40]
+            name = f"{timestamp}_{safe_label}"
+
+            session["profiler"].dump_stats(os.path.join(self.directory, name + ".prof"))
+
+            stream = io.StringIO()
+            stream.write(f"# {label} ({elapsed * 1000:.1f} ms)\n\n")
+            stats = pstats.Stats(session["profiler"], stream=stream)
+            stats.sort_stats("cumulative").print_stats(40)
+            stream.write(memory_report)
+            with open(os.path.join(self.directory, name + ".txt"), "w", encoding="utf-8") as f:
+                f.write(stream.getvalue())
+
+            self._rotate()
+            return name
+        finally:
+            self._active.release()
+
+    def list_profiles(self) -> List[Dict]:
+        """저장된 프로파일 목록을 최신순으로 반환합니다."""
+        if not os.path.isdir(self.directory):
+            return []
+
+        profiles = []
+        for file in os.listdir(self.directory):
+            if not file.endswith(".prof"):
+                continue
+            path = os.path.join(self.directory, file)
+            profiles.append(
+                {
+                    "name": file[: -len(".prof")],
+                    "size": os.path.getsize(path),
+                    "date": datetime.fromtimestamp(os.path.getmtime(path)).strftime(
+                        "%Y-%m-%d %H:%M:%S"
+                    ),
+                }
+            )
+        return sorted(profiles, key=lambda p: p["name"], reverse=True)
+
+    def profile_path(self, name: str, kind: str) -> Optional[str]:
+        """
+        프로파일 파일 경로를 반환합니다.
+
+        Args:
+            name: 프로파일 이름
+            kind: "prof" (cProfile 원본) 또는 "txt" (요약 리포트)
+
+        Returns:
+            파일 경로 또는 None (잘못된 이름이거나 파일이 없는 경우)
+        """
+        if kind not in ("prof", "txt") or not re.fullmatch(r"[A-Za-z0-9_]+", name):
+            return None
+        path = os.path.join(self.directory, f"{name}.{kind}")
+        return path if os.path.isfile(path) else None
+
+    def _rotate(self):
+        """보관 개수를 초과한 오래된 프로파일을 삭제합니다."""
+        for profile in self.list_profiles()[self.max_files :]:
+            for kind in ("prof", "txt"):
+                path = os.path.join(self.directory, f"{profile['name']}.{kind}")
+                if os.path.exists(path):
+                    os.remove(path)
@@ -0,0 +1,129 @@
+"""
+검색 결과 캐시
+키워드별 분석 결과를 일정 시간(TTL) 동안 메모리에 보관합니다.
+여러 작업 프로세스가 함께 쓰는 캐시는 같은 인터페이스의 shared_cache.SharedCache를 사용합니다.
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from metrics import CACHE_REQUESTS
+
+
+class ResultCache:
+    """키워드별 분석 결과를 TTL 동안 보관하는 스레드 안전 캐시 클래스"""
+
+    def __init__(self, ttl: float = 300, max_entries: int = 256, name: str = "result"):
+        """
+        Args:
+            ttl: 결과를 신선하다고 간주하는 시간 (초)
+            max_entries: 보관할 최대 키워드 개수
+            name: 지표(metrics)에 표시할 캐시 이름
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = {}
+        self._lock = threading.Lock()
+        # 계산 중인 키별 잠금 (같은 키를 여러 스레드가 동시에 계산하지 않도록)
+        self._computing: Dict[str, threading.Lock] = {}
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+
+    @staticmethod
+    def normalize_key(keyword: str) -> str:
+        """대소문자와 연속 공백 차이를 무시하는 캐시 키를 만듭니다."""
+        return " ".join(keyword.split()).lower()
+
+    def get(self, keyword: str) -> Optional[Dict]:
+        """
+        신선한 캐시 결과를 반환합니다.
+
+        Args:
+            keyword: 검색 키워드
+
+        Returns:
+            캐시된 결과 또는 None (없거나 만료된 경우)
+        """
+        with self._lock:
+            value = self._lookup(self.normalize_key(keyword))
+        if value is None:
+            self._misses.inc()
+            return None
+        self._hits.inc()
+        return value
+
+    def _lookup(self, key: str) -> Optional[Dict]:
+        """신선한 값 또는 None (만료된 항목은 지움, self._lock을 잡은 상태에서 호출)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if time.monotonic() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        return value
+
+    def get_or_compute(
+        self, keyword: str, compute: Callable[[], Optional[Dict]]
+    ) -> Tuple[Optional[Dict], bool]:
+        """
+        캐시 결과를 반환하고, 없으면 계산하여 저장합니다.
+        다른 스레드가 같은 키를 계산 중이면 끝날 때까지 기다렸다가 그 결과를 사용합니다.
+
+        Args:
+            keyword: 검색 키워드
+            compute: 결과를 계산하는 함수 (None을 반환하면 저장하지 않음, 예외는 그대로 전달)
+
+        Returns:
+            (결과, 캐시 적중 여부)
+        """
+        key = self.normalize_key(keyword)
+        with self._lock:
+            value = self._lookup(key)
+            if value is None:
+                computing = self._computing.setdefault(key, threading.Lock())
+        if value is not None:
+            self._hits.inc()
+            return value, True
+
+        with computing:
+            with self._lock:
+                value = self._lookup(key)
+            if value is not None:
+                self._hits.inc()
+                return value, True
+
+            self._misses.inc()
+            try:
+                value = compute()
+                if value is not None:
+                    self.set(keyword, value)
+            finally:
+                with self._lock:
+                    if self._computing.get(key) is computing:
+                        del self._computing[key]
+        return value, False
+
+    def set(self, keyword: str, value: Dict, age: float = 0):
+        """
+        결과를 캐시에 저장합니다. 가득 찬 경우 가장 오래된 항목을 제거합니다.
+
+        Args:
+            keyword: 검색 키워드
+            value: 저장할 결과
+            age: 결과가 이미 지난 시간 (초, 저장소에서 불러온 결과는 수집 후 지난 시간만큼 일찍 만료)
+        """
+        key = self.normalize_key(keyword)
+        with self._lock:
+            self._entries.pop(key, None)
+            if len(self._entries) >= self.max_entries:
+                oldest = next(iter(self._entries))
+                del self._entries[oldest]
+            self._entries[key] = (time.monotonic() - age, value)
+
+    def clear(self):
+        """캐시를 비웁니다."""
+        with self._lock:
+            self._entries.clear()
+            self._computing.clear()
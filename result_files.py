@@ -0,0 +1,85 @@
+"""
+저장된 결과 파일 색인
+자동 저장된 result_*.pkl 파일의 요약(키워드, 통계, 수정 시각)을 메모리에 보관합니다.
+파일 목록과 수정 시각만 매번 확인하고, 새로 생겼거나 바뀐 파일만 unpickle하므로
+가격 목록이 큰 결과 파일이 많아도 최근 결과 목록(/api/history)을 바로 만들 수 있습니다.
+"""
+
+import glob
+import os
+import threading
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+
+class ResultFileIndex:
+    """결과 pickle 파일의 요약을 (파일명, 수정 시각) 기준으로 보관하는 스레드 안전 클래스"""
+
+    def __init__(self, loader: Callable[[str], Optional[Dict]], pattern: str = "result_*.pkl"):
+        """
+        Args:
+            loader: 파일명을 받아 저장된 결과를 반환하는 함수 (DataAnalyzer.load_results, 실패하면 None)
+            pattern: 결과 파일 glob 패턴
+        """
+        self.loader = loader
+        self.pattern = pattern
+        self._summaries: Dict[str, Tuple[float, Optional[Dict]]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._summaries)
+
+    def _summary(self, filename: str, mtime: float) -> Optional[Dict]:
+        """캐시된 요약 또는 파일을 읽어 만든 요약 (읽지 못한 파일은 None으로 기억)"""
+        with self._lock:
+            cached = self._summaries.get(filename)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            data = self.loader(filename)
+        except Exception:
+            data = None
+        summary = None
+        if data:
+            summary = {
+                "filename": filename,
+                "keyword": data.get("keyword", "Unknown"),
+                "date": datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M"),
+                "stats": data.get("statistics", {}),
+            }
+        with self._lock:
+            self._summaries[filename] = (mtime, summary)
+        return summary
+
+    def recent(self, limit: int = 10) -> List[Dict]:
+        """
+        최근에 수정된 결과 파일의 요약을 반환합니다.
+
+        Args:
+            limit: 최대 개수
+
+        Returns:
+            {"filename", "keyword", "date", "stats"} 리스트 (최신순, 읽지 못한 파일은 제외)
+        """
+        files = []
+        for filename in glob.glob(self.pattern):
+            try:
+                files.append((os.path.getmtime(filename), filename))
+            except OSError:
+                continue  # 목록을 읽은 뒤 삭제된 파일
+
+        # 삭제된 파일의 요약은 버림
+        existing = {filename for _, filename in files}
+        with self._lock:
+            for filename in [name for name in self._summaries if name not in existing]:
+                del self._summaries[filename]
+
+        history = []
+        for mtime, filename in sorted(files, reverse=True):
+            if len(history) >= limit:
+                break
+            summary = self._summary(filename, mtime)
+            if summary is not None:
+                history.append(summary)
+        return history
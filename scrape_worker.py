@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+"""
+수집 작업 프로세스
+job_queue.JobQueue에 쌓인 키워드 작업을 임대하여 수집하고 결과를 스냅샷 저장소에 기록합니다.
+대기열 파일과 스냅샷 저장소를 함께 쓰는 한 같은 호스트에서 원하는 만큼 실행할 수 있으며,
+--shard i/n을 주면 crc32(키워드) % n == i인 키워드만 맡습니다.
+여러 호스트가 공유 파일 시스템의 파일을 함께 쓰려면 모든 프로세스에 --shared-fs(롤백 저널)를 지정합니다
+(기본 WAL 모드는 네트워크 파일 시스템에서 동작하지 않음).
+
+    enqueue ─→ jobs.db ─┬─ 작업 프로세스 (--shard 0/3) ─┐
+                        ├─ 작업 프로세스 (--shard 1/3) ─┼─→ snapshots.db
+                        └─ 작업 프로세스 (--shard 2/3) ─┘
+
+수집에 실패한 작업은 지수 백오프로 다시 시도합니다. 처리 중인 작업은 임대 시간(visibility timeout)의
+1/3마다 임대를 연장하므로 오래 걸려도 다른 프로세스가 중복 수집하지 않고, 작업 프로세스가 죽어
+완료하지 못한 작업은 임대 시간이 지나면 같은 샤드를 맡은 프로세스가 다시 가져갑니다.
+--processes로 띄운 샤드 프로세스가 비정상 종료하면 관리 프로세스가 같은 샤드로 다시 띄웁니다.
+
+사용법:
+    python scrape_worker.py enqueue keywords.txt
+    python scrape_worker.py work --processes 4 --concurrency 4
+    python scrape_worker.py work --shard 1/4 --drain
+    python scrape_worker.py --shared-fs --queue /shared/jobs.db work --shard 1/4 --db /shared/snapshots.db
+    python scrape_worker.py status
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from job_queue import JobQueue, parse_shard
+
+
+def worker_id() -> str:
+    """임대 소유자로 기록할 작업자 식별자 (호스트:프로세스)"""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class ScrapeWorker:
+    """대기열에서 작업을 가져와 수집하고 저장하는 작업자 클래스 (스레드 여러 개로 동시에 처리)"""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        store,
+        shard: Optional[Tuple[int, int]] = None,
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        pipeline=None,
+        out=None,
+    ):
+        """
+        Args:
+            queue: 작업 대기열
+            store: 결과를 기록할 SnapshotStore
+            shard: (i, n)이면 crc32(키워드) % n == i인 작업만 처리
+            concurrency: 동시에 수집할 키워드 개수 (스레드 수)
+            poll_interval: 처리할 작업이 없을 때 다시 확인하는 간격 (초)
+            pipeline: 사용할 PricePipeline (None이면 store에 기록하는 기본 파이프라인)
+            out: 진행 상황 출력 스트림 (None이면 표준 출력)
+        """
+        if pipeline is None:
+            from price_engine import PricePipeline, PriceScraper
+
+            pipeline = PricePipeline(scraper=PriceScraper(verbose=False), store=store)
+        self.queue = queue
+        self.shard = shard
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.pipeline = pipeline
+        self.out = out or sys.stdout
+        self.owner = worker_id()
+        self.stats = {"done": 0, "empty": 0, "retried": 0, "failed": 0}
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def stop(self):
+        """새 작업을 가져오지 않고, 처리 중인 작업만 마친 뒤 run()이 끝나도록 합니다."""
+        self._stop.set()
+
+    def _log(self, message: str):
+        with self._lock:
+            print(f"[{time.strftime('%H:%M:%S')}] {message}", file=self.out, flush=True)
+
+    def _heartbeat(self, job: Dict, finished: threading.Event):
+        while not finished.wait(self.queue.visibility_timeout / 3):
+            try:
+                if not self.queue.extend(job["id"], self.owner):
+                    self._log(f"⚠️ {job['keyword']}: 임대가 이미 다른 작업자에게 넘어갔습니다")
+                    return
+            except Exception as e:
+                # 잠금 대기 초과 등 일시적인 오류는 다음 주기에 다시 시도
+                self._log(f"⚠️ {job['keyword']}: 임대 연장 실패 ({e})")
+
+    @contextmanager
+    def _keep_lease(self, job: Dict) -> Iterator[None]:
+        """블록이 끝날 때까지 임대 시간의 1/3마다 임대를 연장합니다 (느린 수집이 중복 수집되지 않도록)."""
+        finished = threading.Event()
+        heartbeat = threading.Thread(
+            target=self._heartbeat, args=(job, finished), name=f"lease-{job['id']}", daemon=True
+        )
+        heartbeat.start()
+        try:
+            yield
+        finally:
+            finished.set()
+            heartbeat.join()
+
+    def process(self, job: Dict):
+        """작업 하나를 수집하고 결과를 대기열에 기록합니다."""
+        keyword = job["keyword"]
+        start = time.perf_counter()
+        try:
+            with self._keep_lease(job):
+                context = self.pipeline.run(keyword)
+        except Exception as e:
+            state = self.queue.fail(job["id"], self.owner, str(e) or type(e).__name__)
+            key = {"queued": "retried", "failed": "failed"}.get(state)
+            if key:
+                with self._lock:
+                    self.stats[key] += 1
+            self._log(f"❌ {keyword}: {e} ({job['attempts']}번째 시도, {state or '임대 만료'})")
+            return
+
+        elapsed = (time.perf_counter() - start) * 1000
+        snapshot_id = context.get("snapshot_id")
+        if not self.queue.complete(job["id"], self.owner, snapshot_id):
+            self._log(f"⚠️ {keyword}: 임대가 만료되어 완료를 기록하지 못했습니다 ({elapsed:.0f}ms)")
+            return
+        with self._lock:
+            self.stats["done" if context["prices"] else "empty"] += 1
+        self._log(f"✅ {keyword}: {len(context['prices']):,}개 ({elapsed:.0f}ms)")
+
+    def _loop(self, drain: bool):
+        while not self._stop.is_set():
+            jobs = self.queue.lease(self.owner, shard=self.shard)
+            if jobs:
+                self.process(jobs[0])
+                continue
+            # 다시 시도를 기다리는 작업이나 다른 스레드가 처리 중인 작업이 없으면 종료
+            if drain and not self.queue.pending(self.shard):
+                return
+            self._stop.wait(self.poll_interval)
+
+    def run(self, drain: bool = False) -> Dict[str, int]:
+        """
+        stop()이 호출될 때까지 작업을 처리합니다.
+
+        Args:
+            drain: True면 맡은 샤드에 끝나지 않은 작업이 없을 때 종료
+
+        Returns:
+            처리 결과 개수 {"done", "empty", "retried", "failed"}
+        """
+        threads = [
+            threading.Thread(target=self._loop, args=(drain,), name=f"scrape-worker-{i}", daemon=True)
+            for i in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return dict(self.stats)
+
+
+def run_worker(args, shard: Optional[Tuple[int, int]]) -> Dict[str, int]:
+    """명령행 인자로 작업자 하나를 만들어 실행합니다 (SIGTERM/Ctrl+C를 받으면 처리 중인 작업만 마치고 종료)."""
+    from price_engine import PricePipeline, PriceScraper, build_sources
+    from snapshot_store import SnapshotStore
+
+    queue = JobQueue(
+        args.queue,
+        visibility_timeout=args.visibility_timeout,
+        max_attempts=args.max_attempts,
+        retry_delay=args.retry_delay,
+        journal_mode=journal_mode(args),
+    )
+    store = SnapshotStore(args.db, journal_mode=journal_mode(args))
+    scraper = PriceScraper(verbose=False)
+    pipeline = PricePipeline(
+        scraper=scraper, store=store, sources=build_sources(args.sources, danawa_scraper=scraper)
+    )
+    worker = ScrapeWorker(queue, store, shard=shard, concurrency=args.concurrency, pipeline=pipeline)
+
+    def handle_stop(signum, frame):
+        worker.stop()
+
+    signal.signal(signal.SIGTERM, handle_stop)
+    signal.signal(signal.SIGINT, handle_stop)
+    label = f"샤드 {shard[0]}/{shard[1]}" if shard else "전체"
+    print(f"🔧 작업자 {worker.owner} 시작 ({label}, 동시 {args.concurrency}개)", flush=True)
+    stats = worker.run(drain=args.drain)
+    print(f"🔧 작업자 {worker.owner} 종료: {stats}", flush=True)
+    return stats
+
+
+def journal_mode(args) -> Optional[str]:
+    """--shared-fs면 롤백 저널, 아니면 None (SQLITE_JOURNAL_MODE 환경 변수 또는 WAL)"""
+    return "DELETE" if args.shared_fs else None
+
+
+def supervise_shards(
+    target: Callable, args, count: int, restart_delay: float = 1.0, out=None
+) -> int:
+    """
+    샤드 0..count-1마다 프로세스를 하나씩 띄우고, 비정상 종료한 프로세스는 같은 샤드로 다시 띄웁니다.
+    정상 종료(--drain으로 맡은 작업을 끝냈거나 종료 신호를 받은 경우)한 샤드는 다시 띄우지 않습니다.
+
+    Args:
+        target: 자식 프로세스에서 target(args, (i, count))로 호출할 함수
+        args: target에 넘길 명령행 인자
+        count: 샤드(프로세스) 수
+        restart_delay: 시작하자마자 다시 죽는 경우 재시작 전 대기 시간 (초)
+        out: 재시작 메시지 출력 스트림 (None이면 표준 에러)
+
+    Returns:
+        종료 코드 (모든 샤드가 정상 종료했으면 0)
+    """
+    import multiprocessing
+    from multiprocessing.connection import wait
+
+    out = out or sys.stderr
+    running: Dict[int, Tuple[multiprocessing.Process, float]] = {}
+    stopping = False
+
+    def spawn(index: int):
+        process = multiprocessing.Process(target=target, args=(args, (index, count)), name=f"shard-{index}")
+        process.start()
+        running[index] = (process, time.monotonic())
+
+    def handle_stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+        for process, _ in running.values():
+            if process.is_alive():
+                process.terminate()
+
+    for index in range(count):
+        spawn(index)
+    # 자식 프로세스가 각자 신호를 받아 정리하므로 관리 프로세스는 Ctrl+C를 무시하고 기다림
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, handle_stop)
+
+    exit_code = 0
+    while running:
+        wait([process.sentinel for process, _ in running.values()])
+        for index, (process, started) in list(running.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del running[index]
+            if process.exitcode == 0:
+                continue
+            if stopping:
+                exit_code = 1
+                continue
+            print(f"샤드 {index}/{count} 프로세스 종료 (코드 {process.exitcode}), 다시 시작합니다.", file=out, flush=True)
+            # 시작하자마자 죽는 경우 재시작이 폭주하지 않도록 잠시 대기
+            if time.monotonic() - started < restart_delay:
+                time.sleep(restart_delay)
+            if not stopping:
+                spawn(index)
+    return exit_code
+
+
+def _run_processes(args) -> int:
+    """이 호스트에서 작업 프로세스 여러 개를 샤드 0..N-1로 나누어 실행합니다."""
+    # fork 전에 무거운 모듈(price_engine은 matplotlib 포함 약 1초)을 한 번만 불러와 자식 프로세스가 물려받도록 함
+    import price_engine  # noqa: F401
+    import snapshot_store  # noqa: F401
+
+    return supervise_shards(run_worker, args, args.processes)
+
+
+def main():
+    """명령행 인자로 대기열 관리 또는 작업 프로세스를 실행합니다."""
+    parser = argparse.ArgumentParser(description="키워드 수집 작업 대기열과 작업 프로세스")
+    parser.add_argument(
+        "--queue", default=os.environ.get("JOB_QUEUE_DB", "jobs.db"), help="작업 대기열 파일 (JOB_QUEUE_DB)"
+    )
+    parser.add_argument(
+        "--shared-fs",
+        action="store_true",
+        help="여러 호스트가 공유 파일 시스템의 대기열/저장소를 함께 쓰는 경우 (WAL 대신 롤백 저널, 모든 프로세스에 지정)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue = commands.add_parser("enqueue", help="키워드 작업 추가 (대기 중인 키워드는 건너뜀)")
+    enqueue.add_argument("source", help="키워드 목록 파일 ('-'이면 표준 입력)")
+    enqueue.add_argument("--delay", type=float, default=0, help="처리 시작 전 대기 시간 (초)")
+
+    work = commands.add_parser("work", help="작업 처리")
+    work.add_argument("--shard", type=parse_shard, help="맡을 샤드 i/n (예: 0/4, 없으면 전체)")
+    work.add_argument("--processes", type=int, default=1, help="이 호스트에서 실행할 프로세스 수 (샤드 0..N-1)")
+    work.add_argument("--concurrency", type=int, default=4, help="프로세스당 동시에 수집할 키워드 개수")
+    work.add_argument("--drain", action="store_true", help="맡은 작업이 모두 끝나면 종료")
+    work.add_argument(
+        "--db", default=os.environ.get("SNAPSHOT_DB", "snapshots.db"), help="스냅샷 저장소 파일"
+    )
+    work.add_argument("--sources", help="함께 검색할 가격 소스 (build_sources 형식, 기본: PRICE_SOURCES)")
+    work.add_argument("--visibility-timeout", type=float, default=120, help="작업 임대 유효 시간 (초)")
+    work.add_argument("--max-attempts", type=int, default=3, help="작업당 최대 시도 횟수")
+    work.add_argument("--retry-delay", type=float, default=30, help="첫 재시도 전 대기 시간 (초, 이후 두 배씩)")
+
+    status = commands.add_parser("status", help="상태별 작업 개수와 최근 실패 작업 출력")
+    status.add_argument("--failed", type=int, default=10, help="출력할 최근 실패 작업 개수")
+
+    purge = commands.add_parser("purge", help="끝난 작업 기록 삭제")
+    purge.add_argument("--days", type=float, default=7, help="끝난 지 이 기간(일)이 지난 기록만 삭제")
+
+    args = parser.parse_args()
+
+    if args.command == "enqueue":
+        from price_analyzer_cli import read_keywords
+
+        added = JobQueue(args.queue, journal_mode=journal_mode(args)).enqueue(
+            read_keywords(args.source), delay=args.delay
+        )
+        print(f"작업 {added:,}개 추가 ({args.queue})")
+    elif args.command == "work":
+        if args.processes > 1:
+            if args.shard:
+                parser.error("--shard와 --processes는 함께 사용할 수 없습니다.")
+            sys.exit(_run_processes(args))
+        run_worker(args, args.shard)
+    elif args.command == "status":
+        queue = JobQueue(args.queue, journal_mode=journal_mode(args))
+        counts = queue.counts()
+        print(" / ".join(f"{status} {count:,}" for status, count in counts.items()))
+        for job in queue.failed(args.failed):
+            print(f"  #{job['id']:<8} {job['keyword']:<20} {job['attempts']}회 시도: {job['last_error']}")
+    elif args.command == "purge":
+        removed = JobQueue(args.queue, journal_mode=journal_mode(args)).purge(args.days * 86400)
+        print(f"끝난 작업 기록 {removed:,}개 삭제")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+운영용 다중 프로세스 웹 서버 (Unix 전용)
+리슨 소켓을 한 번만 열고 작업 프로세스 N개를 미리 fork하여 모두 같은 소켓에서 연결을 받습니다.
+작업 프로세스는 fork한 뒤에 app을 import하므로 SQLite 연결, 스레드, 잠금을 부모에게서 물려받지 않으며,
+검색 결과 캐시와 응답 검증값 캐시는 SHARED_CACHE_DB 파일(shared_cache.SharedCache)로 함께 사용합니다.
+그래서 작업 프로세스를 늘려도 같은 키워드를 프로세스마다 따로 수집하지 않습니다.
+
+    serve.py (관리 프로세스: 소켓 생성, 작업 프로세스 감시/재시작)
+      ├─ 작업 프로세스 1: app.py (스레드 방식 WSGI 서버)
+      ├─ 작업 프로세스 2: app.py          ─┐
+      └─ 작업 프로세스 N: app.py           ├─ shared_cache.db (결과, 응답 검증값)
+                                           └─ snapshots.db (스냅샷 저장소)
+
+크롤링 수락 제어(SCRAPE_MAX_CONCURRENT 등)와 /metrics 지표는 작업 프로세스마다 따로 적용/집계됩니다.
+
+사용법:
+    python serve.py --workers 4 --port 8080
+    SHARED_CACHE_DB=/var/tmp/price_cache.db python serve.py
+"""
+
+import argparse
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Dict, Optional
+
+DEFAULT_WORKERS = min(os.cpu_count() or 1, 8)
+
+
+class _Shutdown(Exception):
+    """관리 프로세스가 종료 신호를 받은 경우 (os.wait 대기를 빠져나오기 위해 사용)"""
+
+
+def run_worker(sock: socket.socket, host: str, port: int, threaded: bool = True):
+    """
+    작업 프로세스 본체: 물려받은 리슨 소켓으로 웹 대시보드를 실행합니다 (반환하지 않음).
+
+    Args:
+        sock: 관리 프로세스가 연 리슨 소켓
+        host / port: 표시용 주소
+        threaded: 요청마다 스레드로 처리할지 여부
+    """
+    # Ctrl+C는 관리 프로세스가 받아 SIGTERM으로 정리하므로 작업 프로세스는 무시
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
+    code = 0
+    try:
+        from werkzeug.serving import make_server
+
+        import app as dashboard
+
+        # 작업 프로세스마다 자기 메모리의 색인과 캐시를 채움 (준비 상태는 /api/ready)
+        dashboard.start_warmup()
+        server = make_server(host, port, dashboard.app, threaded=threaded, fd=sock.fileno())
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+    except SystemExit:
+        pass
+    except Exception as e:
+        print(f"작업 프로세스 {os.getpid()} 오류: {e}", file=sys.stderr)
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    # 부모에게서 물려받은 atexit 처리기 등을 실행하지 않고 바로 종료
+    os._exit(code)
+
+
+class PreforkServer:
+    """리슨 소켓을 공유하는 작업 프로세스들을 띄우고 감시하는 관리 클래스"""
+
+    def __init__(
+        self,
+        host: str = "0.0.0.0",
+        port: int = 8080,
+        workers: int = DEFAULT_WORKERS,
+        backlog: int = 128,
+        restart_delay: float = 1.0,
+    ):
+        """
+        Args:
+            host / port: 리슨 주소 (port가 0이면 비어 있는 포트를 골라 self.port에 기록)
+            workers: 작업 프로세스 수
+            backlog: 리슨 대기열 길이
+            restart_delay: 작업 프로세스가 곧바로 다시 죽는 경우 재시작 전 대기 시간 (초)
+        """
+        if workers < 1:
+            raise ValueError("작업 프로세스는 1개 이상이어야 합니다.")
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.backlog = backlog
+        self.restart_delay = restart_delay
+        self.sock: Optional[socket.socket] = None
+        self._children: Dict[int, float] = {}
+        self._stopping = False
+
+    def bind(self):
+        """리슨 소켓을 엽니다 (작업 프로세스를 띄우기 전에 호출)."""
+        family = socket.AF_INET6 if ":" in self.host else socket.AF_INET
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(self.backlog)
+        sock.set_inheritable(True)
+        self.sock = sock
+        self.port = sock.getsockname()[1]
+
+    def spawn(self) -> int:
+        """작업 프로세스 하나를 fork합니다."""
+        pid = os.fork()
+        if pid == 0:
+            run_worker(self.sock, self.host, self.port)
+        self._children[pid] = time.monotonic()
+        return pid
+
+    def serve(self):
+        """작업 프로세스를 모두 띄우고, 종료 신호를 받을 때까지 죽은 작업 프로세스를 다시 띄웁니다."""
+        if self.sock is None:
+            self.bind()
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+
+        for _ in range(self.workers):
+            self.spawn()
+
+        try:
+            while not self._stopping:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                started = self._children.pop(pid, None)
+                if self._stopping or started is None:
+                    continue
+                print(f"작업 프로세스 {pid} 종료 (상태 {status}), 다시 시작합니다.", file=sys.stderr)
+                # 시작하자마자 죽는 경우 재시작이 폭주하지 않도록 잠시 대기
+                if time.monotonic() - started < self.restart_delay:
+                    time.sleep(self.restart_delay)
+                if not self._stopping:
+                    self.spawn()
+        except _Shutdown:
+            pass
+        finally:
+            self.stop()
+
+    def _handle_stop(self, signum, frame):
+        if not self._stopping:
+            self._stopping = True
+            raise _Shutdown()
+
+    def stop(self, timeout: float = 10.0):
+        """모든 작업 프로세스에 SIGTERM을 보내고 끝날 때까지 기다립니다 (시간을 넘기면 SIGKILL)."""
+        self._stopping = True
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                self._children.pop(pid, None)
+
+        deadline = time.monotonic() + timeout
+        while self._children and time.monotonic() < deadline:
+            for pid in list(self._children):
+                try:
+                    done, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    done = pid
+                if done:
+                    self._children.pop(pid, None)
+            time.sleep(0.05)
+
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._children.pop(pid, None)
+
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+def main():
+    """명령행 인자로 다중 프로세스 서버를 실행합니다."""
+    parser = argparse.ArgumentParser(description="상품 가격 분석 웹 대시보드 운영용 서버 (pre-fork)")
+    parser.add_argument("--host", default="0.0.0.0", help="리슨 주소")
+    parser.add_argument("--port", type=int, default=int(os.environ.get("PORT", "8080")), help="리슨 포트 (0이면 자동)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="작업 프로세스 수 (기본: CPU 수, 최대 8)")
+    parser.add_argument(
+        "--cache-db",
+        default=os.environ.get("SHARED_CACHE_DB", "shared_cache.db"),
+        help="작업 프로세스가 공유하는 캐시 파일 (SHARED_CACHE_DB)",
+    )
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        sys.exit("serve.py는 fork를 지원하는 운영체제(Linux, macOS)에서만 실행할 수 있습니다. app.py를 사용하세요.")
+
+    # 작업 프로세스가 app을 import할 때 공유 캐시를 사용하도록 설정
+    os.environ["SHARED_CACHE_DB"] = os.path.abspath(args.cache_db)
+
+    server = PreforkServer(host=args.host, port=args.port, workers=args.workers)
+    server.bind()
+    print(
+        f"🌐 http://{args.host}:{server.port} 작업 프로세스 {args.workers}개 (공유 캐시: {args.cache_db})",
+        flush=True,
+    )
+    server.serve()
+
+
+if __name__ == "__main__":
+    main()
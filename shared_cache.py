@@ -0,0 +1,239 @@
+"""
+프로세스 간 공유 캐시
+여러 작업 프로세스(serve.py)가 같은 SQLite 파일 하나로 검색 결과와 응답 검증값을 함께 보관합니다.
+ResultCache와 같은 get/set/clear 인터페이스에 더해, get_or_compute()는 같은 키를 여러 프로세스가 동시에
+요청해도 계산(크롤링)을 한 번만 하도록 임대(lease) 행으로 계산할 프로세스를 하나만 정합니다.
+
+    작업 프로세스 A ─┐                         ┌─ 캐시 적중 → 바로 반환
+    작업 프로세스 B ─┼─ get_or_compute(키) ─────┼─ 임대 획득 → 계산 후 저장, 임대 해제
+    작업 프로세스 C ─┘                         └─ 다른 프로세스가 계산 중 → 저장될 때까지 대기
+
+값은 pickle로 저장하므로 같은 서버의 신뢰할 수 있는 프로세스끼리만 공유해야 합니다.
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional, Tuple
+
+from metrics import CACHE_REQUESTS
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache_entries (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    value BLOB NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+CREATE INDEX IF NOT EXISTS idx_cache_entries_age ON cache_entries (namespace, stored_at);
+-- 계산 중인 키: 만료 시각(expires_at)이 지나면 계산하던 프로세스가 죽은 것으로 보고 다른 프로세스가 넘겨받음
+CREATE TABLE IF NOT EXISTS cache_leases (
+    namespace TEXT NOT NULL,
+    key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    PRIMARY KEY (namespace, key)
+);
+"""
+
+_MISSING = object()
+
+
+class SharedCache:
+    """SQLite 파일 기반의 프로세스 간 공유 캐시 클래스 (스레드 안전, fork 안전)"""
+
+    def __init__(
+        self,
+        path: str = "shared_cache.db",
+        ttl: Optional[float] = 300,
+        max_entries: int = 256,
+        name: str = "result",
+        lease_timeout: float = 60,
+        poll_interval: float = 0.05,
+    ):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (모든 작업 프로세스가 같은 경로 사용)
+            ttl: 값을 신선하다고 간주하는 시간 (초, None이면 만료 없음)
+            max_entries: 이 캐시(name)에 보관할 최대 항목 수 (넘으면 가장 오래된 항목부터 제거)
+            name: 캐시 이름 (같은 파일 안의 구분자이자 지표에 표시할 이름)
+            lease_timeout: 계산 임대 유효 시간 (초, 계산이 이보다 오래 걸리면 다른 프로세스도 계산을 시작)
+            poll_interval: 다른 프로세스의 계산을 기다릴 때 확인 간격 (초)
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.name = name
+        self.lease_timeout = lease_timeout
+        self.poll_interval = poll_interval
+        self._local = threading.local()
+        self._hits = CACHE_REQUESTS.labels(name, "hit")
+        self._misses = CACHE_REQUESTS.labels(name, "miss")
+
+    @staticmethod
+    def normalize_key(keyword: str) -> str:
+        """대소문자와 연속 공백 차이를 무시하는 캐시 키를 만듭니다."""
+        return " ".join(keyword.split()).lower()
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환합니다 (fork로 물려받은 부모 프로세스의 연결은 쓰지 않음)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            # 트랜잭션은 BEGIN IMMEDIATE로 직접 시작 (확인과 임대 기록 사이에 다른 프로세스가 끼어들지 않도록)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(SCHEMA)
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """쓰기 잠금을 먼저 잡는 트랜잭션 (예외가 나면 되돌림)"""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _lookup(self, conn: sqlite3.Connection, key: str) -> Any:
+        """신선한 값 또는 _MISSING (만료된 항목은 다음 저장 때 덮어쓰거나 오래된 순 제거로 정리)"""
+        row = conn.execute(
+            "SELECT stored_at, value FROM cache_entries WHERE namespace = ? AND key = ?",
+            (self.name, key),
+        ).fetchone()
+        if row is None:
+            return _MISSING
+        if self.ttl is not None and time.time() - row[0] > self.ttl:
+            return _MISSING
+        return pickle.loads(row[1])
+
+    def _store(self, conn: sqlite3.Connection, key: str, value, age: float = 0):
+        conn.execute(
+            "INSERT OR REPLACE INTO cache_entries (namespace, key, stored_at, value) VALUES (?, ?, ?, ?)",
+            (self.name, key, time.time() - age, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
+        excess = (
+            conn.execute("SELECT COUNT(*) FROM cache_entries WHERE namespace = ?", (self.name,)).fetchone()[0]
+            - self.max_entries
+        )
+        if excess > 0:
+            conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key IN ("
+                "SELECT key FROM cache_entries WHERE namespace = ? ORDER BY stored_at LIMIT ?)",
+                (self.name, self.name, excess),
+            )
+
+    def get(self, keyword: str) -> Optional[Any]:
+        """
+        신선한 캐시 값을 반환합니다.
+
+        Args:
+            keyword: 검색 키워드
+
+        Returns:
+            캐시된 값 또는 None (없거나 만료된 경우)
+        """
+        # 읽기는 잠금 없이 (WAL 모드라 쓰는 중인 프로세스가 있어도 기다리지 않음)
+        value = self._lookup(self._connect(), self.normalize_key(keyword))
+        if value is _MISSING:
+            self._misses.inc()
+            return None
+        self._hits.inc()
+        return value
+
+    def set(self, keyword: str, value, age: float = 0):
+        """
+        값을 캐시에 저장합니다. 가득 찬 경우 가장 오래된 항목을 제거합니다.
+
+        Args:
+            keyword: 검색 키워드
+            value: 저장할 값 (pickle 가능해야 함)
+            age: 값이 이미 지난 시간 (초, ResultCache.set과 같음)
+        """
+        with self._transaction() as conn:
+            self._store(conn, self.normalize_key(keyword), value, age)
+
+    def get_or_compute(self, keyword: str, compute: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        캐시 값을 반환하고, 없으면 모든 프로세스를 통틀어 한 곳에서만 계산하여 저장합니다.
+        다른 프로세스(또는 스레드)가 같은 키를 계산 중이면 그 결과가 저장될 때까지 기다립니다.
+
+        Args:
+            keyword: 검색 키워드
+            compute: 값을 계산하는 함수 (None을 반환하면 저장하지 않음, 예외는 그대로 전달)
+
+        Returns:
+            (값, 캐시 적중 여부) - 다른 프로세스가 계산한 값을 받은 경우도 적중
+        """
+        key = self.normalize_key(keyword)
+        value = self._lookup(self._connect(), key)
+        if value is not _MISSING:
+            self._hits.inc()
+            return value, True
+
+        # 확인과 임대 기록을 한 쓰기 트랜잭션으로 묶어 한 곳에서만 임대를 얻도록 함
+        owner = uuid.uuid4().hex
+        while True:
+            with self._transaction() as conn:
+                value = self._lookup(conn, key)
+                acquired = False
+                if value is _MISSING:
+                    now = time.time()
+                    lease = conn.execute(
+                        "SELECT expires_at FROM cache_leases WHERE namespace = ? AND key = ?",
+                        (self.name, key),
+                    ).fetchone()
+                    if lease is None or lease[0] <= now:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO cache_leases (namespace, key, owner, expires_at) "
+                            "VALUES (?, ?, ?, ?)",
+                            (self.name, key, owner, now + self.lease_timeout),
+                        )
+                        acquired = True
+
+            if value is not _MISSING:
+                self._hits.inc()
+                return value, True
+            if acquired:
+                break
+            time.sleep(self.poll_interval)
+
+        self._misses.inc()
+        value = None
+        try:
+            value = compute()
+        finally:
+            # 계산에 실패해도 임대를 풀어 기다리던 프로세스가 직접 계산하도록 함
+            with self._transaction() as conn:
+                if value is not None:
+                    self._store(conn, key, value)
+                conn.execute(
+                    "DELETE FROM cache_leases WHERE namespace = ? AND key = ? AND owner = ?",
+                    (self.name, key, owner),
+                )
+        return value, False
+
+    def clear(self):
+        """이 캐시(name)의 항목과 임대를 모두 지웁니다."""
+        with self._transaction() as conn:
+            conn.execute("DELETE FROM cache_entries WHERE namespace = ?", (self.name,))
+            conn.execute("DELETE FROM cache_leases WHERE namespace = ?", (self.name,))
+
+    def close(self):
+        """현재 스레드의 연결을 닫습니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
@@ -0,0 +1,834 @@
+"""
+가격 스냅샷 저장소
+검색 결과(키워드, 시각, 통계, 정렬된 가격 배열)를 SQLite 파일 하나에 보관합니다.
+가격은 int64 배열을 그대로 BLOB으로 저장하여 pickle보다 빠르게 읽고 씁니다.
+상품 정보(상품 번호, 상품명, 최저가)가 함께 오면 상품명 토큰 역색인에 등록하여
+"30,000원 이하 로지텍 상품" 같은 검색을 스냅샷을 다시 읽지 않고 색인만으로 처리합니다.
+스냅샷을 저장할 때 같은 키워드의 직전 스냅샷과의 차이(추가/삭제된 가격)도 함께 기록하여
+변경 타임라인을 전체 가격 배열을 다시 읽지 않고 보여줍니다.
+키워드 비교용 요약(사분위수, 모든 스냅샷이 공유하는 로그 눈금 구간별 개수)도 저장할 때 한 번만 계산합니다.
+"""
+
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from keyword_index import KeywordIndex
+
+PRICE_DTYPE = np.dtype("<i8")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    keyword TEXT NOT NULL,
+    taken_at REAL NOT NULL,
+    count INTEGER NOT NULL,
+    average REAL NOT NULL,
+    min INTEGER NOT NULL,
+    max INTEGER NOT NULL,
+    prices BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_snapshots_keyword_time ON snapshots (keyword, taken_at);
+CREATE INDEX IF NOT EXISTS idx_snapshots_time ON snapshots (taken_at);
+CREATE TABLE IF NOT EXISTS products (
+    snapshot_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    PRIMARY KEY (snapshot_id, product_id)
+) WITHOUT ROWID;
+-- 상품명 토큰 역색인: (토큰, 가격) 순 기본 키로 토큰 조회와 가격 범위 조건을 색인 범위 검색 한 번에 처리
+CREATE TABLE IF NOT EXISTS product_tokens (
+    token TEXT NOT NULL,
+    price INTEGER NOT NULL,
+    snapshot_id INTEGER NOT NULL,
+    product_id INTEGER NOT NULL,
+    PRIMARY KEY (token, price, snapshot_id, product_id)
+) WITHOUT ROWID;
+-- 같은 키워드의 직전 스냅샷(prev_id, 첫 스냅샷이면 NULL)과 비교한 가격 변화
+CREATE TABLE IF NOT EXISTS snapshot_diffs (
+    snapshot_id INTEGER PRIMARY KEY,
+    prev_id INTEGER,
+    added BLOB NOT NULL,
+    removed BLOB NOT NULL
+);
+-- 키워드 비교용 요약: 사분위수와 공통 로그 구간(AGGREGATE_BIN_EDGES)별 가격 개수
+CREATE TABLE IF NOT EXISTS snapshot_aggregates (
+    snapshot_id INTEGER PRIMARY KEY,
+    q1 REAL NOT NULL,
+    median REAL NOT NULL,
+    q3 REAL NOT NULL,
+    bins BLOB NOT NULL
+);
+"""
+
+# 스냅샷 간 통계 변화를 계산할 항목
+STAT_FIELDS = ("count", "average", "min", "max")
+
+# 키워드 비교용 공통 구간: 수집 가격 범위(1,000원 ~ 1억 원)를 10배마다 20칸으로 나눈 로그 눈금
+# 모든 스냅샷이 같은 경계를 쓰므로 여러 키워드의 히스토그램을 다시 계산하지 않고 나란히 놓을 수 있음
+AGGREGATE_BINS_PER_DECADE = 20
+AGGREGATE_BIN_EDGES = np.logspace(3, 8, 5 * AGGREGATE_BINS_PER_DECADE + 1)
+BIN_COUNT_DTYPE = np.dtype("<u4")
+
+# 가격 배열을 제외한 메타데이터 컬럼
+META_COLUMNS = "id, keyword, taken_at, count, average, min, max"
+
+
+# 상품명 토큰: 문자/숫자 연속 구간 (한글 포함, 소문자로 통일)
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> List[str]:
+    """상품명 또는 검색어를 중복 없는 토큰 리스트로 나눕니다 (나온 순서 유지)."""
+    return list(dict.fromkeys(TOKEN_PATTERN.findall(text.lower())))
+
+
+def diff_sorted(old, new) -> Tuple[List[int], List[int]]:
+    """정렬된 두 가격 배열의 (추가된 가격, 삭제된 가격)을 선형 병합으로 구합니다."""
+    from price_engine.analyzer import DataAnalyzer
+
+    return DataAnalyzer.diff_prices(
+        old.tolist() if isinstance(old, np.ndarray) else list(old),
+        new.tolist() if isinstance(new, np.ndarray) else list(new),
+    )
+
+
+def aggregate_prices(prices) -> Dict:
+    """
+    정렬된 가격 배열의 사분위수와 공통 로그 구간별 개수를 계산합니다.
+
+    Returns:
+        {"q1", "median", "q3", "bins": 구간별 개수 배열 (len(AGGREGATE_BIN_EDGES) - 1개)}
+        (범위를 벗어난 가격은 양 끝 구간에 포함)
+    """
+    array = np.asarray(prices, dtype=PRICE_DTYPE)
+    size = len(AGGREGATE_BIN_EDGES) - 1
+    if not array.size:
+        return {"q1": 0.0, "median": 0.0, "q3": 0.0, "bins": np.zeros(size, dtype=BIN_COUNT_DTYPE)}
+
+    q1, median, q3 = np.percentile(array, [25, 50, 75])
+    index = np.searchsorted(AGGREGATE_BIN_EDGES, array, side="right") - 1
+    np.clip(index, 0, size - 1, out=index)
+    bins = np.bincount(index, minlength=size).astype(BIN_COUNT_DTYPE)
+    return {"q1": float(q1), "median": float(median), "q3": float(q3), "bins": bins}
+
+
+def encode_prices(prices) -> bytes:
+    """가격 리스트/배열을 저장용 바이트로 변환합니다."""
+    return np.ascontiguousarray(prices, dtype=PRICE_DTYPE).tobytes()
+
+
+def decode_prices(blob: bytes) -> np.ndarray:
+    """저장된 바이트를 가격 배열(읽기 전용)로 변환합니다."""
+    return np.frombuffer(blob, dtype=PRICE_DTYPE)
+
+
+class SnapshotStore:
+    """SQLite 기반 가격 스냅샷 저장소 클래스"""
+
+    def __init__(self, path: str = "snapshots.db", journal_mode: Optional[str] = None):
+        """
+        Args:
+            path: SQLite 데이터베이스 파일 경로 (처음 사용할 때 생성)
+            journal_mode: "WAL" 또는 "DELETE" (None이면 SQLITE_JOURNAL_MODE 환경 변수 또는 WAL,
+                          WAL은 네트워크 파일 시스템에서 동작하지 않으므로 여러 호스트가 공유하는 파일은 DELETE)
+        """
+        self.path = path
+        self.journal_mode = (journal_mode or os.environ.get("SQLITE_JOURNAL_MODE", "WAL")).upper()
+        if self.journal_mode not in ("WAL", "DELETE"):
+            raise ValueError(f"journal_mode는 WAL 또는 DELETE여야 합니다: {self.journal_mode}")
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+        # 키워드 검색용 trigram 색인 (처음 검색할 때 만들고, 이후 새 스냅샷만 반영)
+        self._keyword_index = KeywordIndex()
+        self._indexed_id = 0
+        self._index_lock = threading.Lock()
+
+    @property
+    def _synchronous(self) -> str:
+        """저널 모드에 맞는 기본 동기화 수준 (WAL은 NORMAL로도 안전, 롤백 저널은 FULL)"""
+        return "NORMAL" if self.journal_mode == "WAL" else "FULL"
+
+    def _connect(self) -> sqlite3.Connection:
+        """스레드별 연결을 반환합니다 (SQLite 연결은 스레드 간 공유하지 않음)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            # 읽기와 쓰기가 서로 막지 않도록 WAL 모드 사용 (공유 파일 시스템이면 롤백 저널)
+            conn.execute(f"PRAGMA journal_mode={self.journal_mode}")
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+            with self._init_lock:
+                if not self._initialized:
+                    conn.executescript(SCHEMA)
+                    self._initialized = True
+            self._local.conn = conn
+        return conn
+
+    def add_snapshot(
+        self,
+        keyword: str,
+        prices: List[int],
+        statistics: Optional[Dict] = None,
+        taken_at: Optional[float] = None,
+        products: Optional[Iterable] = None,
+    ) -> int:
+        """
+        스냅샷 하나를 저장합니다.
+
+        Args:
+            keyword: 검색 키워드
+            prices: 정렬된 가격 리스트
+            statistics: calculate_statistics() 결과 (None이면 가격으로 계산)
+            taken_at: 수집 시각 (Unix time, None이면 현재 시각)
+            products: (상품 번호, 상품명, 가격) 튜플 또는 Product (상품명 역색인에 함께 등록)
+
+        Returns:
+            저장된 스냅샷 id
+        """
+        array = np.asarray(prices, dtype=PRICE_DTYPE)
+        if statistics is None:
+            statistics = {
+                "count": int(array.size),
+                "average": float(array.mean()) if array.size else 0.0,
+                "min": int(array.min()) if array.size else 0,
+                "max": int(array.max()) if array.size else 0,
+            }
+
+        taken_at = time.time() if taken_at is None else taken_at
+        conn = self._connect()
+        with conn:
+            cursor = conn.execute(
+                "INSERT INTO snapshots (keyword, taken_at, count, average, min, max, prices) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    keyword,
+                    taken_at,
+                    statistics["count"],
+                    statistics["average"],
+                    statistics["min"],
+                    statistics["max"],
+                    encode_prices(array),
+                ),
+            )
+            snapshot_id = cursor.lastrowid
+            if products:
+                self._add_products(conn, snapshot_id, products)
+
+            # 직전 스냅샷과의 차이를 기록 (과거 시각으로 끼워 넣은 경우 바로 다음 스냅샷의 차이도 갱신)
+            self._store_diff(conn, snapshot_id, keyword, taken_at, array)
+            following = conn.execute(
+                "SELECT id, taken_at, prices FROM snapshots WHERE keyword = ? AND (taken_at, id) > (?, ?) "
+                "ORDER BY taken_at, id LIMIT 1",
+                (keyword, taken_at, snapshot_id),
+            ).fetchone()
+            if following is not None:
+                self._store_diff(
+                    conn, following["id"], keyword, following["taken_at"], decode_prices(following["prices"])
+                )
+            self._store_aggregate(conn, snapshot_id, array)
+        return snapshot_id
+
+    @staticmethod
+    def _store_aggregate(conn: sqlite3.Connection, snapshot_id: int, prices) -> Dict:
+        """스냅샷의 비교용 요약을 계산하여 저장합니다."""
+        aggregate = aggregate_prices(prices)
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshot_aggregates (snapshot_id, q1, median, q3, bins) VALUES (?, ?, ?, ?, ?)",
+            (
+                snapshot_id,
+                aggregate["q1"],
+                aggregate["median"],
+                aggregate["q3"],
+                aggregate["bins"].tobytes(),
+            ),
+        )
+        return aggregate
+
+    def compare(self, keywords: Iterable[str], at: Optional[float] = None) -> Dict:
+        """
+        여러 키워드의 스냅샷 요약을 공통 로그 구간으로 맞춰 나란히 반환합니다.
+        저장할 때 계산한 요약만 읽으며, 대량 저장으로 요약이 없는 스냅샷은 이번에 계산하여 저장해 둡니다.
+
+        Args:
+            keywords: 비교할 키워드 목록 (순서 유지)
+            at: 기준 시각 (Unix time, 그 시각 이전의 가장 최근 스냅샷, None이면 최근 스냅샷)
+
+        Returns:
+            {"edges": 공통 구간 경계, "keywords": 키워드별 요약 리스트, "missing": 스냅샷이 없는 키워드}
+            키워드별 요약: {"keyword", "snapshot_id", "taken_at", "statistics", "counts"}
+            (statistics에 q1/median/q3 포함, edges와 counts는 어느 키워드든 가격이 있는 구간 범위만)
+        """
+        conn = self._connect()
+        found, missing = [], []
+        for keyword in dict.fromkeys(keywords):
+            row = self._find_snapshot(conn, keyword, None, at)
+            if row is None:
+                missing.append(keyword)
+            else:
+                found.append(row)
+
+        aggregates = {}
+        if found:
+            placeholders = ", ".join("?" * len(found))
+            for row in conn.execute(
+                f"SELECT snapshot_id, q1, median, q3, bins FROM snapshot_aggregates "
+                f"WHERE snapshot_id IN ({placeholders})",
+                [row["id"] for row in found],
+            ):
+                aggregates[row["snapshot_id"]] = {
+                    "q1": row["q1"],
+                    "median": row["median"],
+                    "q3": row["q3"],
+                    "bins": np.frombuffer(row["bins"], dtype=BIN_COUNT_DTYPE),
+                }
+            with conn:
+                for row in found:
+                    if row["id"] not in aggregates:
+                        aggregates[row["id"]] = self._store_aggregate(
+                            conn, row["id"], self._load_prices(conn, row["id"])
+                        )
+
+        # 모든 키워드를 통틀어 가격이 있는 구간 범위로 잘라 응답 크기를 줄임
+        size = len(AGGREGATE_BIN_EDGES) - 1
+        occupied = np.zeros(size, dtype=bool)
+        for aggregate in aggregates.values():
+            occupied |= aggregate["bins"] > 0
+        nonzero = np.flatnonzero(occupied)
+        first, last = (int(nonzero[0]), int(nonzero[-1]) + 1) if nonzero.size else (0, 0)
+
+        results = []
+        for row in found:
+            aggregate = aggregates[row["id"]]
+            item = self._meta_dict(row)
+            item["statistics"].update(
+                q1=aggregate["q1"], median=aggregate["median"], q3=aggregate["q3"]
+            )
+            results.append(
+                {
+                    "keyword": item["keyword"],
+                    "snapshot_id": item["id"],
+                    "taken_at": item["taken_at"],
+                    "statistics": item["statistics"],
+                    "counts": aggregate["bins"][first:last],
+                }
+            )
+        return {
+            "edges": AGGREGATE_BIN_EDGES[first:last + 1] if last else AGGREGATE_BIN_EDGES[:0],
+            "keywords": results,
+            "missing": missing,
+        }
+
+    def _store_diff(
+        self, conn: sqlite3.Connection, snapshot_id: int, keyword: str, taken_at: float, prices
+    ) -> Dict:
+        """스냅샷과 같은 키워드의 직전 스냅샷 사이의 차이를 계산하여 저장합니다."""
+        previous = conn.execute(
+            "SELECT id, prices FROM snapshots WHERE keyword = ? AND (taken_at, id) < (?, ?) "
+            "ORDER BY taken_at DESC, id DESC LIMIT 1",
+            (keyword, taken_at, snapshot_id),
+        ).fetchone()
+        if previous is None:
+            prev_id, added, removed = None, list(prices), []
+        else:
+            prev_id = previous["id"]
+            added, removed = diff_sorted(decode_prices(previous["prices"]), prices)
+        conn.execute(
+            "INSERT OR REPLACE INTO snapshot_diffs (snapshot_id, prev_id, added, removed) VALUES (?, ?, ?, ?)",
+            (snapshot_id, prev_id, encode_prices(added), encode_prices(removed)),
+        )
+        return {"prev_id": prev_id, "added": added, "removed": removed}
+
+    def diff(
+        self,
+        keyword: str,
+        from_id: Optional[int] = None,
+        to_id: Optional[int] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+    ) -> Optional[Dict]:
+        """
+        키워드의 두 스냅샷 사이에 추가/삭제된 가격과 통계 변화를 반환합니다.
+        바로 이웃한 두 스냅샷이면 저장할 때 기록한 차이를 그대로 사용하고,
+        그렇지 않으면 정렬된 두 가격 배열을 한 번씩만 훑어 비교합니다.
+
+        Args:
+            keyword: 검색 키워드
+            from_id / to_id: 비교할 스냅샷 id (지정하면 시각보다 우선)
+            start / end: 비교할 시각 (Unix time, 그 시각 또는 그 이전의 가장 최근 스냅샷)
+                         둘 다 없으면 최근 스냅샷과 그 직전 스냅샷을 비교
+
+        Returns:
+            {"keyword", "from", "to", "added", "removed", "statistics"} 또는 스냅샷을 찾을 수 없으면 None
+            (statistics: 항목별 {"from", "to", "change"})
+        """
+        conn = self._connect()
+        to_row = self._find_snapshot(conn, keyword, to_id, end)
+        if to_row is None:
+            return None
+        if from_id is None and start is None:
+            from_row = self._neighbor(conn, keyword, to_row, before=True)
+        else:
+            from_row = self._find_snapshot(conn, keyword, from_id, start)
+        if from_row is None:
+            return None
+
+        forward = (from_row["taken_at"], from_row["id"]) <= (to_row["taken_at"], to_row["id"])
+        older, newer = (from_row, to_row) if forward else (to_row, from_row)
+        cached = self._cached_diff(conn, newer["id"])
+        if cached is not None and cached["prev_id"] == older["id"]:
+            added, removed = cached["added"], cached["removed"]
+        elif older["id"] == newer["id"]:
+            added, removed = [], []
+        else:
+            added, removed = diff_sorted(
+                self._load_prices(conn, older["id"]), self._load_prices(conn, newer["id"])
+            )
+        if not forward:
+            added, removed = removed, added
+
+        return {
+            "keyword": keyword,
+            "from": self._meta_dict(from_row),
+            "to": self._meta_dict(to_row),
+            "added": [int(price) for price in added],
+            "removed": [int(price) for price in removed],
+            "statistics": self._stat_changes(from_row, to_row),
+        }
+
+    def diff_timeline(
+        self,
+        keyword: str,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: int = 100,
+    ) -> List[Dict]:
+        """
+        키워드의 이웃한 스냅샷 사이 변화를 시간순으로 반환합니다 (저장할 때 기록한 차이 사용).
+        대량 저장(add_snapshots_bulk)으로 차이가 없는 스냅샷은 이번에 계산하여 저장해 둡니다.
+
+        Args:
+            keyword: 검색 키워드
+            start / end: 시각 범위 (Unix time, 포함)
+            limit: 최대 개수
+
+        Returns:
+            {"snapshot_id", "prev_id", "taken_at", "added", "removed", "statistics"} 리스트
+            (첫 스냅샷은 prev_id가 None이고 모든 가격이 added)
+        """
+        where, params = self._where(keyword, start, end)
+        conn = self._connect()
+        rows = conn.execute(
+            f"SELECT {META_COLUMNS}, d.prev_id, d.added, d.removed, d.snapshot_id AS diff_id "
+            f"FROM snapshots LEFT JOIN snapshot_diffs d ON d.snapshot_id = snapshots.id {where} "
+            "ORDER BY taken_at, id LIMIT ?",
+            params + [limit],
+        ).fetchall()
+        if not rows:
+            return []
+
+        # 범위 첫 스냅샷의 직전 스냅샷 통계 (변화량 계산용)
+        previous = self._neighbor(conn, keyword, rows[0], before=True)
+        timeline = []
+        with conn:
+            for row in rows:
+                if row["diff_id"] is None:
+                    diff = self._store_diff(
+                        conn, row["id"], keyword, row["taken_at"], self._load_prices(conn, row["id"])
+                    )
+                else:
+                    diff = {
+                        "prev_id": row["prev_id"],
+                        "added": decode_prices(row["added"]),
+                        "removed": decode_prices(row["removed"]),
+                    }
+                timeline.append(
+                    {
+                        "snapshot_id": row["id"],
+                        "prev_id": diff["prev_id"],
+                        "taken_at": row["taken_at"],
+                        "added": [int(price) for price in diff["added"]],
+                        "removed": [int(price) for price in diff["removed"]],
+                        "statistics": self._stat_changes(previous, row),
+                    }
+                )
+                previous = row
+        return timeline
+
+    def _find_snapshot(self, conn, keyword: str, snapshot_id: Optional[int], at: Optional[float]):
+        """id 또는 시각(그 시각 이전의 가장 최근)으로 키워드의 스냅샷 메타데이터를 찾습니다."""
+        if snapshot_id is not None:
+            return conn.execute(
+                f"SELECT {META_COLUMNS} FROM snapshots WHERE id = ? AND keyword = ?",
+                (snapshot_id, keyword),
+            ).fetchone()
+        clause, params = ("AND taken_at <= ? ", [at]) if at is not None else ("", [])
+        return conn.execute(
+            f"SELECT {META_COLUMNS} FROM snapshots WHERE keyword = ? {clause}"
+            "ORDER BY taken_at DESC, id DESC LIMIT 1",
+            [keyword] + params,
+        ).fetchone()
+
+    @staticmethod
+    def _neighbor(conn, keyword: str, row, before: bool = True):
+        """같은 키워드에서 바로 이전(또는 다음) 스냅샷 메타데이터를 찾습니다."""
+        op, order = ("<", "DESC") if before else (">", "ASC")
+        return conn.execute(
+            f"SELECT {META_COLUMNS} FROM snapshots WHERE keyword = ? AND (taken_at, id) {op} (?, ?) "
+            f"ORDER BY taken_at {order}, id {order} LIMIT 1",
+            (keyword, row["taken_at"], row["id"]),
+        ).fetchone()
+
+    @staticmethod
+    def _load_prices(conn, snapshot_id: int) -> np.ndarray:
+        row = conn.execute("SELECT prices FROM snapshots WHERE id = ?", (snapshot_id,)).fetchone()
+        return decode_prices(row["prices"])
+
+    @staticmethod
+    def _cached_diff(conn, snapshot_id: int) -> Optional[Dict]:
+        row = conn.execute(
+            "SELECT prev_id, added, removed FROM snapshot_diffs WHERE snapshot_id = ?", (snapshot_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            "prev_id": row["prev_id"],
+            "added": decode_prices(row["added"]),
+            "removed": decode_prices(row["removed"]),
+        }
+
+    @staticmethod
+    def _stat_changes(old, new) -> Dict:
+        """두 스냅샷 메타데이터 행의 통계 변화 (old가 None이면 이전 값 없음)"""
+        changes = {}
+        for field in STAT_FIELDS:
+            before = old[field] if old is not None else None
+            changes[field] = {
+                "from": before,
+                "to": new[field],
+                "change": new[field] - before if before is not None else None,
+            }
+        return changes
+
+    @staticmethod
+    def _add_products(conn: sqlite3.Connection, snapshot_id: int, products: Iterable):
+        """스냅샷의 상품 정보와 상품명 토큰 색인을 저장합니다 (같은 상품 번호는 최저가 하나만)."""
+        unique: Dict[int, Tuple[str, int]] = {}
+        for product_id, name, price in products:
+            if product_id not in unique or price < unique[product_id][1]:
+                unique[product_id] = (name, price)
+
+        conn.executemany(
+            "INSERT INTO products (snapshot_id, product_id, name, price) VALUES (?, ?, ?, ?)",
+            [(snapshot_id, pid, name, price) for pid, (name, price) in unique.items()],
+        )
+        conn.executemany(
+            "INSERT INTO product_tokens (token, price, snapshot_id, product_id) VALUES (?, ?, ?, ?)",
+            [
+                (token, price, snapshot_id, pid)
+                for pid, (name, price) in unique.items()
+                for token in tokenize(name)
+            ],
+        )
+
+    def search_products(
+        self,
+        query: str,
+        max_price: Optional[int] = None,
+        min_price: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[Dict]:
+        """
+        상품명 역색인으로 검색어의 모든 토큰을 포함하는 상품을 찾습니다.
+        같은 상품이 여러 스냅샷에 있으면 가격 조건을 만족한 가장 최근 기록 하나만 반환합니다.
+
+        Args:
+            query: 검색어 (공백으로 구분한 토큰을 모두 포함해야 함, 대소문자 무시)
+            max_price: 최대 가격 (포함, None이면 제한 없음)
+            min_price: 최소 가격 (포함, None이면 제한 없음)
+            limit: 최대 개수
+
+        Returns:
+            가격 오름차순 {"product_id", "name", "price", "snapshot_id", "keyword", "taken_at"} 리스트
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+
+        price_clause, price_params = "", []
+        if min_price is not None:
+            price_clause += " AND price >= ?"
+            price_params.append(min_price)
+        if max_price is not None:
+            price_clause += " AND price <= ?"
+            price_params.append(max_price)
+
+        # 토큰마다 색인 범위 검색 후 모든 토큰이 나온 (스냅샷, 상품)만 남김
+        placeholders = ", ".join("?" * len(tokens))
+        rows = self._connect().execute(
+            f"""
+            WITH matched AS (
+                SELECT snapshot_id, product_id FROM product_tokens
+                WHERE token IN ({placeholders}){price_clause}
+                GROUP BY snapshot_id, product_id
+                HAVING COUNT(*) = ?
+            )
+            SELECT p.product_id, p.name, p.price, s.id AS snapshot_id, s.keyword,
+                   MAX(s.taken_at) AS taken_at
+            FROM matched m
+            JOIN products p ON p.snapshot_id = m.snapshot_id AND p.product_id = m.product_id
+            JOIN snapshots s ON s.id = m.snapshot_id
+            GROUP BY p.product_id
+            ORDER BY p.price, p.product_id
+            LIMIT ?
+            """,
+            tokens + price_params + [len(tokens), limit],
+        )
+        return [dict(row) for row in rows]
+
+    def add_snapshots_bulk(self, rows: Iterable[Tuple]) -> int:
+        """
+        여러 스냅샷을 한 트랜잭션으로 저장합니다.
+
+        Args:
+            rows: (keyword, taken_at, count, average, min, max, prices_bytes) 튜플들
+
+        Returns:
+            저장된 스냅샷 개수
+        """
+        conn = self._connect()
+        with conn:
+            cursor = conn.executemany(
+                "INSERT INTO snapshots (keyword, taken_at, count, average, min, max, prices) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return cursor.rowcount
+
+    @contextmanager
+    def bulk_load(self):
+        """
+        대량 저장 중에만 디스크 동기화를 끄는 컨텍스트 매니저
+        (도중에 전원이 꺼지면 최근 데이터가 유실될 수 있으므로 생성 스크립트 등에서만 사용)
+        """
+        conn = self._connect()
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("PRAGMA cache_size=-200000")
+        try:
+            yield self
+        finally:
+            conn.execute(f"PRAGMA synchronous={self._synchronous}")
+            conn.execute("PRAGMA cache_size=-2000")
+            if self.journal_mode == "WAL":
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def get_snapshot(self, snapshot_id: int) -> Optional[Dict]:
+        """
+        스냅샷 하나를 불러옵니다.
+
+        Returns:
+            pickle 결과와 같은 형식의 딕셔너리 ({"keyword", "prices", "statistics", ...}) 또는 None
+        """
+        row = (
+            self._connect()
+            .execute(f"SELECT {META_COLUMNS}, prices FROM snapshots WHERE id = ?", (snapshot_id,))
+            .fetchone()
+        )
+        return self._to_dict(row) if row else None
+
+    def latest(self, keyword: str) -> Optional[Dict]:
+        """키워드의 가장 최근 스냅샷을 불러옵니다."""
+        row = (
+            self._connect()
+            .execute(
+                f"SELECT {META_COLUMNS}, prices FROM snapshots WHERE keyword = ? "
+                "ORDER BY taken_at DESC, id DESC LIMIT 1",
+                (keyword,),
+            )
+            .fetchone()
+        )
+        return self._to_dict(row) if row else None
+
+    def list_snapshots(
+        self,
+        keyword: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[Dict]:
+        """
+        가격 배열 없이 스냅샷 메타데이터(최신순)를 조회합니다.
+
+        Args:
+            keyword: 키워드 (None이면 전체)
+            start: 시작 시각 (Unix time, 포함)
+            end: 종료 시각 (Unix time, 포함)
+            limit: 최대 개수
+            offset: 건너뛸 개수
+        """
+        where, params = self._where(keyword, start, end)
+        rows = self._connect().execute(
+            f"SELECT {META_COLUMNS} FROM snapshots {where} "
+            "ORDER BY taken_at DESC, id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        )
+        return [self._meta_dict(row) for row in rows]
+
+    def iter_snapshots(
+        self,
+        keyword: Optional[str] = None,
+        start: Optional[float] = None,
+        end: Optional[float] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[List[Dict]]:
+        """
+        스냅샷을 시간순으로 batch_size개씩 나누어 읽습니다.
+        전체를 메모리에 올리지 않도록 (taken_at, id) 기준 키셋 페이지네이션을 사용합니다.
+
+        Yields:
+            가격 배열을 포함한 스냅샷 딕셔너리 리스트
+        """
+        where, params = self._where(keyword, start, end)
+        cursor_clause = "AND" if where else "WHERE"
+        last = None
+        conn = self._connect()
+        while True:
+            if last is None:
+                sql = f"SELECT {META_COLUMNS}, prices FROM snapshots {where} "
+                args = list(params)
+            else:
+                sql = (
+                    f"SELECT {META_COLUMNS}, prices FROM snapshots {where} "
+                    f"{cursor_clause} (taken_at, id) > (?, ?) "
+                )
+                args = params + list(last)
+            rows = conn.execute(sql + "ORDER BY taken_at, id LIMIT ?", args + [batch_size]).fetchall()
+            if not rows:
+                return
+            yield [self._to_dict(row, as_array=True) for row in rows]
+            last = (rows[-1]["taken_at"], rows[-1]["id"])
+
+    def refresh_keyword_index(self) -> KeywordIndex:
+        """
+        마지막으로 색인한 이후 추가된 스냅샷의 키워드를 색인에 반영합니다.
+        다른 프로세스가 기록한 스냅샷도 id로 찾아내므로 여러 작업 프로세스가 같은 파일을 써도 됩니다.
+        """
+        conn = self._connect()
+        with self._index_lock:
+            max_id = conn.execute("SELECT MAX(id) FROM snapshots").fetchone()[0] or 0
+            if max_id > self._indexed_id:
+                rows = conn.execute(
+                    "SELECT keyword, COUNT(*), MAX(taken_at) FROM snapshots "
+                    "WHERE id > ? AND id <= ? GROUP BY keyword",
+                    (self._indexed_id, max_id),
+                )
+                self._keyword_index.add_many(rows)
+                self._indexed_id = max_id
+        return self._keyword_index
+
+    def search_history(self, query: str, limit: int = 20, offset: int = 0) -> Dict:
+        """
+        검색어와 비슷한 키워드의 스냅샷 메타데이터를 순위대로 조회합니다.
+        키워드 순위(정확히 일치 → 포함 → 유사도)로 정렬하고, 같은 키워드 안에서는 최신순입니다.
+
+        Args:
+            query: 검색어 (공백, 대소문자 무시, 한글 오타 일부 허용)
+            limit: 한 페이지 스냅샷 개수
+            offset: 건너뛸 스냅샷 개수
+
+        Returns:
+            {"total": 전체 스냅샷 개수, "keywords": 일치한 키워드 목록, "results": 스냅샷 메타데이터 리스트}
+            (각 결과에 키워드 일치 점수 "score" 포함)
+        """
+        matches = self.refresh_keyword_index().search(query)
+        total = sum(match["snapshots"] for match in matches)
+
+        # 키워드별 스냅샷 개수로 페이지가 걸친 키워드만 골라 (keyword, taken_at) 색인으로 읽음
+        results = []
+        skip, remaining = offset, limit
+        conn = self._connect()
+        for match in matches:
+            if remaining <= 0:
+                break
+            if skip >= match["snapshots"]:
+                skip -= match["snapshots"]
+                continue
+            rows = conn.execute(
+                f"SELECT {META_COLUMNS} FROM snapshots WHERE keyword = ? "
+                "ORDER BY taken_at DESC, id DESC LIMIT ? OFFSET ?",
+                (match["keyword"], remaining, skip),
+            ).fetchall()
+            skip = 0
+            remaining -= len(rows)
+            for row in rows:
+                item = self._meta_dict(row)
+                item["score"] = match["score"]
+                results.append(item)
+
+        return {"total": total, "keywords": matches, "results": results}
+
+    def keywords(self) -> List[Dict]:
+        """저장된 키워드별 스냅샷 개수와 최근 수집 시각을 반환합니다."""
+        rows = self._connect().execute(
+            "SELECT keyword, COUNT(*) AS snapshots, MAX(taken_at) AS last_taken_at "
+            "FROM snapshots GROUP BY keyword ORDER BY snapshots DESC"
+        )
+        return [dict(row) for row in rows]
+
+    def count(self) -> int:
+        """저장된 스냅샷 개수를 반환합니다."""
+        return self._connect().execute("SELECT COUNT(*) FROM snapshots").fetchone()[0]
+
+    def close(self):
+        """현재 스레드의 연결을 닫습니다."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+    @staticmethod
+    def _where(keyword, start, end) -> Tuple[str, list]:
+        clauses, params = [], []
+        if keyword is not None:
+            clauses.append("keyword = ?")
+            params.append(keyword)
+        if start is not None:
+            clauses.append("taken_at >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("taken_at <= ?")
+            params.append(end)
+        return ("WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    @staticmethod
+    def _meta_dict(row) -> Dict:
+        return {
+            "id": row["id"],
+            "keyword": row["keyword"],
+            "taken_at": row["taken_at"],
+            "statistics": {
+                "count": row["count"],
+                "average": row["average"],
+                "min": row["min"],
+                "max": row["max"],
+            },
+        }
+
+    @classmethod
+    def _to_dict(cls, row, as_array: bool = False) -> Dict:
+        data = cls._meta_dict(row)
+        prices = decode_prices(row["prices"])
+        data["prices"] = prices if as_array else prices.tolist()
+        return data
@@ -3,6 +3,11 @@
 // 전역 변수
 let currentChart = null;
 let currentResult = null;
+let compareCharts = [];
+
+// 키워드 비교 색상 (키워드 순서대로 사용)
+const COMPARE_COLORS = ['79, 70, 229', '16, 185, 129', '245, 158, 11', '239, 68, 68',
+    '14, 165, 233', '168, 85, 247', '236, 72, 153', '107, 114, 128'];
 
 // 페이지 로드 시 초기화
 document.addEventListener('DOMContentLoaded', function () {
@@ -53,6 +58,8 @@ async function searchPrice() {
             // 저장 완료 메시지 표시
             if (data.saved_filename) {
                 showSuccess(`"${keyword}" 검색 완료! ${data.stats.count}개의 가격을 분석했습니다.\n💾 자동 저장: ${data.saved_filename}`);
+            } else if (data.cached) {
+                showSuccess(`"${keyword}" 최근 검색 결과입니다. ${data.stats.count}개의 가격을 분석했습니다.`);
             } else {
                 showSuccess(`"${keyword}" 검색 완료! ${data.stats.count}개의 가격을 분석했습니다.`);
             }
@@ -115,6 +122,12 @@ function displayResults(data) {
 }
 
 // 차트 생성
+// 서버는 구간 경계(edges)와 개수(values)를 숫자로 보내므로 레이블은 여기서 만듦
+function histogramLabels(histogramData) {
+    const edges = histogramData.edges || [];
+    return edges.slice(0, -1).map(edge => Math.round(edge).toLocaleString());
+}
+
 function createChart(histogramData) {
     const ctx = document.getElementById('priceChart').getContext('2d');
 
@@ -127,7 +140,7 @@ function createChart(histogramData) {
     currentChart = new Chart(ctx, {
         type: 'bar',
         data: {
-            labels: histogramData.labels,
+            labels: histogramLabels(histogramData),
             datasets: [{
                 label: '가격 분포',
                 data: histogramData.values,
@@ -332,7 +345,8 @@ function createHistoryItem(item, index) {
 // 히스토리 아이템 불러오기
 async function loadHistoryItem(filename) {
     try {
-        const response = await fetch(`/api/load/${filename}`);
+        // 목록에는 상위 20개만 표시하므로 첫 페이지만 요청 (히스토그램은 서버가 전체 가격으로 계산)
+        const response = await fetch(`/api/load/${encodeURIComponent(filename)}?limit=20`);
         const result = await response.json();
 
         if (result.success && result.data) {
@@ -341,16 +355,17 @@ async function loadHistoryItem(filename) {
             // 검색창에 키워드 표시
             document.getElementById('searchInput').value = data.keyword;
 
-            // 히스토그램 데이터 생성
             const prices = data.prices || [];
-            const histogramData = createHistogramFromPrices(prices);
+            const histogramData = data.histogram || { edges: [], values: [] };
 
             // 결과 표시
             currentResult = {
                 keyword: data.keyword,
                 stats: data.statistics,
                 prices: prices,
-                histogram: histogramData
+                histogram: histogramData,
+                // 이미 저장된 파일이므로 첫 페이지만으로 다시 저장하지 않도록 표시
+                saved_filename: filename
             };
 
             displayResults(currentResult);
@@ -368,36 +383,187 @@ async function loadHistoryItem(filename) {
     }
 }
 
-// 가격 배열에서 히스토그램 데이터 생성
-function createHistogramFromPrices(prices) {
-    if (!prices || prices.length === 0) {
-        return { labels: [], values: [] };
+// 키워드 비교
+// 서버는 저장할 때 계산한 요약(사분위수, 공통 로그 구간별 개수)만 보내므로 가격 목록을 다시 받지 않음
+async function compareKeywords() {
+    const keywords = document.getElementById('compareInput').value
+        .split(',')
+        .map(keyword => keyword.trim())
+        .filter(keyword => keyword);
+
+    if (keywords.length < 2) {
+        showError('비교할 키워드를 쉼표로 구분하여 2개 이상 입력해주세요.');
+        return;
     }
 
-    const min = Math.min(...prices);
-    const max = Math.max(...prices);
-    const binCount = 20;
-    const binSize = (max - min) / binCount;
+    try {
+        const response = await fetch(`/api/compare?keywords=${encodeURIComponent(keywords.join(','))}`);
+        const data = await response.json();
 
-    const bins = new Array(binCount).fill(0);
-    const labels = [];
+        if (!data.success) {
+            throw new Error(data.error || '비교 결과를 불러올 수 없습니다.');
+        }
+        displayComparison(data);
 
-    // 구간별 개수 계산
-    prices.forEach(price => {
-        const binIndex = Math.min(Math.floor((price - min) / binSize), binCount - 1);
-        bins[binIndex]++;
-    });
+    } catch (error) {
+        console.error('비교 오류:', error);
+        showError('키워드 비교 중 오류가 발생했습니다: ' + error.message);
+    }
+}
 
-    // 레이블 생성
-    for (let i = 0; i < binCount; i++) {
-        const binStart = Math.round(min + i * binSize);
-        labels.push(binStart.toLocaleString());
+function displayComparison(data) {
+    compareCharts.forEach(chart => chart.destroy());
+    compareCharts = [
+        createCompareHistogram(data),
+        createCompareBoxPlot(data.keywords),
+    ];
+    displayCompareTable(data.keywords);
+
+    const missing = document.getElementById('compareMissing');
+    if (data.missing && data.missing.length > 0) {
+        missing.textContent = `저장된 검색 결과가 없는 키워드: ${data.missing.join(', ')}`;
+        missing.style.display = 'block';
+    } else {
+        missing.style.display = 'none';
     }
+    document.getElementById('compareResult').style.display = 'block';
+}
+
+// 공통 로그 구간 히스토그램 (상품 수가 달라도 비교할 수 있도록 키워드별 비율로 표시)
+function createCompareHistogram(data) {
+    const ctx = document.getElementById('compareChart').getContext('2d');
+    const datasets = data.keywords.map((item, index) => {
+        const color = COMPARE_COLORS[index % COMPARE_COLORS.length];
+        const total = item.statistics.count || 1;
+        return {
+            label: item.keyword,
+            data: item.counts.map(count => count / total * 100),
+            counts: item.counts,
+            backgroundColor: `rgba(${color}, 0.6)`,
+            borderColor: `rgba(${color}, 1)`,
+            borderWidth: 1,
+        };
+    });
+
+    return new Chart(ctx, {
+        type: 'bar',
+        data: { labels: histogramLabels(data), datasets: datasets },
+        options: {
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                tooltip: {
+                    callbacks: {
+                        label: function (context) {
+                            const count = context.dataset.counts[context.dataIndex];
+                            return `${context.dataset.label}: ${context.parsed.y.toFixed(1)}% (${count}개)`;
+                        }
+                    }
+                }
+            },
+            scales: {
+                y: {
+                    beginAtZero: true,
+                    title: { display: true, text: '비율 (%)' }
+                },
+                x: {
+                    title: { display: true, text: '가격 구간 (원, 로그 눈금)' },
+                    ticks: { maxRotation: 45, minRotation: 45 }
+                }
+            }
+        }
+    });
+}
+
+// 상자 그림: 최저~최고(수염), 1~3사분위(상자), 중앙값(선)을 같은 막대 위치에 겹쳐 그림
+function createCompareBoxPlot(items) {
+    const ctx = document.getElementById('compareBoxChart').getContext('2d');
+    const colors = items.map((item, index) => COMPARE_COLORS[index % COMPARE_COLORS.length]);
+    const stats = items.map(item => item.statistics);
 
-    return {
-        labels: labels,
-        values: bins
-    };
+    return new Chart(ctx, {
+        type: 'bar',
+        data: {
+            labels: items.map(item => item.keyword),
+            datasets: [
+                {
+                    label: '최저~최고',
+                    data: stats.map(s => [s.min, s.max]),
+                    backgroundColor: colors.map(color => `rgba(${color}, 0.4)`),
+                    barPercentage: 0.08,
+                },
+                {
+                    label: '1~3사분위',
+                    data: stats.map(s => [s.q1, s.q3]),
+                    backgroundColor: colors.map(color => `rgba(${color}, 0.7)`),
+                    barPercentage: 0.6,
+                },
+                {
+                    label: '중앙값',
+                    // 로그 눈금에서 일정한 두께로 보이도록 중앙값의 ±1% 구간으로 그림
+                    data: stats.map(s => [s.median / 1.01, s.median * 1.01]),
+                    medians: stats.map(s => s.median),
+                    backgroundColor: 'rgba(17, 24, 39, 0.9)',
+                    barPercentage: 0.6,
+                }
+            ]
+        },
+        options: {
+            indexAxis: 'y',
+            responsive: true,
+            maintainAspectRatio: false,
+            plugins: {
+                legend: { display: false },
+                tooltip: {
+                    callbacks: {
+                        label: function (context) {
+                            if (context.dataset.medians) {
+                                return '중앙값: ' + Math.round(context.dataset.medians[context.dataIndex]).toLocaleString() + '원';
+                            }
+                            const [low, high] = context.raw;
+                            return `${context.dataset.label}: ${Math.round(low).toLocaleString()} ~ ${Math.round(high).toLocaleString()}원`;
+                        }
+                    }
+                }
+            },
+            scales: {
+                x: {
+                    type: 'logarithmic',
+                    title: { display: true, text: '가격 (원, 로그 눈금)' },
+                    ticks: {
+                        callback: value => Number(value).toLocaleString()
+                    }
+                }
+            },
+            // 세 데이터셋을 나란히 놓지 않고 같은 위치에 겹침
+            datasets: {
+                bar: { grouped: false }
+            }
+        }
+    });
+}
+
+function displayCompareTable(items) {
+    const tbody = document.getElementById('compareTableBody');
+    const won = value => Math.round(value).toLocaleString() + '원';
+    tbody.innerHTML = '';
+
+    items.forEach(item => {
+        const s = item.statistics;
+        const row = document.createElement('tr');
+        const cells = [
+            item.keyword,
+            new Date(item.taken_at * 1000).toLocaleString(),
+            s.count.toLocaleString() + '개',
+            won(s.min), won(s.q1), won(s.median), won(s.q3), won(s.max), won(s.average),
+        ];
+        cells.forEach(text => {
+            const cell = document.createElement('td');
+            cell.textContent = text;
+            row.appendChild(cell);
+        });
+        tbody.appendChild(row);
+    });
 }
 
 // UI 유틸리티 함수
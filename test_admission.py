@@ -0,0 +1,79 @@
+"""
+크롤링 수락 제어 (AdmissionController) 테스트
+"""
+
+import threading
+import time
+
+from admission import AdmissionController, OverloadedError
+
+
+def wait_until(condition, timeout=2.0):
+    """조건이 참이 될 때까지 잠시 기다립니다."""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            raise AssertionError("시간 초과")
+        time.sleep(0.005)
+
+
+def test_rejects_when_queue_full():
+    """대기열이 가득 차면 즉시 거절하는지 테스트"""
+    controller = AdmissionController(max_concurrent=1, max_queue=1, queue_timeout=5)
+    controller.acquire("a")
+
+    waiter = threading.Thread(target=lambda: controller.release(controller.acquire("b")))
+    waiter.start()
+    wait_until(lambda: controller.snapshot()["queued"] == 1)
+
+    try:
+        controller.acquire("c")
+        raise AssertionError("OverloadedError가 발생해야 합니다")
+    except OverloadedError as e:
+        print(f"거절됨: {e} (Retry-After: {e.retry_after}초)")
+        assert e.retry_after >= 1
+
+    controller.release(0.01)
+    waiter.join()
+    assert controller.snapshot()["rejected"] == 1
+
+
+def test_round_robin_between_clients():
+    """한 클라이언트가 몰아 보내도 다른 클라이언트가 차례를 얻는지 테스트"""
+    controller = AdmissionController(max_concurrent=1, max_queue=10, queue_timeout=5)
+    controller.acquire("holder")
+
+    order = []
+    lock = threading.Lock()
+
+    def run(client_id):
+        controller.acquire(client_id)
+        with lock:
+            order.append(client_id)
+        controller.release(0.0)
+
+    threads = []
+    for client_id in ["busy", "busy", "busy", "quiet"]:
+        thread = threading.Thread(target=run, args=(client_id,))
+        thread.start()
+        threads.append(thread)
+        wait_until(lambda n=len(threads): controller.snapshot()["queued"] == n)
+
+    controller.release(0.0)
+    for thread in threads:
+        thread.join()
+
+    print(f"실행 순서: {order}")
+    assert order.index("quiet") == 1
+
+
+def test_timing_separates_queue_wait_and_service():
+    """대기 시간과 실행 시간을 따로 기록하는지 테스트"""
+    controller = AdmissionController(max_concurrent=1, queue_timeout=5)
+
+    with controller.admit("a") as timing:
+        time.sleep(0.02)
+
+    assert timing["queue_wait"] == 0.0
+    assert timing["service_time"] >= 0.02
+    assert controller.snapshot()["active"] == 0
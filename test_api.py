@@ -0,0 +1,491 @@
+"""
+웹 대시보드 API 테스트
+네트워크 없이 크롤러를 샘플 데이터로 대체하여 Flask API를 확인합니다.
+"""
+
+import glob
+import json
+import os
+import shutil
+import tempfile
+
+import app as dashboard
+from snapshot_store import SnapshotStore
+
+
+SAMPLE_PRICES = {
+    "무선마우스": [15900, 22000, 28900, 35500, 42000],
+    "키보드": [25000, 39000, 52000],
+}
+
+
+def fake_scrape_prices(keyword):
+    """샘플 데이터를 반환하는 가짜 크롤러"""
+    fake_scrape_prices.calls.append(keyword)
+    return SAMPLE_PRICES.get(keyword, [])
+
+
+def fake_fetch(context):
+    """파이프라인 fetch 단계 대체: 네트워크 대신 샘플 가격을 채웁니다."""
+    context["response"] = None
+    context["prices"] = fake_scrape_prices(context["keyword"])
+
+
+def setup_module(module):
+    """모든 테스트 전에 크롤러와 저장소를 테스트용으로 교체합니다."""
+    module._before = set(glob.glob("result_*.pkl"))
+    module._original_fetch = dashboard.pipeline.stages["fetch"]
+    module._original_store = dashboard.store
+    module._tmpdir = tempfile.mkdtemp(prefix="price_test_")
+    dashboard.pipeline.replace_stage("fetch", fake_fetch)
+    dashboard.store = SnapshotStore(os.path.join(module._tmpdir, "snapshots.db"))
+    dashboard.pipeline.store = dashboard.store
+
+
+def teardown_module(module):
+    """크롤러와 저장소를 복구하고 테스트 중 생성된 파일을 정리합니다."""
+    dashboard.pipeline.replace_stage("fetch", module._original_fetch)
+    dashboard.store.close()
+    dashboard.store = module._original_store
+    dashboard.pipeline.store = module._original_store
+    shutil.rmtree(module._tmpdir, ignore_errors=True)
+    for file in set(glob.glob("result_*.pkl")) - module._before:
+        os.remove(file)
+
+
+def setup_function(function):
+    fake_scrape_prices.calls = []
+    dashboard.result_cache.clear()
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+def test_batch_search():
+    """일괄 검색 API 테스트"""
+    client = dashboard.app.test_client()
+
+    response = client.post(
+        "/api/search/batch",
+        json={"keywords": ["무선마우스", "키보드", "없는상품", "무선마우스"]},
+    )
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+
+    results = {r["keyword"]: r for r in read_ndjson(response)}
+    print(f"일괄 검색 결과: {len(results)}개 키워드")
+
+    assert set(results) == {"무선마우스", "키보드", "없는상품"}
+    assert results["무선마우스"]["stats"]["min"] == 15900
+    assert sum(results["키보드"]["histogram"]["values"]) == 3
+    assert results["없는상품"]["success"] is False
+    assert sorted(fake_scrape_prices.calls) == sorted(["무선마우스", "키보드", "없는상품"])
+
+
+def test_batch_search_reuses_cache():
+    """신선한 캐시 결과 재사용 테스트"""
+    client = dashboard.app.test_client()
+
+    client.post("/api/search", json={"keyword": "키보드"})
+    response = client.post("/api/search/batch", json={"keywords": ["키보드"]})
+
+    (result,) = read_ndjson(response)
+    assert result["cached"] is True
+    assert fake_scrape_prices.calls == ["키보드"]
+
+
+def test_batch_search_validation():
+    """잘못된 요청 처리 테스트"""
+    client = dashboard.app.test_client()
+
+    assert client.post("/api/search/batch", json={}).status_code == 400
+    assert client.post("/api/search/batch", json={"keywords": ["  "]}).status_code == 400
+
+
+def test_search_overloaded():
+    """대기열이 가득 찼을 때 429 응답 테스트"""
+    client = dashboard.app.test_client()
+    original = dashboard.admission
+    dashboard.admission = dashboard.AdmissionController(max_concurrent=0, max_queue=0)
+
+    try:
+        response = client.post("/api/search", json={"keyword": "키보드"})
+    finally:
+        dashboard.admission = original
+
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert fake_scrape_prices.calls == []
+
+
+def test_search_reports_timing():
+    """대기 시간과 실행 시간이 응답에 포함되는지 테스트"""
+    client = dashboard.app.test_client()
+
+    data = client.post("/api/search", json={"keyword": "무선마우스"}).get_json()
+
+    assert set(data["timing"]) == {"queue_wait_ms", "service_ms"}
+
+
+def test_metrics_endpoint():
+    """단계별 지표가 Prometheus 형식으로 출력되는지 테스트"""
+    client = dashboard.app.test_client()
+
+    client.post("/api/search", json={"keyword": "무선마우스"})
+    client.post("/api/search/batch", json={"keywords": ["무선마우스"]})
+    response = client.get("/metrics")
+    text = response.get_data(as_text=True)
+
+    assert response.status_code == 200
+    assert 'price_pipeline_stage_duration_seconds_bucket{stage="analyze",le="+Inf"}' in text
+    assert 'price_pipeline_stage_duration_seconds_count{stage="histogram"}' in text
+    assert 'price_cache_requests_total{cache="result",result="hit"}' in text
+    assert 'http_requests_total{endpoint="/api/search",method="POST",status="200"}' in text
+    assert "scrape_admission_queue_wait_seconds_count" in text
+
+
+def test_metrics_after_unhandled_error():
+    """처리되지 않은 예외로 끝난 요청도 처리 중 요청 수를 되돌리고 500으로 집계하는지 테스트"""
+    client = dashboard.app.test_client()
+    original = dashboard.app.view_functions["admission_status"]
+
+    def broken():
+        raise RuntimeError("처리되지 않은 오류")
+
+    in_flight = dashboard.HTTP_IN_FLIGHT.labels()
+    before = in_flight.get()
+    dashboard.app.view_functions["admission_status"] = broken
+    try:
+        assert client.get("/api/admission").status_code == 500
+        # 디버그 모드처럼 예외가 그대로 전파되면 after_request 훅은 실행되지 않음
+        dashboard.app.config["PROPAGATE_EXCEPTIONS"] = True
+        for _ in range(2):
+            try:
+                client.get("/api/admission")
+                raise AssertionError("RuntimeError가 발생해야 합니다")
+            except RuntimeError:
+                pass
+    finally:
+        dashboard.app.config["PROPAGATE_EXCEPTIONS"] = None
+        dashboard.app.view_functions["admission_status"] = original
+
+    assert in_flight.get() == before
+    text = client.get("/metrics").get_data(as_text=True)
+    assert 'http_requests_total{endpoint="/api/admission",method="GET",status="500"} 3' in text
+
+
+def test_profile_on_demand(tmp_path):
+    """요청 단위 프로파일링 및 조회 테스트"""
+    client = dashboard.app.test_client()
+    original_directory = dashboard.profiler.directory
+    dashboard.profiler.directory = str(tmp_path)
+
+    try:
+        response = client.post(
+            "/api/search", json={"keyword": "키보드"}, headers={"X-Profile": "1"}
+        )
+        name = response.headers["X-Profile-Id"]
+
+        profiles = client.get("/admin/profiles").get_json()["profiles"]
+        report = client.get(f"/admin/profiles/{name}")
+        download = client.get(f"/admin/profiles/{name}?download=1")
+        plain = client.post("/api/search", json={"keyword": "키보드"})
+    finally:
+        dashboard.profiler.directory = original_directory
+
+    print(f"프로파일 저장: {name}")
+    assert [p["name"] for p in profiles] == [name]
+    assert "analyze_keyword" in report.get_data(as_text=True)
+    assert download.status_code == 200
+    assert "X-Profile-Id" not in plain.headers
+    assert client.get("/admin/profiles/..%2Fapp").status_code == 404
+
+
+def test_profile_access_control(tmp_path):
+    """토큰이 없으면 로컬 접속만, 토큰이 있으면 같은 토큰을 보낸 요청만 프로파일링/조회하는지 테스트"""
+    client = dashboard.app.test_client()
+    remote = {"REMOTE_ADDR": "203.0.113.7"}
+    original_directory, original_token = dashboard.profiler.directory, dashboard.profiler.token
+    dashboard.profiler.directory = str(tmp_path)
+
+    try:
+        response = client.post(
+            "/api/search?profile=1&profile_memory=1", json={"keyword": "키보드"}, environ_base=remote
+        )
+        assert "X-Profile-Id" not in response.headers
+        assert client.get("/admin/profiles", environ_base=remote).status_code == 403
+        # 같은 서버의 프록시를 거친 요청도 외부 요청으로 취급
+        proxied = {"X-Forwarded-For": "203.0.113.7"}
+        assert client.get("/admin/profiles", headers=proxied).status_code == 403
+
+        dashboard.profiler.token = "비밀-토큰"
+        assert client.get("/admin/profiles").status_code == 403
+        assert client.get("/admin/profiles?token=틀린-토큰", environ_base=remote).status_code == 403
+        response = client.post(
+            "/api/search", json={"keyword": "키보드"}, headers={"X-Profile": "비밀-토큰"}, environ_base=remote
+        )
+        assert "X-Profile-Id" in response.headers
+        listing = client.get("/admin/profiles", headers={"X-Profile": "비밀-토큰"}, environ_base=remote)
+        assert listing.status_code == 200
+    finally:
+        dashboard.profiler.directory, dashboard.profiler.token = original_directory, original_token
+
+
+def test_search_records_snapshot():
+    """검색 결과가 스냅샷 저장소에 기록되는지 테스트"""
+    client = dashboard.app.test_client()
+
+    data = client.post("/api/search", json={"keyword": "무선마우스"}).get_json()
+    snapshot = dashboard.store.get_snapshot(data["snapshot_id"])
+
+    assert snapshot["keyword"] == "무선마우스"
+    assert snapshot["prices"] == SAMPLE_PRICES["무선마우스"]
+    assert snapshot["statistics"]["min"] == 15900
+
+
+def test_load_pagination():
+    """저장된 결과를 커서 기반 페이지로 나눠 불러오는지 테스트"""
+    client = dashboard.app.test_client()
+    prices = list(range(10000, 10000 + 250 * 100, 100))
+    filename = dashboard.analyzer.save_results(
+        {"keyword": "페이지", "prices": prices, "statistics": {"count": len(prices)}}
+    )
+
+    first = client.get(f"/api/load/{filename}?limit=100").get_json()
+    assert first["data"]["prices"] == prices[:100]
+    assert first["page"] == {"limit": 100, "total": 250, "next_cursor": prices[99]}
+    assert sum(first["data"]["histogram"]["values"]) == 250
+    assert len(first["data"]["histogram"]["edges"]) == 21
+
+    collected = list(first["data"]["prices"])
+    cursor = first["page"]["next_cursor"]
+    while cursor is not None:
+        page = client.get(f"/api/load/{filename}?limit=100&cursor={cursor}").get_json()
+        assert "histogram" not in page["data"]
+        collected.extend(page["data"]["prices"])
+        cursor = page["page"]["next_cursor"]
+    assert collected == prices
+
+    assert client.get(f"/api/load/{filename}?cursor=abc").status_code == 400
+
+
+def test_response_compression():
+    """Accept-Encoding에 따라 큰 JSON 응답만 gzip으로 압축하는지 테스트"""
+    import gzip
+
+    client = dashboard.app.test_client()
+    prices = list(range(20000, 20000 + 300 * 100, 100))
+    filename = dashboard.analyzer.save_results(
+        {"keyword": "압축", "prices": prices, "statistics": {"count": len(prices)}}
+    )
+    url = f"/api/load/{filename}?limit=300"
+
+    plain = client.get(url)
+    compressed = client.get(url, headers={"Accept-Encoding": "gzip, deflate"})
+    refused = client.get(url, headers={"Accept-Encoding": "gzip;q=0"})
+    small = client.get("/api/history", headers={"Accept-Encoding": "gzip"})
+
+    print(f"원본 {len(plain.data)} bytes → gzip {len(compressed.data)} bytes")
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in compressed.headers["Vary"]
+    assert len(compressed.data) < len(plain.data)
+    assert json.loads(gzip.decompress(compressed.data)) == plain.get_json()
+    assert "Content-Encoding" not in refused.headers
+    assert small.status_code == 200
+
+
+def test_dumps_numpy():
+    """NumPy 배열과 스칼라를 리스트 변환 없이 JSON으로 직렬화하는지 테스트"""
+    import numpy as np
+    import api_encoding
+
+    body = api_encoding.dumps(
+        {"키워드": "마우스", "values": np.array([1, 2, 3]), "mean": np.float64(1.5)}
+    )
+    assert json.loads(body) == {"키워드": "마우스", "values": [1, 2, 3], "mean": 1.5}
+    assert "마우스".encode("utf-8") in body
+
+
+def test_products_search():
+    """상품명 역색인 검색 API 테스트"""
+    client = dashboard.app.test_client()
+    dashboard.store.add_snapshot(
+        "마우스",
+        [19000, 45000],
+        products=[(101, "로지텍 M185 무선 마우스", 19000), (102, "로지텍 MX Master 3S", 45000)],
+    )
+
+    data = client.get("/api/products?q=로지텍&max_price=30000").get_json()
+    print(f"검색 결과: {data}")
+    assert data["success"]
+    assert [(p["product_id"], p["name"], p["price"]) for p in data["products"]] == [
+        (101, "로지텍 M185 무선 마우스", 19000)
+    ]
+    assert client.get("/api/products").status_code == 400
+    assert client.get("/api/products?q=로지텍&max_price=싸게").status_code == 400
+
+
+def test_history_search():
+    """과거 검색 키워드 검색 API 테스트 (공백 무시, 페이지 나누기)"""
+    client = dashboard.app.test_client()
+    for t in range(3):
+        dashboard.store.add_snapshot("블루투스 스피커", [30000 + t], taken_at=1_700_000_000 + t)
+
+    data = client.get("/api/history?q=블루투스스피커&per_page=2").get_json()
+    print(f"검색 결과: {data}")
+    assert data["success"]
+    assert data["keywords"] == ["블루투스 스피커"]
+    assert data["page"] == {"page": 1, "per_page": 2, "total": 3}
+    assert [item["stats"]["min"] for item in data["history"]] == [30002, 30001]
+
+    second = client.get("/api/history?q=블루투스스피커&per_page=2&page=2").get_json()
+    assert [item["stats"]["min"] for item in second["history"]] == [30000]
+    assert client.get("/api/history?q=스피커&page=x").status_code == 400
+
+
+def test_rank_price():
+    """최근 스냅샷과 기간 기록 기준 가격 백분위 API 테스트"""
+    client = dashboard.app.test_client()
+    day = 86400
+    dashboard.store.add_snapshot("순위키워드", [10000, 20000, 30000, 40000], taken_at=1_700_000_000)
+    dashboard.store.add_snapshot("순위키워드", [5000, 15000], taken_at=1_700_000_000 + 10 * day)
+    dashboard.store.add_snapshot("순위키워드", [20000, 30000], taken_at=1_700_000_000 + 20 * day)
+
+    data = client.get("/api/rank?keyword=순위키워드&price=20000&window_days=15").get_json()
+    print(f"순위: {data}")
+    assert data["success"]
+    assert data["latest"]["count"] == 2 and data["latest"]["percentile"] == 25.0
+    assert data["window"]["snapshots"] == 2 and data["window"]["count"] == 4
+    assert data["window"]["percentile"] == 62.5 and data["window"]["cheaper"] == 2
+
+    assert client.get("/api/rank?keyword=없는키워드&price=1").status_code == 404
+    assert client.get("/api/rank?keyword=순위키워드").status_code == 400
+
+
+def test_diff_api():
+    """두 스냅샷 비교 및 변화 타임라인 API 테스트"""
+    client = dashboard.app.test_client()
+    base = 1_700_000_000
+    dashboard.store.add_snapshot("비교키워드", [10000, 20000, 30000], taken_at=base)
+    dashboard.store.add_snapshot("비교키워드", [10000, 25000, 30000], taken_at=base + 3600)
+    dashboard.store.add_snapshot("비교키워드", [9000, 25000], taken_at=base + 7200)
+
+    latest = client.get("/api/diff?keyword=비교키워드").get_json()
+    print(f"최근 변화: {latest}")
+    assert latest["added"] == [9000] and latest["removed"] == [10000, 30000]
+    assert latest["statistics"]["count"]["change"] == -1
+
+    span = client.get(f"/api/diff?keyword=비교키워드&from={base}&to={base + 7200}").get_json()
+    assert span["added"] == [9000, 25000] and span["removed"] == [10000, 20000, 30000]
+
+    timeline = client.get(f"/api/diff/timeline?keyword=비교키워드&from={base + 1}").get_json()
+    assert [item["added"] for item in timeline["timeline"]] == [[25000], [9000]]
+
+    assert client.get("/api/diff?keyword=없는키워드").status_code == 404
+    assert client.get("/api/diff?keyword=비교키워드&from=어제").status_code == 400
+
+
+def test_compare_api():
+    """여러 키워드 분포 비교 API 테스트 (공통 로그 구간, 사분위수)"""
+    client = dashboard.app.test_client()
+    dashboard.store.add_snapshot("비교마우스", [10000, 20000, 30000, 40000], taken_at=1_700_000_000)
+    dashboard.store.add_snapshot("비교키보드", [50000, 60000], taken_at=1_700_000_100)
+
+    data = client.get("/api/compare?keywords=비교마우스, 비교키보드,없는키워드").get_json()
+    print(f"비교 결과: {data}")
+    assert data["success"]
+    assert [item["keyword"] for item in data["keywords"]] == ["비교마우스", "비교키보드"]
+    assert data["missing"] == ["없는키워드"]
+    assert len(data["edges"]) == len(data["keywords"][0]["counts"]) + 1
+    assert data["edges"][0] <= 10000 and data["edges"][-1] > 60000
+    assert [sum(item["counts"]) for item in data["keywords"]] == [4, 2]
+    assert data["keywords"][0]["statistics"]["median"] == 25000
+
+    # keyword를 여러 번 지정해도 됨
+    repeated = client.get("/api/compare?keyword=비교마우스&keyword=비교키보드").get_json()
+    assert len(repeated["keywords"]) == 2
+
+    assert client.get("/api/compare").status_code == 400
+    assert client.get("/api/compare?keywords=없는키워드").status_code == 404
+    many = ",".join(f"k{i}" for i in range(dashboard.COMPARE_MAX_KEYWORDS + 1))
+    assert client.get(f"/api/compare?keywords={many}").status_code == 400
+
+
+def test_export_api():
+    """스냅샷 기록 청크 전송 내보내기 API 테스트 (CSV, NDJSON, Parquet, 오류 처리)"""
+    import history_export
+
+    client = dashboard.app.test_client()
+    dashboard.store.add_snapshot("내보내기키워드", [11000, 12000], taken_at=1_700_000_000)
+    dashboard.store.add_snapshot("내보내기키워드", [13000], taken_at=1_700_000_100)
+
+    response = client.get("/api/export?keyword=내보내기키워드")
+    assert response.status_code == 200 and response.is_streamed
+    assert response.mimetype == "text/csv"
+    lines = response.get_data(as_text=True).splitlines()
+    print("\n".join(lines))
+    assert lines[0] == "snapshot_id,keyword,taken_at,price"
+    assert [line.rsplit(",", 1)[1] for line in lines[1:]] == ["11000", "12000", "13000"]
+
+    response = client.get("/api/export?keyword=내보내기키워드&format=ndjson&from=1700000050")
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row["price"] for row in rows] == [13000]
+
+    response = client.get("/api/export?keyword=내보내기키워드&format=parquet&level=snapshots")
+    if history_export.pa is None:
+        assert response.status_code == 501
+    else:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(pa.BufferReader(response.get_data()))
+        assert table.column("count").to_pylist() == [2, 1]
+
+    assert client.get("/api/export?format=xlsx").status_code == 400
+    assert client.get("/api/export?level=rows").status_code == 400
+    assert client.get("/api/export?from=어제").status_code == 400
+
+
+def test_search_serves_warmed_snapshot():
+    """예열한 인기 키워드는 /api/search가 fetch 단계 없이 답하고, refresh면 새로 수집하는지 테스트"""
+    client = dashboard.app.test_client()
+    dashboard.store.add_snapshot("무선마우스", [11000, 12000, 13000])
+    assert dashboard._warm_latest_snapshots() >= 1
+
+    data = client.post("/api/search", json={"keyword": "무선마우스"}).get_json()
+    assert data["cached"] is True and data["stats"]["min"] == 11000
+    assert fake_scrape_prices.calls == []
+
+    data = client.post("/api/search", json={"keyword": "무선마우스", "refresh": True}).get_json()
+    assert data["cached"] is False and data["stats"]["min"] == 15900
+    assert fake_scrape_prices.calls == ["무선마우스"]
+
+
+def test_warmup_and_readiness():
+    """예열이 최근 스냅샷을 결과 캐시에 넣고, 준비 상태 API가 상태를 알려 주는지 테스트"""
+    import time
+
+    client = dashboard.app.test_client()
+    dashboard.store.add_snapshot("예열키워드", [15000, 16000, 17000])
+    dashboard.store.add_snapshot("오래된키워드", [9000], taken_at=time.time() - 3600)
+
+    assert dashboard._warm_latest_snapshots() >= 1
+    response = client.post("/api/search/batch", json={"keywords": ["예열키워드", "오래된키워드"]})
+    results = {r["keyword"]: r for r in read_ndjson(response)}
+    # 최근 스냅샷은 크롤링 없이 캐시에서, TTL이 지난 스냅샷은 다시 수집
+    assert results["예열키워드"]["cached"] and results["예열키워드"]["stats"]["min"] == 15000
+    assert fake_scrape_prices.calls == ["오래된키워드"]
+    assert dashboard._warm_aggregates() >= 2
+
+    response = client.get("/api/ready")
+    body = response.get_json()
+    print(f"준비 상태: {body}")
+    assert response.status_code == 200 and body["ready"]
+    assert [step["name"] for step in body["warmup"]["steps"]] == [
+        "history_files",
+        "keyword_index",
+        "latest_snapshots",
+        "aggregates",
+    ]
@@ -0,0 +1,138 @@
+"""
+CLI 버전 부가 기능 테스트
+로컬 다나와 대체 서버를 사용하여 네트워크 없이 실행합니다.
+"""
+
+import io
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from danawa_stub_server import start_stub_server
+from snapshot_store import SnapshotStore
+import price_analyzer_cli
+
+
+def setup_module(module):
+    module.server, url = start_stub_server(products=20)
+    os.environ["DANAWA_BASE_URL"] = url
+
+
+def teardown_module(module):
+    del os.environ["DANAWA_BASE_URL"]
+    module.server.shutdown()
+    module.server.server_close()
+
+
+def test_batch_analyze_jsonl(tmp_path):
+    """일괄 처리 모드가 키워드마다 한 줄씩 출력하고 저장하는지 테스트"""
+    keywords_file = tmp_path / "keywords.txt"
+    keywords_file.write_text("무선마우스\n# 주석\n\n키보드\n모니터\n", encoding="utf-8")
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    out = io.StringIO()
+
+    failures = price_analyzer_cli.batch_analyze(
+        price_analyzer_cli.read_keywords(str(keywords_file)),
+        workers=2,
+        with_prices=True,
+        store=store,
+        histogram_dir=str(tmp_path / "charts"),
+        out=out,
+    )
+
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    print(f"출력 {len(lines)}줄: {[line['keyword'] for line in lines]}")
+    assert failures == 0
+    assert sorted(line["keyword"] for line in lines) == ["모니터", "무선마우스", "키보드"]
+    assert all(line["statistics"]["count"] == len(line["prices"]) for line in lines)
+    assert store.count() == 3
+    assert len(os.listdir(tmp_path / "charts")) == 3
+
+
+def test_batch_analyze_csv():
+    """CSV 출력 형식 테스트"""
+    out = io.StringIO()
+
+    price_analyzer_cli.batch_analyze(["무선마우스"], fmt="csv", out=out)
+
+    header, row = out.getvalue().splitlines()
+    assert header == "keyword,success,count,average,min,max,error,elapsed_ms"
+    assert row.startswith("무선마우스,1,")
+
+
+def test_diff_prices():
+    """정렬된 가격 리스트 병합 비교 테스트"""
+    added, removed = price_analyzer_cli.DataAnalyzer.diff_prices(
+        [1000, 2000, 3000, 5000], [1500, 2000, 5000, 7000, 9000]
+    )
+    assert added == [1500, 7000, 9000]
+    assert removed == [1000, 3000]
+    assert price_analyzer_cli.DataAnalyzer.median([1000, 2000, 3000, 5000]) == 2500
+
+    out = io.StringIO()
+    assert price_analyzer_cli.print_price_changes("마우스", [1000, 2000], [1000, 2000], out=out) is False
+    assert price_analyzer_cli.print_price_changes("마우스", [1000, 2000], [1500, 2000], out=out)
+    print(out.getvalue())
+    assert "+ " in out.getvalue() and "최저 1,000원 → 1,500원 (▲500)" in out.getvalue()
+
+
+def test_watch_reuses_response_cache():
+    """감시 모드가 페이지가 같으면 응답 캐시를 재사용하고 변경 없음만 출력하는지 테스트"""
+    scraper = price_analyzer_cli.PriceScraper(verbose=False)
+    hits = scraper._response_hits.get()
+    out = io.StringIO()
+
+    price_analyzer_cli.watch_prices("감시키워드", interval=0, scraper=scraper, cycles=3, out=out)
+
+    lines = out.getvalue().splitlines()
+    print("\n".join(lines))
+    assert len(lines) == 3
+    assert "감시 시작" in lines[0]
+    assert all("변경 없음" in line for line in lines[1:])
+    assert scraper._response_hits.get() - hits == 2
+
+
+def test_history_search_output(tmp_path):
+    """CLI 과거 검색 조회 출력 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    for t in range(3):
+        store.add_snapshot("무선마우스", [15000 + t, 20000], taken_at=1_700_000_000 + t)
+    out = io.StringIO()
+
+    total = price_analyzer_cli.print_history_search(store, "무선 마우스", per_page=2, out=out)
+
+    lines = out.getvalue().splitlines()
+    print("\n".join(lines))
+    assert total == 3
+    assert "3개 (1/2 페이지)" in lines[0]
+    assert len(lines) == 3 and "최저     15,002원" in lines[1]
+    assert price_analyzer_cli.print_history_search(store, "냉장고", out=out) == 0
+
+
+def test_export_history(tmp_path):
+    """CLI 스냅샷 기록 내보내기 테스트 (확장자로 형식 판단, 키워드/기간 선택)"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    store.add_snapshot("무선마우스", [15000, 20000], taken_at=100)
+    store.add_snapshot("무선마우스", [16000], taken_at=200)
+    store.add_snapshot("키보드", [30000], taken_at=150)
+
+    csv_path = str(tmp_path / "history.csv")
+    written = price_analyzer_cli.export_history(store, csv_path, keyword="무선마우스")
+    with open(csv_path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    print("\n".join(lines))
+    assert written > 0
+    assert lines == [
+        "snapshot_id,keyword,taken_at,price",
+        "1,무선마우스,100.0,15000",
+        "1,무선마우스,100.0,20000",
+        "2,무선마우스,200.0,16000",
+    ]
+
+    jsonl_path = str(tmp_path / "history.jsonl")
+    price_analyzer_cli.export_history(store, jsonl_path, start=120, level="snapshots")
+    with open(jsonl_path, encoding="utf-8") as f:
+        rows = [json.loads(line) for line in f]
+    assert [(row["keyword"], row["count"]) for row in rows] == [("키보드", 1), ("무선마우스", 1)]
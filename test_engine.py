@@ -0,0 +1,212 @@
+"""
+핵심 엔진(price_engine) 파이프라인 테스트
+로컬 다나와 대체 서버를 사용하여 네트워크 없이 실행합니다.
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from danawa_stub_server import start_stub_server
+from price_engine import PipelineCancelled, PricePipeline, PriceScraper
+from snapshot_store import SnapshotStore
+
+
+def setup_module(module):
+    module.server, module.url = start_stub_server(products=20)
+
+
+def teardown_module(module):
+    module.server.shutdown()
+    module.server.server_close()
+
+
+def test_pipeline_runs_all_stages(tmp_path):
+    """전체 단계 실행 및 저장, render 단계 교체 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    order = []
+    pipeline = PricePipeline(
+        scraper=PriceScraper(base_url=url, verbose=False),
+        store=store,
+        render=lambda context: context.update(chart=len(context["prices"])),
+    )
+
+    context = pipeline.run("무선마우스", on_stage=order.append)
+
+    prices = context["prices"]
+    print(f"{len(prices)}개 수집, 통계: {context['statistics']}")
+    assert order == ["fetch", "extract", "filter", "analyze", "persist", "render"]
+    assert prices == sorted(set(prices)) and prices
+    assert context["statistics"] == pipeline.analyzer.calculate_statistics(prices)
+    assert context["chart"] == len(prices)
+    assert store.get_snapshot(context["snapshot_id"])["prices"] == prices
+
+
+def test_pipeline_reuses_not_modified_response():
+    """같은 수집기로 다시 실행하면 304 응답으로 이전 가격을 재사용하는지 테스트"""
+    pipeline = PricePipeline(scraper=PriceScraper(base_url=url, verbose=False))
+    first = pipeline.run("키보드", until="analyze")
+    hits = pipeline.scraper._response_hits.get()
+
+    second = pipeline.run("키보드", until="analyze")
+
+    assert pipeline.scraper._response_hits.get() == hits + 1
+    assert second["response"] is None
+    assert second["prices"] == first["prices"]
+    assert second["statistics"] == first["statistics"]
+
+
+def test_pipeline_stage_plugins_and_cancel():
+    """단계 추가/교체 및 취소 토큰 테스트"""
+    pipeline = PricePipeline(scraper=PriceScraper(base_url=url, verbose=False))
+    pipeline.replace_stage("fetch", lambda context: context.update(response=None, prices=[5000, 7000]))
+    pipeline.insert_stage("tag", lambda context: context.update(tag="checked"), after="analyze")
+
+    context = pipeline.run("가짜")
+    assert context["statistics"]["average"] == 6000
+    assert context["tag"] == "checked"
+
+    cancel = threading.Event()
+    cancel.set()
+    try:
+        pipeline.run("가짜", cancel_event=cancel)
+    except PipelineCancelled:
+        pass
+    else:
+        raise AssertionError("취소되지 않음")
+
+
+def test_pipeline_resume_after_analyze():
+    """analyze 단계까지 실행한 context에 이어서 나머지 단계를 실행하는지 테스트"""
+    order = []
+    pipeline = PricePipeline(scraper=PriceScraper(base_url=url, verbose=False))
+    pipeline.replace_stage("fetch", lambda context: context.update(response=None, prices=[5000, 7000]))
+    pipeline.insert_stage("tag", lambda context: order.append("tag"), after="analyze")
+    pipeline.replace_stage("render", lambda context: order.append("render"))
+
+    context = pipeline.run("가짜", until="analyze")
+    assert order == [] and context["statistics"]["average"] == 6000
+
+    pipeline.resume(context, after="analyze")
+    assert order == ["tag", "render"]
+
+
+def test_multi_source_fan_out():
+    """여러 소스 동시 수집, 결과 병합, 소스별 제한 시간 테스트"""
+    import time
+
+    from price_engine import DanawaSource, HtmlSource, MultiSource
+
+    shop, shop_url = start_stub_server(products=20, seed=7, latency_ms=200)
+    slow, slow_url = start_stub_server(products=20, seed=9, latency_ms=3000)
+    broken, broken_url = start_stub_server(products=20, error_rate=1.0)
+    try:
+        sources = MultiSource(
+            [
+                DanawaSource(PriceScraper(base_url=url, verbose=False)),
+                HtmlSource("shop", shop_url),
+                HtmlSource("slow", slow_url, timeout=0.5),
+                HtmlSource("broken", broken_url),
+            ]
+        )
+        start = time.perf_counter()
+        prices, products, report = sources.collect("무선마우스")
+        elapsed = time.perf_counter() - start
+        print(f"{len(prices)}개, {elapsed * 1000:.0f}ms, {report}")
+
+        expected = set(PriceScraper(base_url=url, verbose=False).scrape_prices("무선마우스"))
+        expected |= set(PriceScraper(base_url=shop_url, verbose=False).scrape_prices("무선마우스"))
+        assert prices == sorted(expected)
+        # 상품 정보는 상품 번호 체계가 같은 다나와 소스에서만 모음
+        assert len(products) == 20 and {product.price for product in products} <= set(prices)
+        assert [report[name]["status"] for name in ("danawa", "shop", "slow", "broken")] == [
+            "ok",
+            "ok",
+            "timeout",
+            "error",
+        ]
+        # 순차 합계(3.2초 이상)가 아니라 느린 소스의 제한 시간 정도에서 끝남
+        assert elapsed < 1.5
+
+        pipeline = PricePipeline(sources=MultiSource([HtmlSource("shop", shop_url)]))
+        context = pipeline.run("키보드", until="analyze")
+        assert context["sources"]["shop"]["count"] == context["statistics"]["count"]
+        sources.close()
+        pipeline.sources.close()
+    finally:
+        for server in (shop, slow, broken):
+            server.shutdown()
+            server.server_close()
+
+
+def test_multi_source_products_and_timeout(tmp_path):
+    """여러 소스 모드에서도 다나와 상품 정보를 저장하고, 공유 수집기 대신 소스 제한 시간을 쓰는지 테스트"""
+    import time
+
+    from price_engine import DanawaSource, MultiSource
+
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    pipeline = PricePipeline(
+        store=store, sources=MultiSource([DanawaSource(PriceScraper(base_url=url, verbose=False))])
+    )
+    context = pipeline.run("무선마우스", until="persist")
+    assert len(context["products"]) == 20
+    found = store.search_products(context["products"][0].name.split()[0])
+    assert context["products"][0].id in [item["product_id"] for item in found]
+    pipeline.sources.close()
+
+    slow, slow_url = start_stub_server(products=20, latency_ms=3000)
+    try:
+        # 수집기 자체 타임아웃은 10초지만 소스 제한 시간(0.3초)이 지나면 요청을 끊음
+        source = DanawaSource(PriceScraper(base_url=slow_url, verbose=False), timeout=0.3)
+        start = time.perf_counter()
+        try:
+            source.collect("무선마우스", deadline=time.monotonic() + source.timeout)
+        except Exception as e:
+            print(f"{type(e).__name__}: {e}")
+        else:
+            raise AssertionError("제한 시간이 지났는데 수집됨")
+        assert time.perf_counter() - start < 1.5
+    finally:
+        slow.shutdown()
+        slow.server_close()
+
+
+def test_build_sources_spec():
+    """소스 설정 문자열 해석 테스트"""
+    from price_engine import build_sources
+
+    assert build_sources("") is None
+    sources = build_sources(f"danawa, shop={url}", timeout=3)
+    assert [source.name for source in sources.sources] == ["danawa", "shop"]
+    assert sources.sources[1].scraper.timeout == 3
+    sources.close()
+    try:
+        build_sources("shop")
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("잘못된 설정이 허용됨")
+
+
+def test_pipeline_collects_products(tmp_path):
+    """가격과 같은 파싱에서 상품 정보를 모으고 저장소 역색인에 등록하는지 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    pipeline = PricePipeline(scraper=PriceScraper(base_url=url, verbose=False), store=store)
+
+    context = pipeline.run("무선마우스", until="persist")
+    products = context["products"]
+    print(f"상품 {len(products)}개: {products[:2]}")
+    assert len(products) == 20
+    assert all("무선마우스" in product.name for product in products)
+    assert {product.price for product in products} <= set(context["prices"])
+
+    brand = products[0].name.split()[0]
+    found = store.search_products(brand, max_price=products[0].price)
+    assert products[0].id in [item["product_id"] for item in found]
+
+    # 304로 재사용한 경우에도 상품 정보 유지
+    again = pipeline.run("무선마우스", until="filter")
+    assert again["response"] is None and again["products"] == products
@@ -0,0 +1,183 @@
+"""
+수집 작업 대기열 (JobQueue)과 작업 프로세스 (ScrapeWorker) 테스트
+"""
+
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from danawa_stub_server import start_stub_server
+from job_queue import JobQueue, parse_shard, shard_key
+from price_engine import PricePipeline, PriceScraper
+from scrape_worker import ScrapeWorker
+from snapshot_store import SnapshotStore
+
+
+def test_enqueue_lease_complete(tmp_path):
+    """중복 키워드 건너뛰기, 임대, 완료 후 다시 넣기를 테스트"""
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    assert queue.enqueue(["마우스", "키보드", "마우스", " "]) == 2
+    assert queue.enqueue(["마우스"]) == 0
+
+    jobs = queue.lease("a", limit=5)
+    assert [job["keyword"] for job in jobs] == ["마우스", "키보드"]
+    assert all(job["attempts"] == 1 for job in jobs)
+    assert queue.lease("b") == []
+
+    assert not queue.complete(jobs[0]["id"], "b")
+    assert queue.complete(jobs[0]["id"], "a", snapshot_id=7)
+    # 끝난 키워드는 다시 넣을 수 있음
+    assert queue.enqueue(["마우스"]) == 1
+    print(f"상태: {queue.counts()}")
+    assert queue.counts() == {"queued": 1, "leased": 1, "done": 1, "failed": 0}
+
+
+def test_shard_filter(tmp_path):
+    """샤드마다 crc32 % n == i인 키워드만 가져가는지 테스트"""
+    queue = JobQueue(str(tmp_path / "jobs.db"))
+    keywords = [f"상품 {i}" for i in range(40)]
+    queue.enqueue(keywords)
+
+    seen = []
+    for index in range(3):
+        jobs = queue.lease(f"w{index}", limit=100, shard=parse_shard(f"{index}/3"))
+        assert all(shard_key(job["keyword"]) % 3 == index for job in jobs)
+        seen += [job["keyword"] for job in jobs]
+    assert sorted(seen) == sorted(keywords)
+
+    try:
+        parse_shard("3/3")
+        raise AssertionError("ValueError가 발생해야 합니다")
+    except ValueError:
+        pass
+
+
+def test_retry_and_visibility_timeout(tmp_path):
+    """실패 시 백오프 후 재시도, 임대 만료 시 다른 작업자가 가져가기, 시도 소진 시 실패 확정을 테스트"""
+    queue = JobQueue(str(tmp_path / "jobs.db"), visibility_timeout=0.1, max_attempts=2, retry_delay=0.1)
+    queue.enqueue(["마우스"])
+
+    job = queue.lease("a")[0]
+    assert queue.fail(job["id"], "a", "503") == "queued"
+    assert queue.lease("a") == []  # 백오프 동안은 가져가지 않음
+    time.sleep(0.15)
+
+    # 두 번째 시도 중 작업자가 죽은 경우: 임대가 만료되어도 시도를 다 썼으므로 실패로 확정
+    job = queue.lease("a")[0]
+    assert job["attempts"] == 2
+    time.sleep(0.15)
+    assert queue.lease("b") == []
+    assert queue.counts()["failed"] == 1
+    assert queue.failed()[0]["last_error"] == "503"
+
+    # 시도가 남았으면 임대가 만료된 작업을 다른 작업자가 가져감
+    queue.max_attempts = 3
+    queue.enqueue(["키보드"])
+    queue.lease("a")
+    time.sleep(0.15)
+    job = queue.lease("b")[0]
+    assert job["keyword"] == "키보드"
+    assert not queue.complete(job["id"], "a")
+    assert queue.complete(job["id"], "b")
+
+
+def test_worker_drains_queue(tmp_path):
+    """작업 프로세스가 대체 서버에서 수집하여 스냅샷을 저장하고 대기열을 비우는지 테스트"""
+    server, url = start_stub_server(products=20)
+    try:
+        queue = JobQueue(str(tmp_path / "jobs.db"))
+        store = SnapshotStore(str(tmp_path / "snapshots.db"))
+        queue.enqueue([f"상품 {i}" for i in range(12)])
+        out = io.StringIO()
+        worker = ScrapeWorker(
+            queue,
+            store,
+            concurrency=3,
+            poll_interval=0.05,
+            pipeline=PricePipeline(scraper=PriceScraper(base_url=url, verbose=False), store=store),
+            out=out,
+        )
+        stats = worker.run(drain=True)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(out.getvalue())
+    assert stats == {"done": 12, "empty": 0, "retried": 0, "failed": 0}
+    assert queue.counts()["done"] == 12
+    assert store.count() == 12
+
+
+def test_worker_extends_lease(tmp_path):
+    """수집이 임대 시간보다 오래 걸려도 임대를 연장하여 다른 작업자가 가져가지 않는지 테스트"""
+    queue = JobQueue(str(tmp_path / "jobs.db"), visibility_timeout=0.3)
+    queue.enqueue(["느린키워드"])
+    other = []
+
+    def slow_fetch(context):
+        time.sleep(0.5)
+        other.append(queue.lease("other"))
+        time.sleep(0.5)
+        context.update(response=None, prices=[5000, 7000])
+
+    pipeline = PricePipeline(scraper=PriceScraper(verbose=False))
+    pipeline.replace_stage("fetch", slow_fetch)
+    worker = ScrapeWorker(queue, None, concurrency=1, poll_interval=0.05, pipeline=pipeline, out=io.StringIO())
+    stats = worker.run(drain=True)
+
+    assert other == [[]]
+    assert stats["done"] == 1 and queue.counts()["done"] == 1
+
+
+def test_shared_fs_journal_mode(tmp_path):
+    """공유 파일 시스템용 롤백 저널 모드 테스트 (WAL의 -wal/-shm 파일을 만들지 않음)"""
+    queue = JobQueue(str(tmp_path / "jobs.db"), journal_mode="delete")
+    store = SnapshotStore(str(tmp_path / "snapshots.db"), journal_mode="DELETE")
+    queue.enqueue(["마우스"])
+    store.add_snapshot("마우스", [15000])
+
+    assert queue._connect().execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    assert store._connect().execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+    # 대량 저장 뒤에도 롤백 저널의 동기화 수준(FULL = 2)으로 돌아옴
+    with store.bulk_load():
+        store.add_snapshot("키보드", [30000])
+    assert store._connect().execute("PRAGMA synchronous").fetchone()[0] == 2
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(("-wal", "-shm"))]
+    try:
+        JobQueue(str(tmp_path / "other.db"), journal_mode="MEMORY")
+        raise AssertionError("ValueError가 발생해야 합니다")
+    except ValueError:
+        pass
+
+
+def _flaky_shard(args, shard):
+    """처음 실행한 샤드 1만 비정상 종료하는 테스트용 작업 함수"""
+    marker = os.path.join(args, f"shard-{shard[0]}")
+    with open(marker, "a") as f:
+        f.write("run\n")
+    if shard[0] == 1 and os.path.getsize(marker) == 4:
+        os._exit(3)
+
+
+def test_supervisor_restarts_dead_shard(tmp_path):
+    """비정상 종료한 샤드 프로세스만 같은 샤드로 다시 띄우는지 테스트"""
+    import signal
+
+    from scrape_worker import supervise_shards
+
+    previous = signal.getsignal(signal.SIGINT), signal.getsignal(signal.SIGTERM)
+    out = io.StringIO()
+    try:
+        code = supervise_shards(_flaky_shard, str(tmp_path), 3, restart_delay=0, out=out)
+    finally:
+        signal.signal(signal.SIGINT, previous[0])
+        signal.signal(signal.SIGTERM, previous[1])
+
+    print(out.getvalue())
+    runs = {name: open(tmp_path / name).read().count("run") for name in sorted(os.listdir(tmp_path))}
+    assert code == 0
+    assert runs == {"shard-0": 1, "shard-1": 2, "shard-2": 1}
+    assert "샤드 1/3" in out.getvalue()
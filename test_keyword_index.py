@@ -0,0 +1,65 @@
+"""
+검색 키워드 trigram 색인 테스트
+"""
+
+from keyword_index import KeywordIndex, ngrams, normalize_keyword
+from snapshot_store import SnapshotStore
+
+
+def test_normalize_keyword():
+    """공백, 대소문자 무시 및 한글 자모 분해 테스트"""
+    assert normalize_keyword("무선 마우스") == normalize_keyword("무선마우스") == "ㅁㅜㅅㅓㄴㅁㅏㅇㅜㅅㅡ"
+    assert normalize_keyword(" SSD  1TB ") == "ssd1tb"
+    assert normalize_keyword("닭") == "ㄷㅏㄺ"
+    assert ngrams("ㅁㅏㅇ") == {"ㅁㅏㅇ"}
+    assert ngrams("") == set()
+
+
+def test_keyword_search_ranking():
+    """정확히 일치 → 포함 → 유사(오타) 순위 테스트"""
+    index = KeywordIndex()
+    index.add_many(
+        [
+            ("마우스", 3, 100.0),
+            ("무선마우스", 5, 300.0),
+            ("게이밍 마우스", 2, 200.0),
+            ("무선 키보드", 4, 400.0),
+            ("모니터", 1, 50.0),
+        ]
+    )
+    index.add("마우스", 2, 500.0)
+
+    found = index.search("마우스")
+    print(f"검색 결과: {found}")
+    assert [item["keyword"] for item in found] == ["마우스", "무선마우스", "게이밍 마우스"]
+    assert found[0]["snapshots"] == 5 and found[0]["last_taken_at"] == 500.0
+
+    # 공백 차이와 받침 오타
+    assert index.search("무선 마우스")[0]["keyword"] == "무선마우스"
+    assert index.search("무선마우수")[0]["keyword"] == "무선마우스"
+    # trigram보다 짧은 검색어는 포함 여부로 검색
+    assert [item["keyword"] for item in index.search("모")] == ["모니터"]
+    assert index.search("냉장고") == []
+
+
+def test_store_search_history_pages(tmp_path):
+    """저장소 키워드 검색 페이지 나누기 및 새 스냅샷 반영 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    for t in range(5):
+        store.add_snapshot("무선마우스", [10000 + t], taken_at=100 + t)
+    for t in range(3):
+        store.add_snapshot("게이밍 마우스", [30000 + t], taken_at=200 + t)
+    store.add_snapshot("키보드", [50000], taken_at=300)
+
+    first = store.search_history("무선 마우스", limit=4)
+    assert first["total"] == 5
+    assert [item["taken_at"] for item in first["results"]] == [104, 103, 102, 101]
+
+    pages = [store.search_history("마우스", limit=3, offset=offset)["results"] for offset in (0, 3, 6)]
+    keywords = [item["keyword"] for page in pages for item in page]
+    assert keywords == ["무선마우스"] * 5 + ["게이밍 마우스"] * 3
+    assert [len(page) for page in pages] == [3, 3, 2]
+
+    # 색인을 만든 뒤 추가된 스냅샷도 다음 검색에 반영
+    store.add_snapshot("블루투스 마우스", [20000], taken_at=400)
+    assert store.search_history("마우스")["total"] == 9
@@ -0,0 +1,53 @@
+"""
+스트리밍 가격 추출 파이프라인 테스트
+"""
+
+import os
+import re
+import sys
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from danawa_pages import generate_products, render_search_page
+from price_engine.stream import OnlineStats, iter_price_strings, stream_prices
+
+
+def split(text: str, size: int):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def test_matches_full_page_parsing():
+    """조각 크기와 관계없이 BeautifulSoup 전체 파싱 결과와 같은지 테스트"""
+    html = render_search_page("무선마우스", generate_products("무선마우스", 30, seed=1))
+    html += "<script>var price = '99,999원';</script><style>.a{content:'88,888원'}</style>"
+    text = BeautifulSoup(html, "html.parser").get_text()
+    expected = sorted(
+        {
+            int(m.replace(",", ""))
+            for m in re.findall(r"(\d[\d,]*)\s*원", text)
+            if 1000 <= int(m.replace(",", "")) <= 100000000
+        }
+    )
+
+    for size in (1, 3, 64, 4096):
+        assert sorted(stream_prices(split(html, size))) == expected
+    assert 99999 not in expected and 88888 not in expected
+
+
+def test_price_split_across_chunks():
+    """조각 경계에 걸친 가격 문자열 테스트"""
+    texts = ["가격 12,", "900", " ", "원 배송비 3,000원 5", "00"]
+    assert list(iter_price_strings(texts)) == ["12,900", "3,000"]
+
+
+def test_yields_early_and_online_stats():
+    """가격을 찾는 즉시 내보내고 통계를 누적하는지 테스트"""
+    stats = OnlineStats()
+    prices = stream_prices(iter(["<p>15,900원</p>", "<p>9,900원</p><p>15,900원</p>", "<p>1원</p>"]), stats=stats)
+
+    assert next(prices) == 15900
+    assert stats.to_dict() == {"average": 15900, "max": 15900, "min": 15900, "count": 1}
+    assert list(prices) == [9900]
+    assert stats.to_dict() == {"average": 12900, "max": 15900, "min": 9900, "count": 2}
@@ -0,0 +1,110 @@
+"""
+프로세스 간 공유 캐시 (SharedCache)와 ResultCache.get_or_compute 테스트
+"""
+
+import os
+import threading
+import time
+
+from result_cache import ResultCache
+from shared_cache import SharedCache
+
+
+def test_get_set_ttl_and_eviction(tmp_path):
+    """키 정규화, 만료, 최대 항목 수를 넘을 때 오래된 항목 제거를 테스트"""
+    path = str(tmp_path / "cache.db")
+    cache = SharedCache(path, ttl=0.2, max_entries=2)
+    cache.set("무선  마우스", {"prices": [1000, 2000]})
+    assert cache.get("무선 마우스") == {"prices": [1000, 2000]}
+
+    # 같은 파일을 여는 다른 인스턴스(다른 프로세스 역할)도 같은 값을 봄
+    assert SharedCache(path, ttl=0.2).get("무선 마우스") == {"prices": [1000, 2000]}
+    # 이름이 다르면 같은 파일이어도 분리
+    assert SharedCache(path, name="validators").get("무선 마우스") is None
+
+    time.sleep(0.3)
+    assert cache.get("무선 마우스") is None
+
+    cache.ttl = None
+    for keyword in ["a", "b", "c"]:
+        cache.set(keyword, keyword)
+    assert cache.get("a") is None
+    assert cache.get("b") == "b" and cache.get("c") == "c"
+
+    cache.clear()
+    assert cache.get("c") is None
+
+
+def test_get_or_compute_once_across_processes(tmp_path):
+    """여러 프로세스가 같은 키를 동시에 요청해도 한 곳에서만 계산하는지 테스트"""
+    path = str(tmp_path / "cache.db")
+    marker = tmp_path / "computed"
+    SharedCache(path).clear()  # 스키마를 미리 만들어 둠
+
+    children = []
+    for _ in range(4):
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                cache = SharedCache(path, poll_interval=0.01)
+
+                def compute():
+                    with open(marker, "a") as f:
+                        f.write("x")
+                    time.sleep(0.3)
+                    return [1, 2, 3]
+
+                value, _ = cache.get_or_compute("마우스", compute)
+                code = 0 if value == [1, 2, 3] else 1
+            finally:
+                os._exit(code)
+        children.append(pid)
+
+    statuses = [os.waitpid(pid, 0)[1] for pid in children]
+    print(f"종료 상태: {statuses}, 계산 횟수: {len(marker.read_text())}")
+    assert statuses == [0, 0, 0, 0]
+    assert marker.read_text() == "x"
+
+
+def test_get_or_compute_releases_lease_on_error(tmp_path):
+    """계산이 실패하면 임대를 풀어 다음 요청이 다시 계산하는지 테스트"""
+    cache = SharedCache(str(tmp_path / "cache.db"))
+
+    def fail():
+        raise RuntimeError("수집 실패")
+
+    try:
+        cache.get_or_compute("마우스", fail)
+        raise AssertionError("RuntimeError가 발생해야 합니다")
+    except RuntimeError:
+        pass
+
+    assert cache.get_or_compute("마우스", lambda: None) == (None, False)
+    assert cache.get_or_compute("마우스", lambda: "ok") == ("ok", False)
+    assert cache.get_or_compute("마우스", lambda: "다시") == ("ok", True)
+
+
+def test_result_cache_single_flight():
+    """ResultCache.get_or_compute가 같은 프로세스의 동시 요청을 한 번만 계산하는지 테스트"""
+    cache = ResultCache(ttl=60)
+    calls = []
+    results = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.1)
+        return {"count": 3}
+
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get_or_compute("마우스", compute)))
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert sorted(hit for _, hit in results) == [False, True, True, True, True]
+    assert all(value == {"count": 3} for value, _ in results)
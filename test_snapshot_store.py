@@ -0,0 +1,202 @@
+"""
+스냅샷 저장소 및 대용량 히스토리 생성기 테스트
+"""
+
+import numpy as np
+
+from generate_history import generate_keyword_rows, make_keywords
+from price_engine import DataAnalyzer
+from snapshot_store import SnapshotStore
+
+
+def test_add_and_load_snapshot(tmp_path):
+    """스냅샷 저장 및 불러오기 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+
+    first = store.add_snapshot("무선마우스", [15900, 22000, 28900], taken_at=100)
+    store.add_snapshot("무선마우스", [14900, 21000], taken_at=200)
+    store.add_snapshot("키보드", [25000, 39000], taken_at=150)
+
+    snapshot = store.get_snapshot(first)
+    print(f"불러온 스냅샷: {snapshot}")
+    assert snapshot["prices"] == [15900, 22000, 28900]
+    assert snapshot["statistics"] == {"count": 3, "average": 22266.666666666668, "min": 15900, "max": 28900}
+
+    assert store.latest("무선마우스")["prices"] == [14900, 21000]
+    assert [s["taken_at"] for s in store.list_snapshots("무선마우스")] == [200, 100]
+    assert store.keywords()[0] == {"keyword": "무선마우스", "snapshots": 2, "last_taken_at": 200}
+
+
+def test_iter_snapshots_in_batches(tmp_path):
+    """시간 범위 조회를 나누어 읽는지 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    for t in range(10):
+        store.add_snapshot("모니터", [150000 + t], taken_at=t)
+
+    batches = list(store.iter_snapshots("모니터", start=2, end=8, batch_size=3))
+
+    assert [len(b) for b in batches] == [3, 3, 1]
+    assert [s["taken_at"] for b in batches for s in b] == [2, 3, 4, 5, 6, 7, 8]
+
+
+def test_generate_history_rows(tmp_path):
+    """생성된 스냅샷이 정렬된 고유 가격과 일치하는 통계를 갖는지 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    rng = np.random.default_rng(0)
+    times = 1_700_000_000 + np.arange(500) * 3600.0
+
+    with store.bulk_load():
+        for keyword in make_keywords(3):
+            store.add_snapshots_bulk(generate_keyword_rows(rng, keyword, times, 40, 0.2, 0.05, 1.0))
+
+    assert store.count() == 1500
+    for batch in store.iter_snapshots(batch_size=500):
+        for snapshot in batch:
+            prices = snapshot["prices"]
+            stats = snapshot["statistics"]
+            assert np.all(np.diff(prices) > 0)
+            assert stats["count"] == prices.size
+            assert stats["min"] == prices[0] and stats["max"] == prices[-1]
+            assert abs(stats["average"] - prices.mean()) < 1e-6
+
+
+def test_search_products_index(tmp_path):
+    """상품명 역색인 검색 테스트 (모든 토큰 포함, 가격 조건, 상품별 최근 기록)"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    store.add_snapshot(
+        "마우스",
+        [19000, 25000, 45000],
+        taken_at=100,
+        products=[
+            (1, "로지텍 M185 무선 마우스", 19000),
+            (2, "로지텍 MX Master 3S", 45000),
+            (3, "앱코 무선 마우스", 25000),
+        ],
+    )
+    store.add_snapshot(
+        "마우스",
+        [17000, 52000],
+        taken_at=200,
+        products=[(1, "로지텍 M185 무선 마우스", 17000), (2, "로지텍 MX Master 3S", 52000)],
+    )
+    store.add_snapshot("키보드", [30000], taken_at=150)
+
+    found = store.search_products("로지텍", max_price=30000)
+    print(f"검색 결과: {found}")
+    assert [(p["product_id"], p["price"], p["taken_at"]) for p in found] == [(1, 17000, 200)]
+
+    assert [p["product_id"] for p in store.search_products("로지텍")] == [1, 2]
+    assert store.search_products("로지텍")[1]["price"] == 52000
+    assert [p["product_id"] for p in store.search_products("무선 마우스")] == [1, 3]
+    assert [p["product_id"] for p in store.search_products("mx master", min_price=50000)] == [2]
+    assert store.search_products("로지텍 키보드") == []
+    assert store.search_products("  ") == []
+
+
+def test_snapshot_diffs(tmp_path):
+    """저장 시 기록한 이웃 스냅샷 차이, 임의 두 스냅샷 비교, 타임라인 테스트"""
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    first = store.add_snapshot("마우스", [10000, 20000, 30000], taken_at=100)
+    third = store.add_snapshot("마우스", [15000, 20000, 40000], taken_at=300)
+    # 과거 시각으로 끼워 넣으면 다음 스냅샷의 차이도 갱신
+    second = store.add_snapshot("마우스", [10000, 20000, 40000], taken_at=200)
+    store.add_snapshot("키보드", [50000], taken_at=250)
+
+    latest = store.diff("마우스")
+    print(f"최근 변화: {latest}")
+    assert (latest["from"]["id"], latest["to"]["id"]) == (second, third)
+    assert latest["added"] == [15000] and latest["removed"] == [10000]
+    assert latest["statistics"]["min"] == {"from": 10000, "to": 15000, "change": 5000}
+
+    span = store.diff("마우스", from_id=first, to_id=third)
+    assert span["added"] == [15000, 40000] and span["removed"] == [10000, 30000]
+    backwards = store.diff("마우스", start=300, end=150)
+    assert backwards["added"] == [10000, 30000] and backwards["removed"] == [15000, 40000]
+    assert store.diff("마우스", from_id=first, to_id=first)["added"] == []
+    assert store.diff("냉장고") is None
+
+    timeline = store.diff_timeline("마우스")
+    assert [(item["snapshot_id"], item["prev_id"]) for item in timeline] == [
+        (first, None),
+        (second, first),
+        (third, second),
+    ]
+    assert timeline[0]["added"] == [10000, 20000, 30000]
+    assert timeline[1]["added"] == [40000] and timeline[1]["removed"] == [30000]
+    assert timeline[2]["statistics"]["max"]["change"] == 0
+
+
+def test_diff_timeline_fills_bulk_rows(tmp_path):
+    """대량 저장으로 차이가 없는 스냅샷은 타임라인 조회 시 계산하여 저장하는지 테스트"""
+    from snapshot_store import encode_prices
+
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    store.add_snapshots_bulk(
+        [
+            ("모니터", t, 2, 150000.0 + t, 140000 + t, 160000, encode_prices([140000 + t, 160000]))
+            for t in range(3)
+        ]
+    )
+
+    timeline = store.diff_timeline("모니터", start=1)
+    assert [item["added"] for item in timeline] == [[140001], [140002]]
+    assert timeline[0]["statistics"]["min"]["change"] == 1
+    conn = store._connect()
+    assert conn.execute("SELECT COUNT(*) FROM snapshot_diffs").fetchone()[0] == 2
+
+
+def test_compare_aggregates(tmp_path):
+    """저장 시 계산한 비교용 요약(사분위수, 공통 로그 구간)과 대량 저장 스냅샷의 요약 채우기 테스트"""
+    from snapshot_store import AGGREGATE_BIN_EDGES, aggregate_prices, encode_prices
+
+    aggregate = aggregate_prices([1000, 20000, 30000, 100000000])
+    assert (aggregate["q1"], aggregate["median"]) == (15250.0, 25000.0)
+    # 범위 양 끝 가격도 첫/마지막 구간에 포함
+    assert aggregate["bins"][0] == 1 and aggregate["bins"][-1] == 1
+    assert aggregate["bins"].sum() == 4 and len(aggregate["bins"]) == len(AGGREGATE_BIN_EDGES) - 1
+
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    store.add_snapshot("마우스", [10000, 20000], taken_at=100)
+    store.add_snapshot("마우스", [12000, 22000, 32000], taken_at=200)
+    store.add_snapshots_bulk([("키보드", 150, 2, 55000.0, 50000, 60000, encode_prices([50000, 60000]))])
+
+    comparison = store.compare(["키보드", "마우스", "냉장고"])
+    print(f"비교 결과: {comparison}")
+    assert [item["keyword"] for item in comparison["keywords"]] == ["키보드", "마우스"]
+    assert comparison["missing"] == ["냉장고"]
+    mouse = comparison["keywords"][1]
+    assert mouse["statistics"]["median"] == 22000 and mouse["statistics"]["count"] == 3
+    assert int(mouse["counts"].sum()) == 3
+    # 잘라낸 구간이 모든 키워드의 가격 범위를 덮음
+    edges = comparison["edges"]
+    assert edges[0] <= 12000 and edges[-1] > 60000
+
+    # 대량 저장 스냅샷의 요약은 처음 조회할 때 저장해 둠
+    conn = store._connect()
+    assert conn.execute("SELECT COUNT(*) FROM snapshot_aggregates").fetchone()[0] == 3
+
+    # 기준 시각 이전의 스냅샷으로 비교
+    earlier = store.compare(["마우스"], at=150)
+    assert earlier["keywords"][0]["statistics"]["count"] == 2
+
+
+def test_price_rank(tmp_path):
+    """가격 백분위 계산과 새 스냅샷 반영 테스트"""
+    assert DataAnalyzer.percentile_rank([1000, 2000, 3000, 4000], 2500) == 50.0
+    assert abs(DataAnalyzer.percentile_rank([1000, 2000, 3000], 1000) - 100 / 6) < 1e-9
+    assert DataAnalyzer.percentile_rank([], 1000) is None
+
+    store = SnapshotStore(str(tmp_path / "snapshots.db"))
+    analyzer = DataAnalyzer(rank_refresh_interval=0)
+    store.add_snapshot("마우스", [10000, 20000, 30000], taken_at=100)
+    first = analyzer.price_rank(store, "마우스", 15000)
+    assert abs(first["latest"]["percentile"] - 100 / 3) < 1e-9
+    assert first["latest"]["median"] == 20000
+
+    # 새 스냅샷이 생기면 캐시를 다시 만듦
+    store.add_snapshot("마우스", [5000, 9000], taken_at=200)
+    second = analyzer.price_rank(store, "마우스", 15000)
+    print(f"순위: {second}")
+    assert second["latest"]["percentile"] == 100.0
+    assert second["window"]["count"] == 5 and second["window"]["cheaper"] == 3
+    assert analyzer.price_rank(store, "키보드", 15000) is None
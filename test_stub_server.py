@@ -0,0 +1,55 @@
+"""
+로컬 다나와 대체 서버 테스트
+PriceScraper를 대체 서버로 연결하여 네트워크 없이 크롤링 전체 과정을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks"))
+
+from danawa_stub_server import start_stub_server
+from price_engine import PriceScraper
+
+
+def test_scrape_from_stub_server():
+    """대체 서버에서 가격을 수집하고 같은 키워드는 같은 결과인지 테스트"""
+    server, url = start_stub_server(products=30)
+    try:
+        scraper = PriceScraper(base_url=url)
+        first = scraper.scrape_prices("무선마우스")
+        second = scraper.scrape_prices("무선마우스")
+        other = scraper.scrape_prices("모니터")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print(f"수집 결과: {len(first)}개, 샘플 {first[:5]}")
+    assert len(first) >= 30
+    assert first == second
+    assert first != other
+    assert server.stats["requests"] == 3
+
+
+def test_stub_server_error_injection():
+    """오류율 설정 시 크롤러가 네트워크 오류를 보고하는지 테스트"""
+    server, url = start_stub_server(error_rate=1.0)
+    try:
+        PriceScraper(base_url=url).scrape_prices("키보드")
+        raise AssertionError("오류가 발생해야 합니다")
+    except Exception as e:
+        print(f"예상된 오류: {e}")
+        assert "네트워크 오류" in str(e)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_base_url_from_environment():
+    """DANAWA_BASE_URL 환경 변수로 검색 주소를 바꿀 수 있는지 테스트"""
+    os.environ["DANAWA_BASE_URL"] = "http://127.0.0.1:9/dsearch.php"
+    try:
+        assert PriceScraper().base_url == "http://127.0.0.1:9/dsearch.php"
+    finally:
+        del os.environ["DANAWA_BASE_URL"]
+    assert PriceScraper().base_url == "http://search.danawa.com/dsearch.php"
@@ -0,0 +1,83 @@
+"""
+시작 시 예열 (Warmup)과 결과 파일 요약 색인 (ResultFileIndex) 테스트
+"""
+
+import os
+import pickle
+import time
+
+from keyword_index import KeywordIndex
+from result_files import ResultFileIndex
+from warmup import Warmup
+
+
+def test_warmup_runs_steps_and_reports_failures():
+    """단계를 순서대로 실행하고 실패한 단계가 있어도 준비 완료가 되는지 테스트"""
+    order = []
+
+    def fail():
+        order.append("fail")
+        raise RuntimeError("저장소 없음")
+
+    warmup = Warmup()
+    warmup.add_step("first", lambda: order.append("first") or 3)
+    warmup.add_step("broken", fail)
+    warmup.add_step("last", lambda: order.append("last"))
+
+    assert warmup.ready and warmup.status()["state"] == "idle"
+    assert warmup.start()
+    assert not warmup.start()
+    assert warmup.wait(5)
+
+    status = warmup.status()
+    print(f"예열 상태: {status}")
+    assert order == ["first", "fail", "last"]
+    assert status["state"] == "done" and status["ready"]
+    steps = {step["name"]: step for step in status["steps"]}
+    assert steps["first"]["items"] == 3
+    assert steps["broken"]["state"] == "failed" and steps["broken"]["error"] == "저장소 없음"
+    assert steps["last"]["state"] == "done"
+
+
+def test_result_file_index_reads_changed_files_only(tmp_path):
+    """처음 보거나 바뀐 파일만 다시 읽고, 삭제된 파일은 목록에서 빠지는지 테스트"""
+    loaded = []
+
+    def loader(filename):
+        loaded.append(os.path.basename(filename))
+        with open(filename, "rb") as f:
+            return pickle.load(f)
+
+    paths = []
+    for i, keyword in enumerate(["마우스", "키보드", "모니터"]):
+        path = tmp_path / f"result_{i}.pkl"
+        path.write_bytes(pickle.dumps({"keyword": keyword, "prices": [1000], "statistics": {"count": 1}}))
+        os.utime(path, (1_700_000_000 + i, 1_700_000_000 + i))
+        paths.append(path)
+    (tmp_path / "result_broken.pkl").write_bytes(b"not a pickle")
+
+    index = ResultFileIndex(
+        lambda name: loader(name) if "broken" not in name else None, str(tmp_path / "result_*.pkl")
+    )
+    recent = index.recent(limit=2)
+    assert [item["keyword"] for item in recent] == ["모니터", "키보드"]
+
+    loaded.clear()
+    assert [item["keyword"] for item in index.recent(limit=3)] == ["모니터", "키보드", "마우스"]
+    assert loaded == ["result_0.pkl"]  # 이미 읽은 파일은 다시 읽지 않음
+
+    loaded.clear()
+    paths[0].write_bytes(pickle.dumps({"keyword": "무선마우스", "statistics": {}}))
+    os.utime(paths[0], (time.time(), time.time()))
+    paths[2].unlink()
+    assert [item["keyword"] for item in index.recent(limit=3)] == ["무선마우스", "키보드"]
+    assert loaded == ["result_0.pkl"]
+    assert len(index) == 3  # 요약 2개 + 읽지 못한 파일 1개
+
+
+def test_keyword_index_top():
+    """스냅샷이 많은 키워드 순(같으면 최근 수집 순)으로 반환하는지 테스트"""
+    index = KeywordIndex()
+    index.add_many([("마우스", 3, 100.0), ("키보드", 5, 50.0), ("모니터", 3, 200.0), ("노트북", 1, 300.0)])
+    assert [item["keyword"] for item in index.top(3)] == ["키보드", "모니터", "마우스"]
+    assert index.top(1)[0] == {"keyword": "키보드", "snapshots": 5, "last_taken_at": 50.0}
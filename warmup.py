@@ -0,0 +1,109 @@
+"""
+시작 시 예열
+서버가 시작된 직후 백그라운드 스레드에서 색인과 캐시를 미리 채우는 단계들을 순서대로 실행하고,
+모든 단계가 끝났는지(준비 완료)를 알려 줍니다. 단계가 실패해도 나머지 단계는 계속 실행하며,
+실패는 상태에 기록만 합니다 (예열은 성능을 위한 것이므로 서비스를 막지 않음).
+
+    Warmup.start() → [history_files] → [keyword_index] → [latest_snapshots] → [aggregates] → ready
+"""
+
+import threading
+import time
+import traceback
+from typing import Callable, Dict, List, Optional
+
+
+class Warmup:
+    """이름 붙은 예열 단계를 순서대로 실행하고 진행 상태를 보관하는 스레드 안전 클래스"""
+
+    def __init__(self):
+        self._steps: List[Dict] = []
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._started_at: Optional[float] = None
+        self._finished_at: Optional[float] = None
+
+    def add_step(self, name: str, func: Callable[[], Optional[int]]):
+        """
+        예열 단계를 추가합니다 (start() 전에 호출).
+
+        Args:
+            name: 단계 이름 (상태에 표시)
+            func: 실행할 함수 (채운 항목 개수를 반환하면 상태에 기록)
+        """
+        self._steps.append(
+            {"name": name, "func": func, "state": "pending", "items": None, "elapsed_ms": None, "error": None}
+        )
+
+    @property
+    def started(self) -> bool:
+        return self._thread is not None or self._started_at is not None
+
+    @property
+    def ready(self) -> bool:
+        """모든 단계가 끝났는지 여부 (시작하지 않았으면 기다릴 예열이 없으므로 준비된 것으로 봄)"""
+        return self._done.is_set() or not self.started
+
+    def start(self) -> bool:
+        """
+        백그라운드 스레드에서 예열을 시작합니다.
+
+        Returns:
+            새로 시작했는지 여부 (이미 시작했으면 False)
+        """
+        with self._lock:
+            if self.started:
+                return False
+            self._thread = threading.Thread(target=self.run, name="warmup", daemon=True)
+        self._thread.start()
+        return True
+
+    def run(self):
+        """모든 단계를 현재 스레드에서 순서대로 실행합니다."""
+        with self._lock:
+            self._started_at = time.time()
+        for step in self._steps:
+            with self._lock:
+                step["state"] = "running"
+            start = time.perf_counter()
+            try:
+                items = step["func"]()
+            except Exception as e:
+                traceback.print_exc()
+                update = {"state": "failed", "error": str(e) or type(e).__name__}
+            else:
+                update = {"state": "done", "items": items}
+            update["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 1)
+            with self._lock:
+                step.update(update)
+        with self._lock:
+            self._finished_at = time.time()
+        self._done.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """예열이 끝날 때까지 기다립니다 (시작하지 않았으면 바로 반환). 끝났으면 True."""
+        if not self.started:
+            return True
+        return self._done.wait(timeout)
+
+    def status(self) -> Dict:
+        """
+        예열 진행 상태를 반환합니다.
+
+        Returns:
+            {"state": "idle"/"running"/"done", "ready", "elapsed_ms",
+             "steps": [{"name", "state", "items", "elapsed_ms", "error"}]}
+        """
+        with self._lock:
+            if not self.started:
+                state = "idle"
+            elif self._done.is_set():
+                state = "done"
+            else:
+                state = "running"
+            elapsed = None
+            if self._started_at is not None:
+                elapsed = round(((self._finished_at or time.time()) - self._started_at) * 1000, 1)
+            steps = [{key: value for key, value in step.items() if key != "func"} for step in self._steps]
+        return {"state": state, "ready": state != "running", "elapsed_ms": elapsed, "steps": steps}